@@ -1,6 +1,5 @@
 'use client'
 
-import { useEffect, useState } from 'react'
 import { Card, CardContent, CardDescription, CardHeader, CardTitle } from '@/components/ui/card'
 import { Button } from '@/components/ui/button'
 import { Badge } from '@/components/ui/badge'
@@ -10,85 +9,11 @@ import { MobileNavigation } from '@/components/MobileNavigation'
 import Link from 'next/link'
 import Image from 'next/image'
 
-export default function HomePage() {
-  const [games, setGames] = useState([])
-  const [articles, setArticles] = useState([])
-  const [loading, setLoading] = useState(true)
+export default function HomeClient({ initialGames = [], initialArticles = [] }) {
+  const games = initialGames
+  const articles = initialArticles
   const { t } = useLanguage()
 
-  useEffect(() => {
-    fetchHomeData()
-  }, [])
-
-  const fetchHomeData = async () => {
-    try {
-      // Try external API first, fallback to mock data if it fails
-      let gamesData, articlesData
-
-      try {
-        const gamesRes = await fetch(`/api/strapi/games?featured=true`)
-        if (gamesRes.ok) {
-          const data = await gamesRes.json()
-          gamesData = data
-        } else {
-          throw new Error('API failed')
-        }
-      } catch (error) {
-        console.warn('API failed, using fallback data')
-        // Fallback mock data
-        gamesData = {
-          data: [
-            {
-              id: 1, documentId: 'wukong-1', title: 'Wukong', 
-              description: 'Epic action RPG based on the legendary Monkey King.',
-              category: 'Action', slug: 'wukong', featured: true, downloads: 125000,
-              bannerImage: { url: 'https://images.unsplash.com/photo-1673350808686-209dc177c898?w=400&h=225&fit=crop' }
-            },
-            {
-              id: 2, documentId: 'call-me-champion-2', title: 'Call Me Champion',
-              description: 'Intense competitive fighting game.',
-              category: 'Action', slug: 'call-me-champion', featured: true, downloads: 89000,
-              bannerImage: { url: 'https://images.unsplash.com/photo-1543622748-5ee7237e8565?w=400&h=225&fit=crop' }
-            },
-            {
-              id: 3, documentId: 'civilization-3', title: 'Civilization',
-              description: 'Build and expand your empire through the ages.',
-              category: 'Strategy', slug: 'civilization', featured: true, downloads: 234000,
-              bannerImage: { url: 'https://images.unsplash.com/photo-1511512578047-dfb367046420?w=400&h=225&fit=crop' }
-            }
-          ]
-        }
-      }
-
-      try {
-        const articlesRes = await fetch(`/api/strapi/articles`)
-        if (articlesRes.ok) {
-          const data = await articlesRes.json()
-          articlesData = data
-        } else {
-          throw new Error('Articles API failed')
-        }
-      } catch (error) {
-        articlesData = { data: [] } // Empty articles for now
-      }
-
-      setGames(gamesData.data || [])
-      setArticles(articlesData.data || [])
-    } catch (error) {
-      console.error('Error fetching home data:', error)
-    } finally {
-      setLoading(false)
-    }
-  }
-
-  if (loading) {
-    return (
-      <div className="min-h-screen bg-gradient-to-br from-blue-900 via-purple-900 to-indigo-900 flex items-center justify-center">
-        <div className="text-white text-xl">{t('loading')}</div>
-      </div>
-    )
-  }
-
   return (
     <div className="min-h-screen bg-gradient-to-br from-blue-900 via-purple-900 to-indigo-900">
       {/* Header */}
@@ -12,6 +12,7 @@ import { ArrowLeft, Save } from 'lucide-react'
 import Link from 'next/link'
 import Image from 'next/image'
 import { useRouter } from 'next/navigation'
+import { GAME_CATEGORIES } from '@/lib/categories'
 
 export default function NewGamePage() {
   const router = useRouter()
@@ -25,8 +26,6 @@ export default function NewGamePage() {
     downloads: 0
   })
 
-  const categories = ['Action', 'RPG', 'Strategy', 'Adventure', 'Simulation', 'Puzzle']
-
   const handleInputChange = (field, value) => {
     setFormData(prev => ({
       ...prev,
@@ -150,7 +149,7 @@ export default function NewGamePage() {
                       <SelectValue placeholder="Select category" />
                     </SelectTrigger>
                     <SelectContent>
-                      {categories.map((category) => (
+                      {GAME_CATEGORIES.map((category) => (
                         <SelectItem key={category} value={category}>
                           {category}
                         </SelectItem>
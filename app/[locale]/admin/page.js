@@ -111,6 +111,32 @@ export default function AdminPage() {
     }
   }
 
+  // Sends only the changed field, conditional on the row we last saw
+  const handleToggleFeatured = async (game) => {
+    try {
+      const response = await fetch(`/api/admin/games/${game.id}`, {
+        method: 'PATCH',
+        headers: {
+          'Content-Type': 'application/json',
+          'Authorization': `Bearer ${token}`
+        },
+        body: JSON.stringify({ featured: !game.featured, updatedAt: game.updated_at })
+      })
+      const data = await response.json()
+
+      if (response.ok || response.status === 409) {
+        setGames(games.map(g => g.id === game.id ? data.data : g))
+      }
+      if (response.status === 409) {
+        alert('This game was changed by someone else. The latest version is now shown.')
+      } else if (!response.ok) {
+        alert('Failed to update game')
+      }
+    } catch (error) {
+      alert('Error updating game')
+    }
+  }
+
   if (loading) {
     return (
       <div className="min-h-screen bg-gradient-to-br from-blue-900 via-purple-900 to-indigo-900 flex items-center justify-center">
@@ -334,11 +360,13 @@ export default function AdminPage() {
                         {(game.downloads || 0).toLocaleString()}
                       </td>
                       <td className="py-4">
-                        {game.featured ? (
-                          <Badge className="bg-green-500/20 text-green-400">Featured</Badge>
-                        ) : (
-                          <Badge variant="outline" className="border-gray-500 text-gray-400">Regular</Badge>
-                        )}
+                        <button type="button" onClick={() => handleToggleFeatured(game)} title="Toggle featured">
+                          {game.featured ? (
+                            <Badge className="bg-green-500/20 text-green-400">Featured</Badge>
+                          ) : (
+                            <Badge variant="outline" className="border-gray-500 text-gray-400">Regular</Badge>
+                          )}
+                        </button>
                       </td>
                       <td className="py-4">
                         <div className="flex items-center space-x-2">
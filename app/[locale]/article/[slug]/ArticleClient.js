@@ -0,0 +1,273 @@
+'use client'
+
+import { Badge } from '@/components/ui/badge'
+import { Button } from '@/components/ui/button'
+import { Calendar, User, ArrowLeft, Share2, BookOpen } from 'lucide-react'
+import { useLanguage } from '@/lib/LanguageContext'
+import { LanguageSwitcher } from '@/components/LanguageSwitcher'
+import { MobileNavigation } from '@/components/MobileNavigation'
+import Link from 'next/link'
+import Image from 'next/image'
+
+export default function ArticleClient({ article }) {
+  const { t } = useLanguage()
+
+  const formatDate = (dateString) => {
+    return new Date(dateString).toLocaleDateString('en-US', {
+      year: 'numeric',
+      month: 'long',
+      day: 'numeric'
+    })
+  }
+
+  const handleShare = () => {
+    if (navigator.share && article) {
+      navigator.share({
+        title: article.title,
+        text: article.excerpt,
+        url: window.location.href,
+      })
+    } else {
+      // Fallback: copy URL to clipboard
+      navigator.clipboard.writeText(window.location.href)
+      alert('Article URL copied to clipboard!')
+    }
+  }
+
+  if (!article) {
+    return (
+      <div className="min-h-screen bg-gradient-to-br from-blue-900 via-purple-900 to-indigo-900">
+        <div className="container mx-auto px-4 py-20 text-center">
+          <h1 className="text-4xl font-bold text-white mb-4">{t('articleNotFound')}</h1>
+          <p className="text-gray-300 mb-8">{t('articleNotExist')}</p>
+          <Link href="/blog">
+            <Button>{t('backToBlog')}</Button>
+          </Link>
+        </div>
+      </div>
+    )
+  }
+
+  return (
+    <div className="min-h-screen bg-gradient-to-br from-blue-900 via-purple-900 to-indigo-900">
+      {/* Header */}
+      <header className="bg-black/20 backdrop-blur-sm border-b border-white/10">
+        <div className="container mx-auto px-4 py-4 flex items-center justify-between">
+          <Link href="/" className="flex items-center">
+            <Image 
+              src="https://ik.imagekit.io/meoh789/logo-dgp.png" 
+              alt="Game Catalog Logo" 
+              width={80} 
+              height={80} 
+              className="rounded"
+            />
+          </Link>
+          
+          <nav className="hidden md:flex items-center space-x-6">
+            <Link href="/" className="text-white hover:text-blue-300 transition-colors">{t('home')}</Link>
+            <Link href="/catalog" className="text-white hover:text-blue-300 transition-colors">{t('catalog')}</Link>
+            <Link href="/trending" className="text-white hover:text-blue-300 transition-colors">{t('trending')}</Link>
+            <Link href="/blog" className="text-blue-300 font-semibold">{t('blog')}</Link>
+          </nav>
+
+          <div className="flex items-center space-x-3">
+            <LanguageSwitcher />
+            <div className="hidden md:flex items-center space-x-3">
+              <a 
+                href="https://web.telegram.org/k/#@behemoth168?text=Halo%2C%20I%20am%20interested%20in%20this%20game%2C%20can%20i%20have%20more%20information%3F"
+                target="_blank"
+                rel="noopener noreferrer"
+                className="bg-blue-500 hover:bg-blue-600 text-white px-3 py-2 rounded-lg text-sm transition-colors"
+              >
+                Telegram
+              </a>
+              <a 
+                href="https://wa.me/62816339871?text=Halo%2C%20I%20am%20interested%20in%20this%20game%2C%20can%20i%20have%20more%20information%3F"
+                target="_blank"
+                rel="noopener noreferrer"
+                className="bg-green-500 hover:bg-green-600 text-white px-3 py-2 rounded-lg text-sm transition-colors"
+              >
+                WhatsApp
+              </a>
+            </div>
+            <MobileNavigation />
+          </div>
+        </div>
+      </header>
+
+      {/* Article Content */}
+      <div className="container mx-auto px-4 py-8">
+        {/* Back Button */}
+        <Link href="/blog" className="inline-flex items-center text-gray-300 hover:text-white mb-6">
+          <ArrowLeft className="w-4 h-4 mr-2" />
+          {t('backToBlog')}
+        </Link>
+
+        <article className="max-w-4xl mx-auto">
+          {/* Article Header */}
+          <header className="mb-8">
+            {article.featuredImage?.url && (
+              <div className="aspect-video rounded-lg overflow-hidden mb-6">
+                <Image
+                  src={article.featuredImage.url}
+                  alt={article.title}
+                  width={800}
+                  height={450}
+                  className="w-full h-full object-cover"
+                />
+              </div>
+            )}
+            
+            <div className="flex items-center gap-2 mb-4">
+              <Badge variant="secondary" className="bg-purple-500/20 text-purple-300 border-purple-500/30">
+                {article.category}
+              </Badge>
+              {article.tags?.map((tag, index) => (
+                <span
+                  key={index}
+                  className="inline-block bg-gray-700/50 text-gray-300 text-xs px-2 py-1 rounded"
+                >
+                  #{tag}
+                </span>
+              ))}
+            </div>
+
+            <h1 className="text-4xl md:text-5xl font-bold text-white mb-4 leading-tight">
+              {article.title}
+            </h1>
+
+            <p className="text-xl text-gray-300 mb-6 leading-relaxed">
+              {article.excerpt}
+            </p>
+
+            {/* Article Meta */}
+            <div className="flex items-center justify-between mb-8 p-6 bg-white/5 rounded-lg">
+              <div className="flex items-center text-gray-300 space-x-6">
+                <div className="flex items-center">
+                  <User className="w-4 h-4 mr-2" />
+                  {article.author}
+                </div>
+                <div className="flex items-center">
+                  <Calendar className="w-4 h-4 mr-2" />
+                  {formatDate(article.publishedDate)}
+                </div>
+                {article.readMinutes && (
+                  <div className="flex items-center">
+                    <BookOpen className="w-4 h-4 mr-2" />
+                    {article.readMinutes} {t('minRead')}
+                  </div>
+                )}
+              </div>
+              
+              <Button 
+                onClick={handleShare}
+                variant="outline" 
+                size="sm" 
+                className="border-white/20 text-white hover:bg-white/10"
+              >
+                <Share2 className="w-4 h-4 mr-2" />
+                {t('share')}
+              </Button>
+            </div>
+          </header>
+
+          {/* Article Content */}
+          <div className="prose prose-lg prose-invert max-w-none">
+            <div className="bg-white/10 rounded-lg p-8">
+              {/* Rendered by the CMS at publish time, author text escaped */}
+              <div
+                className="text-gray-100 leading-relaxed"
+                dangerouslySetInnerHTML={{ __html: article.contentHtml }}
+              />
+            </div>
+          </div>
+
+          {/* Article Footer */}
+          <footer className="mt-12 pt-8 border-t border-white/20">
+            <div className="flex items-center justify-between">
+              <div>
+                <h3 className="text-white font-semibold mb-2">{t('shareArticle')}</h3>
+                <p className="text-gray-400 text-sm">{t('helpOthers')}</p>
+              </div>
+              <Button 
+                onClick={handleShare}
+                className="bg-purple-600 hover:bg-purple-700"
+              >
+                <Share2 className="w-4 h-4 mr-2" />
+                {t('shareArticle')}
+              </Button>
+            </div>
+          </footer>
+        </article>
+      </div>
+
+      {/* Footer */}
+      <footer className="bg-black/40 backdrop-blur-sm border-t border-white/10 py-12 px-4 mt-16">
+        <div className="container mx-auto">
+          <div className="grid grid-cols-1 md:grid-cols-4 gap-8">
+            <div>
+              <div className="flex items-center space-x-3 mb-4">
+                <Image 
+                  src="https://ik.imagekit.io/meoh789/logo-dgp.png" 
+                  alt="GameVault Logo" 
+                  width={40} 
+                  height={40} 
+                  className="rounded"
+                />
+              </div>
+              <p className="text-gray-400 mb-4">
+                {t('ultimateDestination')}
+              </p>
+            </div>
+            
+            <div>
+              <h3 className="text-white font-semibold mb-4">{t('navigation')}</h3>
+              <div className="space-y-2">
+                <Link href="/" className="block text-gray-400 hover:text-white transition-colors">{t('home')}</Link>
+                <Link href="/catalog" className="block text-gray-400 hover:text-white transition-colors">{t('catalog')}</Link>
+                <Link href="/trending" className="block text-gray-400 hover:text-white transition-colors">{t('trending')}</Link>
+                <Link href="/blog" className="block text-gray-400 hover:text-white transition-colors">{t('blog')}</Link>
+              </div>
+            </div>
+            
+            <div>
+              <h3 className="text-white font-semibold mb-4">{t('contact')}</h3>
+              <div className="space-y-2">
+                <a 
+                  href="https://web.telegram.org/k/#@behemoth168?text=Halo%2C%20I%20am%20interested%20in%20this%20game%2C%20can%20i%20have%20more%20information%3F"
+                  target="_blank"
+                  rel="noopener noreferrer"
+                  className="block text-gray-400 hover:text-blue-400 transition-colors"
+                >
+                  Telegram
+                </a>
+                <a 
+                  href="https://wa.me/62816339871?text=Halo%2C%20I%20am%20interested%20in%20this%20game%2C%20can%20i%20have%20more%20information%3F"
+                  target="_blank"
+                  rel="noopener noreferrer"
+                  className="block text-gray-400 hover:text-green-400 transition-colors"
+                >
+                  WhatsApp
+                </a>
+              </div>
+            </div>
+            
+            <div>
+              <h3 className="text-white font-semibold mb-4">{t('legal')}</h3>
+              <div className="space-y-2">
+                <Link href="/privacy" className="block text-gray-400 hover:text-white transition-colors">{t('privacyPolicy')}</Link>
+                <Link href="/terms" className="block text-gray-400 hover:text-white transition-colors">{t('termsOfService')}</Link>
+              </div>
+            </div>
+          </div>
+          
+          <div className="border-t border-white/10 mt-8 pt-8 text-center">
+            <p className="text-gray-400">
+              © 2025 GameVault. {t('allRightsReserved')}
+            </p>
+          </div>
+        </div>
+      </footer>
+    </div>
+  )
+}
\ No newline at end of file
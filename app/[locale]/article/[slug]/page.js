@@ -0,0 +1,13 @@
+import { loadArticle, loadArticleSlugs } from '@/lib/articles'
+import ArticleClient from './ArticleClient'
+
+// Regenerated at most once an hour; CMS publishes revalidate on demand
+export const revalidate = 3600
+
+export async function generateStaticParams() {
+  return (await loadArticleSlugs()).map(slug => ({ slug }))
+}
+
+export default async function ArticleDetailPage({ params }) {
+  return <ArticleClient article={await loadArticle(params.slug)} />
+}
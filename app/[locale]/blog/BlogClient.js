@@ -1,6 +1,5 @@
 'use client'
 
-import { useEffect, useState } from 'react'
 import { Card, CardContent, CardDescription, CardHeader, CardTitle } from '@/components/ui/card'
 import { Button } from '@/components/ui/button'
 import { Badge } from '@/components/ui/badge'
@@ -11,107 +10,9 @@ import { MobileNavigation } from '@/components/MobileNavigation'
 import Link from 'next/link'
 import Image from 'next/image'
 
-export default function BlogPage() {
-  const [articles, setArticles] = useState([])
-  const [loading, setLoading] = useState(true)
+export default function BlogClient({ articles = [] }) {
   const { t } = useLanguage()
 
-  useEffect(() => {
-    fetchArticles()
-  }, [])
-
-  const fetchArticles = async () => {
-    try {
-      // Mock blog articles
-      const blogArticles = [
-        {
-          id: 1,
-          documentId: 'gaming-trends-2025',
-          title: 'Top Gaming Trends to Watch in 2025',
-          excerpt: 'Discover the latest trends shaping the gaming industry this year, from AI-powered NPCs to immersive virtual worlds that are changing how we play.',
-          slug: 'gaming-trends-2025',
-          publishedDate: '2025-01-15T10:00:00Z',
-          author: 'GameVault Team',
-          readTime: '5 min read',
-          featuredImage: { url: 'https://images.unsplash.com/photo-1511512578047-dfb367046420?w=400&h=225&fit=crop' },
-          tags: ['Trends', 'Gaming', '2025'],
-          category: 'Industry News'
-        },
-        {
-          id: 2,
-          documentId: 'mobile-gaming-revolution',
-          title: 'The Mobile Gaming Revolution: How Smartphones Changed Everything',
-          excerpt: 'Explore how mobile gaming has transformed from simple puzzles to complex AAA experiences, and what this means for the future of gaming.',
-          slug: 'mobile-gaming-revolution',
-          publishedDate: '2025-01-12T14:30:00Z',
-          author: 'Sarah Chen',
-          readTime: '7 min read',
-          featuredImage: { url: 'https://images.unsplash.com/photo-1542751371-adc38448a05e?w=400&h=225&fit=crop' },
-          tags: ['Mobile', 'Gaming', 'Technology'],
-          category: 'Technology'
-        },
-        {
-          id: 3,
-          documentId: 'strategy-games-guide',
-          title: 'Mastering Strategy Games: A Beginner\'s Guide',
-          excerpt: 'New to strategy games? Learn the fundamentals and discover which games are perfect for beginners looking to dive into the strategic gaming world.',
-          slug: 'strategy-games-guide',
-          publishedDate: '2025-01-10T09:15:00Z',
-          author: 'Mike Rodriguez',
-          readTime: '10 min read',
-          featuredImage: { url: 'https://images.unsplash.com/photo-1673350808686-209dc177c898?w=400&h=225&fit=crop' },
-          tags: ['Strategy', 'Guide', 'Beginner'],
-          category: 'Gaming Guide'
-        },
-        {
-          id: 4,
-          documentId: 'action-rpg-evolution',
-          title: 'The Evolution of Action RPGs: From Classic to Modern',
-          excerpt: 'Trace the journey of Action RPGs from their humble beginnings to today\'s spectacular adventures that combine fast-paced action with deep storytelling.',
-          slug: 'action-rpg-evolution',
-          publishedDate: '2025-01-08T16:45:00Z',
-          author: 'Alex Kim',
-          readTime: '8 min read',
-          featuredImage: { url: 'https://images.unsplash.com/photo-1593305841991-05c297ba4575?w=400&h=225&fit=crop' },
-          tags: ['RPG', 'Action', 'History'],
-          category: 'Game History'
-        },
-        {
-          id: 5,
-          documentId: 'indie-games-spotlight',
-          title: 'Indie Games Spotlight: Hidden Gems You Should Play',
-          excerpt: 'Discover amazing independent games that are pushing creative boundaries and delivering unique gaming experiences you won\'t find anywhere else.',
-          slug: 'indie-games-spotlight',
-          publishedDate: '2025-01-05T11:20:00Z',
-          author: 'Emma Watson',
-          readTime: '6 min read',
-          featuredImage: { url: 'https://images.unsplash.com/photo-1543622748-5ee7237e8565?w=400&h=225&fit=crop' },
-          tags: ['Indie', 'Spotlight', 'Reviews'],
-          category: 'Game Reviews'
-        },
-        {
-          id: 6,
-          documentId: 'gaming-community-building',
-          title: 'Building Gaming Communities: The Social Side of Games',
-          excerpt: 'Learn how modern games are fostering communities and creating lasting friendships through shared gaming experiences and social features.',
-          slug: 'gaming-community-building',
-          publishedDate: '2025-01-03T13:10:00Z',
-          author: 'GameVault Team',
-          readTime: '9 min read',
-          featuredImage: { url: 'https://images.unsplash.com/photo-1511512578047-dfb367046420?w=400&h=225&fit=crop' },
-          tags: ['Community', 'Social', 'Gaming'],
-          category: 'Community'
-        }
-      ]
-
-      setArticles(blogArticles)
-    } catch (error) {
-      console.error('Error fetching articles:', error)
-    } finally {
-      setLoading(false)
-    }
-  }
-
   const formatDate = (dateString) => {
     return new Date(dateString).toLocaleDateString('en-US', {
       year: 'numeric',
@@ -120,14 +21,6 @@ export default function BlogPage() {
     })
   }
 
-  if (loading) {
-    return (
-      <div className="min-h-screen bg-gradient-to-br from-blue-900 via-purple-900 to-indigo-900 flex items-center justify-center">
-        <div className="text-white text-xl">Loading articles...</div>
-      </div>
-    )
-  }
-
   return (
     <div className="min-h-screen bg-gradient-to-br from-blue-900 via-purple-900 to-indigo-900">
       {/* Header */}
@@ -232,9 +125,11 @@ export default function BlogPage() {
                       <Calendar className="w-3 h-3 mr-1" />
                       {formatDate(article.publishedDate)}
                     </div>
-                    <div>
-                      {article.readTime}
-                    </div>
+                    {article.readMinutes && (
+                      <div>
+                        {article.readMinutes} {t('minRead')}
+                      </div>
+                    )}
                   </div>
 
                   {/* Tags */}
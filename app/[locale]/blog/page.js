@@ -0,0 +1,9 @@
+import { loadArticles } from '@/lib/articles'
+import BlogClient from './BlogClient'
+
+// Regenerated at most once an hour; CMS publishes revalidate on demand
+export const revalidate = 3600
+
+export default async function BlogPage() {
+  return <BlogClient articles={await loadArticles()} />
+}
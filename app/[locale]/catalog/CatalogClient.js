@@ -1,12 +1,13 @@
 'use client'
 
-import { useEffect, useState } from 'react'
+import { useEffect, useRef, useState } from 'react'
 import { Card, CardContent, CardDescription, CardHeader, CardTitle } from '@/components/ui/card'
 import { Button } from '@/components/ui/button'
 import { Badge } from '@/components/ui/badge'
 import { Input } from '@/components/ui/input'
 import { Select, SelectContent, SelectItem, SelectTrigger, SelectValue } from '@/components/ui/select'
 import { useLanguage } from '@/lib/LanguageContext'
+import { GAME_CATEGORIES } from '@/lib/categories'
 import { LanguageSwitcher } from '@/components/LanguageSwitcher'
 import { MobileNavigation } from '@/components/MobileNavigation'
 import Link from 'next/link'
@@ -14,28 +15,180 @@ import Image from 'next/image'
 
 const STRAPI_URL = process.env.NEXT_PUBLIC_BASE_URL
 
-export default function CatalogPage() {
-  const [games, setGames] = useState([])
-  const [loading, setLoading] = useState(true)
+// Fields the cards actually render
+const CARD_FIELDS = 'id,documentId,title,description,category,slug,downloads,bannerImage'
+
+const SEARCH_DEBOUNCE_MS = 300
+const SUGGEST_DEBOUNCE_MS = 150
+const QUERY_CACHE_SIZE = 50
+
+// First page of results per (search, category), kept across visits to the
+// page so going back to an earlier query needs no request at all
+const queryCache = new Map()
+
+function remember(cache, key, value) {
+  cache.delete(key)
+  cache.set(key, value)
+  if (cache.size > QUERY_CACHE_SIZE) {
+    cache.delete(cache.keys().next().value)
+  }
+}
+
+function rememberQuery(key, value) {
+  remember(queryCache, key, value)
+}
+
+// Category counts per search text, same lifetime as queryCache
+const facetCache = new Map()
+
+export default function CatalogClient({ initialGames = [], initialCursor = null, initialFacets = null, pageSize = 24 }) {
+  const [games, setGames] = useState(initialGames)
+  const [loading, setLoading] = useState(initialGames.length === 0)
+  const [loadingMore, setLoadingMore] = useState(false)
+  const [nextCursor, setNextCursor] = useState(initialCursor)
   const [searchQuery, setSearchQuery] = useState('')
+  const [debouncedSearch, setDebouncedSearch] = useState('')
   const [categoryFilter, setCategoryFilter] = useState('')
+  const [suggestions, setSuggestions] = useState([])
+  const [searchFocused, setSearchFocused] = useState(false)
+  // { search, data, meta } for the search text the counts belong to
+  const [facetState, setFacetState] = useState(initialFacets && { search: '', ...initialFacets })
+  const gamesRequest = useRef(null)
+  const suggestRequest = useRef(null)
+  const facetsRequest = useRef(null)
   const { t } = useLanguage()
 
-  const categories = ['Action', 'RPG', 'Strategy', 'Adventure', 'Simulation', 'Puzzle']
+  // The server-rendered first page answers the unfiltered query, and is
+  // newer than whatever an earlier visit left in the cache
+  const seeded = useRef(false)
+  if (!seeded.current) {
+    seeded.current = true
+    if (initialGames.length > 0) {
+      rememberQuery(JSON.stringify(['', '']), { games: initialGames, nextCursor: initialCursor })
+    }
+    if (initialFacets) {
+      remember(facetCache, '', initialFacets)
+    }
+  }
+
+  // Counts for the category filter, and the total for the current query;
+  // counts for an earlier search are not shown while new ones load
+  const facets = facetState?.search === debouncedSearch.toLowerCase() ? facetState : null
+  const countOf = (category) => facets?.data.find(facet => facet.category === category)?.count
+  const resultCount = !facets ? games.length
+    : categoryFilter && categoryFilter !== 'all' ? (countOf(categoryFilter) ?? games.length)
+    : facets.meta.total
+
+  // Only query once typing pauses
+  useEffect(() => {
+    const timer = setTimeout(() => setDebouncedSearch(searchQuery.trim()), SEARCH_DEBOUNCE_MS)
+    return () => clearTimeout(timer)
+  }, [searchQuery])
 
   useEffect(() => {
     fetchGames()
-  }, [searchQuery, categoryFilter])
+  }, [debouncedSearch, categoryFilter])
+
+  useEffect(() => {
+    fetchFacets()
+  }, [debouncedSearch])
+
+  useEffect(() => {
+    const query = searchQuery.trim()
+    if (query.length < 2) {
+      suggestRequest.current?.abort()
+      setSuggestions([])
+      return
+    }
+    const timer = setTimeout(() => fetchSuggestions(query), SUGGEST_DEBOUNCE_MS)
+    return () => clearTimeout(timer)
+  }, [searchQuery])
+
+  // Cancel anything still in flight when leaving the page
+  useEffect(() => () => {
+    gamesRequest.current?.abort()
+    suggestRequest.current?.abort()
+    facetsRequest.current?.abort()
+  }, [])
+
+  const fetchFacets = async () => {
+    const search = debouncedSearch
+    const cacheKey = search.toLowerCase()
+    facetsRequest.current?.abort()
+    if (facetCache.has(cacheKey)) {
+      setFacetState({ search: cacheKey, ...facetCache.get(cacheKey) })
+      return
+    }
+
+    const controller = new AbortController()
+    facetsRequest.current = controller
+    try {
+      const query = search ? `?${new URLSearchParams({ search })}` : ''
+      const response = await fetch(`/api/facets/categories${query}`, { signal: controller.signal })
+      if (response.ok) {
+        const data = await response.json()
+        remember(facetCache, cacheKey, data)
+        setFacetState({ search: cacheKey, ...data })
+      }
+    } catch (error) {
+      if (error.name !== 'AbortError') {
+        setFacetState(null)
+      }
+    }
+  }
+
+  const fetchSuggestions = async (query) => {
+    suggestRequest.current?.abort()
+    const controller = new AbortController()
+    suggestRequest.current = controller
+
+    try {
+      const response = await fetch(`/api/search/suggest?${new URLSearchParams({ q: query })}`, {
+        signal: controller.signal
+      })
+      if (response.ok) {
+        const data = await response.json()
+        setSuggestions(data.data || [])
+      }
+    } catch (error) {
+      if (error.name !== 'AbortError') {
+        setSuggestions([])
+      }
+    }
+  }
+
+  const fetchGames = async (cursor = null) => {
+    const search = debouncedSearch
+    const cacheKey = JSON.stringify([search.toLowerCase(), categoryFilter])
+
+    if (!cursor && queryCache.has(cacheKey)) {
+      gamesRequest.current?.abort()
+      const cached = queryCache.get(cacheKey)
+      setGames(cached.games)
+      setNextCursor(cached.nextCursor)
+      setLoading(false)
+      return
+    }
+
+    // A newer query supersedes whatever is still loading
+    gamesRequest.current?.abort()
+    const controller = new AbortController()
+    gamesRequest.current = controller
+    if (!cursor) {
+      setLoading(true)
+    }
 
-  const fetchGames = async () => {
     try {
       let url = `/api/strapi/games`
       
-      const params = new URLSearchParams()
+      const params = new URLSearchParams({ limit: String(pageSize), fields: CARD_FIELDS })
+      if (cursor) {
+        params.append('cursor', cursor)
+      }
       
       // Add search filter
-      if (searchQuery.trim()) {
-        params.append('search', searchQuery.trim())
+      if (search) {
+        params.append('search', search)
       }
       
       // Add category filter
@@ -43,82 +196,38 @@ export default function CatalogPage() {
         params.append('category', categoryFilter)
       }
 
-      if (params.toString()) {
-        url += `?${params.toString()}`
-      }
+      url += `?${params.toString()}`
 
-      let games = []
-      
-      try {
-        const response = await fetch(url)
-        if (response.ok) {
-          const data = await response.json()
-          games = data.data || []
-        } else {
-          throw new Error('API failed')
-        }
-      } catch (error) {
-        console.warn('API failed, using fallback data')
-        // Extended fallback mock data
-        const allGames = [
-          {
-            id: 1, documentId: 'wukong-1', title: 'Wukong', 
-            description: 'Epic action RPG based on the legendary Monkey King. Experience breathtaking combat and explore a mystical world filled with ancient legends and powerful enemies.',
-            category: 'Action', slug: 'wukong', featured: true, downloads: 125000,
-            bannerImage: { url: 'https://images.unsplash.com/photo-1673350808686-209dc177c898?w=400&h=225&fit=crop' }
-          },
-          {
-            id: 2, documentId: 'call-me-champion-2', title: 'Call Me Champion',
-            description: 'Intense competitive fighting game where you battle to become the ultimate champion. Master various fighting styles and defeat opponents in epic tournaments.',
-            category: 'Action', slug: 'call-me-champion', featured: true, downloads: 89000,
-            bannerImage: { url: 'https://images.unsplash.com/photo-1543622748-5ee7237e8565?w=400&h=225&fit=crop' }
-          },
-          {
-            id: 3, documentId: 'dragonball-showdown-3', title: 'Dragonball Showdown',
-            description: 'High-energy fighting game featuring your favorite Dragon Ball characters. Unleash devastating attacks and experience the ultimate anime fighting experience.',
-            category: 'Action', slug: 'dragonball-showdown', featured: true, downloads: 156000,
-            bannerImage: { url: 'https://images.unsplash.com/photo-1593305841991-05c297ba4575?w=400&h=225&fit=crop' }
-          },
-          {
-            id: 4, documentId: 'civilization-4', title: 'Civilization',
-            description: 'Build and expand your empire through the ages. Develop technologies, wage wars, and lead your civilization to greatness in this epic strategy game.',
-            category: 'Strategy', slug: 'civilization', featured: true, downloads: 234000,
-            bannerImage: { url: 'https://images.unsplash.com/photo-1511512578047-dfb367046420?w=400&h=225&fit=crop' }
-          },
-          {
-            id: 5, documentId: 'clash-of-clans-5', title: 'Clash of Clans',
-            description: 'The classic strategy game where you build your village, train troops, and battle other players. Join clans and participate in epic clan wars.',
-            category: 'Strategy', slug: 'clash-of-clans', featured: true, downloads: 456000,
-            bannerImage: { url: 'https://images.unsplash.com/photo-1542751371-adc38448a05e?w=400&h=225&fit=crop' }
-          },
-          {
-            id: 6, documentId: 'jiang-hu-6', title: 'Jiang Hu',
-            description: 'Immersive martial arts RPG set in ancient China. Master kung fu techniques, explore vast landscapes, and forge your legend in the world of martial arts.',
-            category: 'RPG', slug: 'jiang-hu', featured: false, downloads: 67000,
-            bannerImage: null
-          }
-        ]
-
-        // Apply client-side filtering as fallback
-        games = allGames
-        if (searchQuery.trim()) {
-          games = games.filter(game => 
-            game.title.toLowerCase().includes(searchQuery.toLowerCase())
-          )
-        }
-        if (categoryFilter && categoryFilter !== 'all') {
-          games = games.filter(game => game.category === categoryFilter)
-        }
+      const response = await fetch(url, { signal: controller.signal })
+      if (!response.ok) {
+        throw new Error(`Games request failed: ${response.status}`)
+      }
+      const data = await response.json()
+      const games = data.data || []
+      const pageCursor = data.meta?.pagination?.nextCursor || null
+      if (!cursor) {
+        rememberQuery(cacheKey, { games, nextCursor: pageCursor })
       }
 
-      setGames(games)
+      setGames(previous => cursor ? [...previous, ...games] : games)
+      setNextCursor(pageCursor)
     } catch (error) {
+      if (error.name === 'AbortError') return
       console.error('Error fetching games:', error)
     } finally {
-      setLoading(false)
+      if (gamesRequest.current === controller) {
+        setLoading(false)
+        setLoadingMore(false)
+      }
     }
   }
 
+  const loadMore = () => {
+    if (!nextCursor || loadingMore) return
+    setLoadingMore(true)
+    fetchGames(nextCursor)
+  }
+
   return (
     <div className="min-h-screen bg-gradient-to-br from-blue-900 via-purple-900 to-indigo-900">
       {/* Header */}
@@ -177,14 +286,32 @@ export default function CatalogPage() {
           {/* Search and Filters */}
           <div className="max-w-4xl mx-auto">
             <div className="flex flex-col md:flex-row gap-4 mb-8">
-              <div className="flex-1">
+              <div className="flex-1 relative">
                 <Input
                   type="text"
                   placeholder={t('searchPlaceholder')}
                   value={searchQuery}
                   onChange={(e) => setSearchQuery(e.target.value)}
+                  onFocus={() => setSearchFocused(true)}
+                  onBlur={() => setSearchFocused(false)}
                   className="bg-white/10 border-white/20 text-white placeholder:text-gray-400 h-12"
                 />
+                {searchFocused && suggestions.length > 0 && (
+                  <div
+                    className="absolute z-10 mt-1 w-full rounded-md border border-white/20 bg-gray-900/95 backdrop-blur-sm shadow-lg overflow-hidden"
+                    onMouseDown={(e) => e.preventDefault()}
+                  >
+                    {suggestions.map((suggestion) => (
+                      <Link
+                        key={suggestion.slug}
+                        href={`/game/${suggestion.slug}`}
+                        className="block px-4 py-2 text-white hover:bg-white/10 transition-colors"
+                      >
+                        {suggestion.title}
+                      </Link>
+                    ))}
+                  </div>
+                )}
               </div>
               <div className="w-full md:w-48">
                 <Select value={categoryFilter} onValueChange={setCategoryFilter}>
@@ -192,10 +319,12 @@ export default function CatalogPage() {
                     <SelectValue placeholder={t('filterByCategory')} />
                   </SelectTrigger>
                   <SelectContent>
-                    <SelectItem value="all">{t('allCategories')}</SelectItem>
-                    {categories.map((category) => (
+                    <SelectItem value="all">
+                      {t('allCategories')}{facets && ` (${facets.meta.total})`}
+                    </SelectItem>
+                    {GAME_CATEGORIES.map((category) => (
                       <SelectItem key={category} value={category}>
-                        {t(category)}
+                        {t(category)}{countOf(category) !== undefined && ` (${countOf(category)})`}
                       </SelectItem>
                     ))}
                   </SelectContent>
@@ -206,8 +335,8 @@ export default function CatalogPage() {
             {/* Results Info */}
             <div className="text-center mb-8">
               <p className="text-gray-300">
-                {loading ? t('loading') : `${t('foundGames')} ${games.length} ${t('games')}`}
-                {searchQuery && ` ${t('forQuery')} "${searchQuery}"`}
+                {loading ? t('loading') : `${t('foundGames')} ${resultCount} ${t('games')}`}
+                {debouncedSearch && ` ${t('forQuery')} "${debouncedSearch}"`}
                 {categoryFilter && categoryFilter !== 'all' && ` ${t('inCategory')} ${t(categoryFilter)}`}
               </p>
             </div>
@@ -271,6 +400,19 @@ export default function CatalogPage() {
               ))}
             </div>
           )}
+
+          {!loading && nextCursor && (
+            <div className="text-center mt-10">
+              <Button
+                onClick={loadMore}
+                disabled={loadingMore}
+                variant="outline"
+                className="border-blue-500/30 text-yellow-400 hover:bg-blue-500/20 font-semibold"
+              >
+                {loadingMore ? t('loading') : t('loadMore')}
+              </Button>
+            </div>
+          )}
         </div>
       </section>
 
@@ -0,0 +1,19 @@
+import { loadCatalogPage, loadCategoryFacets } from '@/lib/catalog'
+import CatalogClient from './CatalogClient'
+
+const PAGE_SIZE = 24
+
+// Regenerated at most every 5 minutes; admin writes revalidate on demand
+export const revalidate = 300
+
+export default async function CatalogPage() {
+  const [{ games, nextCursor }, facets] = await Promise.all([loadCatalogPage(PAGE_SIZE), loadCategoryFacets()])
+  return (
+    <CatalogClient
+      initialGames={games}
+      initialCursor={nextCursor}
+      initialFacets={facets}
+      pageSize={PAGE_SIZE}
+    />
+  )
+}
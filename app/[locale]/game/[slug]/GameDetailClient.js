@@ -1,7 +1,5 @@
 'use client'
 
-import { useEffect, useState } from 'react'
-import { useParams } from 'next/navigation'
 import { Card, CardContent, CardDescription, CardHeader, CardTitle } from '@/components/ui/card'
 import { Button } from '@/components/ui/button'
 import { Badge } from '@/components/ui/badge'
@@ -11,100 +9,14 @@ import { LanguageSwitcher } from '@/components/LanguageSwitcher'
 import { MobileNavigation } from '@/components/MobileNavigation'
 import Link from 'next/link'
 import Image from 'next/image'
+import { startDownload } from '@/lib/utils'
 
-export default function GameDetailPage() {
-  const params = useParams()
-  const [game, setGame] = useState(null)
-  const [loading, setLoading] = useState(true)
+export default function GameDetailClient({ game }) {
   const { t } = useLanguage()
 
-  useEffect(() => {
-    if (params.slug) {
-      fetchGameDetails(params.slug)
-    }
-  }, [params.slug])
-
-  const fetchGameDetails = async (slug) => {
-    try {
-      // Mock game details data
-      const gameData = {
-        'wukong': {
-          id: 1, documentId: 'wukong-1', title: 'Wukong', 
-          description: 'Epic action RPG based on the legendary Monkey King. Experience breathtaking combat and explore a mystical world filled with ancient legends and powerful enemies.',
-          fullDescription: 'Embark on an epic journey as the legendary Monkey King in this stunning action RPG. With incredible combat mechanics, breathtaking visuals, and a rich storyline rooted in Chinese mythology, Wukong delivers an unforgettable gaming experience.\n\nFeatures:\n• Fluid combat system with 72 transformations\n• Stunning visuals powered by Unreal Engine\n• Epic boss battles against mythical creatures\n• Rich storytelling based on Journey to the West\n• Customizable abilities and weapons\n• Immersive world exploration',
-          category: 'Action', slug: 'wukong', featured: true, downloads: 125000,
-          downloadUrl: 'https://goc-cdn.qqby.cn/tg/HihTT_2.6.5.zip',
-          bannerImage: { url: 'https://images.unsplash.com/photo-1673350808686-209dc177c898?w=800&h=450&fit=crop' },
-          screenshots: [
-            { url: 'https://images.unsplash.com/photo-1511512578047-dfb367046420?w=600&h=338&fit=crop' },
-            { url: 'https://images.unsplash.com/photo-1542751371-adc38448a05e?w=600&h=338&fit=crop' },
-            { url: 'https://images.unsplash.com/photo-1593305841991-05c297ba4575?w=600&h=338&fit=crop' }
-          ],
-          rating: 4.8,
-          reviews: 892,
-          fileSize: '2.6 GB',
-          version: '2.6.5',
-          developer: 'Game Science Studio',
-          releaseDate: '2024-08-20',
-          requirements: 'Android 8.0+ / iOS 12.0+',
-          languages: ['English', 'Chinese', 'Japanese', 'Korean']
-        },
-        'call-me-champion': {
-          id: 2, documentId: 'call-me-champion-2', title: 'Call Me Champion',
-          description: 'Intense competitive fighting game where you battle to become the ultimate champion.',
-          fullDescription: 'Step into the arena and prove yourself in this intense fighting game. With precise controls, diverse fighters, and competitive gameplay, Call Me Champion offers the ultimate fighting experience for mobile devices.\n\nFeatures:\n• 20+ unique fighters with distinct abilities\n• Competitive ranked matches\n• Story mode with epic battles\n• Customizable combos and special moves\n• Online tournaments and events\n• Regular updates with new fighters',
-          category: 'Action', slug: 'call-me-champion', featured: true, downloads: 89000,
-          downloadUrl: 'https://goc-cdn.qqby.cn/jwgj/ChampionTK_2.2.2.zip',
-          bannerImage: { url: 'https://images.unsplash.com/photo-1543622748-5ee7237e8565?w=800&h=450&fit=crop' },
-          screenshots: [
-            { url: 'https://images.unsplash.com/photo-1673350808686-209dc177c898?w=600&h=338&fit=crop' },
-            { url: 'https://images.unsplash.com/photo-1542751371-adc38448a05e?w=600&h=338&fit=crop' }
-          ],
-          rating: 4.5,
-          reviews: 654,
-          fileSize: '1.8 GB',
-          version: '2.2.2',
-          developer: 'Fighting Studio',
-          releaseDate: '2024-07-15',
-          requirements: 'Android 7.0+ / iOS 11.0+',
-          languages: ['English', 'Spanish', 'Portuguese']
-        },
-        'civilization': {
-          id: 4, documentId: 'civilization-4', title: 'Civilization',
-          description: 'Build and expand your empire through the ages.',
-          fullDescription: 'Lead your civilization from ancient times to the modern era in this epic strategy game. Build cities, research technologies, wage wars, and make alliances as you compete to build the greatest civilization in history.\n\nFeatures:\n• Deep strategic gameplay\n• Multiple victory conditions\n• Historical leaders and civilizations\n• Technology tree spanning millennia\n• Diplomatic system\n• World wonders and great people',
-          category: 'Strategy', slug: 'civilization', featured: true, downloads: 234000,
-          downloadUrl: 'https://goc-cdn.qqby.cn/wm/Civilization_tk_1.5.9.zip',
-          bannerImage: { url: 'https://images.unsplash.com/photo-1511512578047-dfb367046420?w=800&h=450&fit=crop' },
-          screenshots: [
-            { url: 'https://images.unsplash.com/photo-1593305841991-05c297ba4575?w=600&h=338&fit=crop' },
-            { url: 'https://images.unsplash.com/photo-1542751371-adc38448a05e?w=600&h=338&fit=crop' }
-          ],
-          rating: 4.7,
-          reviews: 1203,
-          fileSize: '3.2 GB',
-          version: '1.5.9',
-          developer: 'Strategy Masters',
-          releaseDate: '2024-06-10',
-          requirements: 'Android 9.0+ / iOS 13.0+',
-          languages: ['English', 'French', 'German', 'Russian']
-        }
-      }
-
-      const gameDetail = gameData[slug]
-      if (gameDetail) {
-        setGame(gameDetail)
-      }
-    } catch (error) {
-      console.error('Error fetching game details:', error)
-    } finally {
-      setLoading(false)
-    }
-  }
-
   const handleDownload = () => {
-    if (game?.downloadUrl) {
-      window.open(game.downloadUrl, '_blank')
+    if (game?.slug) {
+      startDownload(game.slug)
     }
   }
 
@@ -116,14 +28,6 @@ export default function GameDetailPage() {
     })
   }
 
-  if (loading) {
-    return (
-      <div className="min-h-screen bg-gradient-to-br from-blue-900 via-purple-900 to-indigo-900 flex items-center justify-center">
-        <div className="text-white text-xl">{t('loading')}</div>
-      </div>
-    )
-  }
-
   if (!game) {
     return (
       <div className="min-h-screen bg-gradient-to-br from-blue-900 via-purple-900 to-indigo-900">
@@ -222,14 +126,16 @@ export default function GameDetailPage() {
 
               {/* Rating & Reviews */}
               <div className="flex items-center gap-4 mb-6">
-                <div className="flex items-center">
-                  <Star className="w-5 h-5 text-yellow-400 fill-current" />
-                  <span className="text-white font-semibold ml-1">{game.rating}</span>
-                  <span className="text-gray-400 ml-1">({game.reviews} {t('reviews')})</span>
-                </div>
+                {game.rating && (
+                  <div className="flex items-center">
+                    <Star className="w-5 h-5 text-yellow-400 fill-current" />
+                    <span className="text-white font-semibold ml-1">{game.rating}</span>
+                    <span className="text-gray-400 ml-1">({game.reviews} {t('reviews')})</span>
+                  </div>
+                )}
                 <div className="flex items-center text-gray-300">
                   <Download className="w-4 h-4 mr-1" />
-                  {game.downloads.toLocaleString()} {t('downloads')}
+                  {(game.downloads || 0).toLocaleString()} {t('downloads')}
                 </div>
               </div>
             </div>
@@ -258,7 +164,7 @@ export default function GameDetailPage() {
             <div className="mb-8">
               <h2 className="text-2xl font-bold text-white mb-4">{t('aboutGame')}</h2>
               <div className="bg-white/10 rounded-lg p-6">
-                <p className="text-gray-300 whitespace-pre-line">{game.fullDescription}</p>
+                <p className="text-gray-300 whitespace-pre-line">{game.fullDescription || game.description}</p>
               </div>
             </div>
           </div>
@@ -278,9 +184,11 @@ export default function GameDetailPage() {
                   <Download className="w-5 h-5" />
                   {t('downloadNow')}
                 </Button>
-                <p className="text-gray-400 text-sm mt-3 text-center">
-                  {t('fileSize')}: {game.fileSize}
-                </p>
+                {game.fileSize && (
+                  <p className="text-gray-400 text-sm mt-3 text-center">
+                    {t('fileSize')}: {game.fileSize}
+                  </p>
+                )}
               </CardContent>
             </Card>
 
@@ -300,7 +208,7 @@ export default function GameDetailPage() {
                 </div>
                 <div>
                   <span className="text-gray-400">{t('releaseDate')}:</span>
-                  <p className="text-white">{formatDate(game.releaseDate)}</p>
+                  <p className="text-white">{game.releaseDate ? formatDate(game.releaseDate) : '-'}</p>
                 </div>
                 <div>
                   <span className="text-gray-400">{t('requirements')}:</span>
@@ -308,7 +216,7 @@ export default function GameDetailPage() {
                 </div>
                 <div>
                   <span className="text-gray-400">{t('languages')}:</span>
-                  <p className="text-white">{game.languages.join(', ')}</p>
+                  <p className="text-white">{game.languages?.join(', ') || '-'}</p>
                 </div>
               </CardContent>
             </Card>
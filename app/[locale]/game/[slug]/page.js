@@ -0,0 +1,16 @@
+import { loadGame, loadGameSlugs } from '@/lib/catalog'
+import GameDetailClient from './GameDetailClient'
+
+// Regenerated at most every 10 minutes; admin writes revalidate on demand.
+// Slugs added after the build render on first request, then stay cached.
+export const revalidate = 600
+
+export async function generateStaticParams() {
+  const slugs = await loadGameSlugs()
+  return slugs.map(slug => ({ slug }))
+}
+
+export default async function GameDetailPage({ params }) {
+  const game = await loadGame(params.slug)
+  return <GameDetailClient game={game} />
+}
@@ -1,6 +1,9 @@
-import './globals.css'
+import '../globals.css'
 import { Inter } from 'next/font/google'
 import { LanguageProvider } from '@/lib/LanguageContext'
+import { notFound } from 'next/navigation'
+import { LOCALES, isLocale } from '@/lib/i18n'
+import { loadDictionary } from '@/lib/locales'
 
 const inter = Inter({ subsets: ['latin'] })
 
@@ -23,11 +26,22 @@ export const metadata = {
   },
 }
 
-export default function RootLayout({ children }) {
+// Every page is rendered once per locale; middleware.js picks which one
+// a request gets. dynamicParams stays on: turning it off here would also
+// turn off on-demand rendering for game and article slugs below.
+export function generateStaticParams() {
+  return LOCALES.map(locale => ({ locale }))
+}
+
+export default async function RootLayout({ children, params }) {
+  if (!isLocale(params.locale)) {
+    notFound()
+  }
+  const dictionary = await loadDictionary(params.locale)
   return (
-    <html lang="en">
+    <html lang={params.locale}>
       <body className={inter.className}>
-        <LanguageProvider>
+        <LanguageProvider locale={params.locale} dictionary={dictionary}>
           {children}
         </LanguageProvider>
       </body>
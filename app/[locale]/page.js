@@ -0,0 +1,11 @@
+import { loadFeaturedGames } from '@/lib/catalog'
+import { loadArticles } from '@/lib/articles'
+import HomeClient from './HomeClient'
+
+// Regenerated at most every 5 minutes; admin writes revalidate on demand
+export const revalidate = 300
+
+export default async function HomePage() {
+  const [games, articles] = await Promise.all([loadFeaturedGames(), loadArticles(3)])
+  return <HomeClient initialGames={games} initialArticles={articles} />
+}
@@ -1,6 +1,5 @@
 'use client'
 
-import { useEffect, useState } from 'react'
 import { Card, CardContent, CardDescription, CardHeader, CardTitle } from '@/components/ui/card'
 import { Button } from '@/components/ui/button'
 import { Badge } from '@/components/ui/badge'
@@ -10,88 +9,14 @@ import { LanguageSwitcher } from '@/components/LanguageSwitcher'
 import { MobileNavigation } from '@/components/MobileNavigation'
 import Link from 'next/link'
 import Image from 'next/image'
+import { startDownload } from '@/lib/utils'
 
-export default function TrendingPage() {
-  const [games, setGames] = useState([])
-  const [loading, setLoading] = useState(true)
+export default function TrendingClient({ initialGames = [] }) {
+  const games = initialGames
   const { t } = useLanguage()
 
-  useEffect(() => {
-    fetchTrendingGames()
-  }, [])
-
-  const fetchTrendingGames = async () => {
-    try {
-      // Mock trending games with high download counts
-      const trendingGames = [
-        {
-          id: 5, documentId: 'clash-of-clans-5', title: 'Clash of Clans',
-          description: 'The classic strategy game where you build your village, train troops, and battle other players. Join clans and participate in epic clan wars.',
-          category: 'Strategy', slug: 'clash-of-clans', featured: true, downloads: 456000,
-          downloadUrl: 'https://qqby-goc-hk.oss-cn-hongkong.aliyuncs.com/blct/blctTT_1.0.10.zip',
-          bannerImage: { url: 'https://images.unsplash.com/photo-1542751371-adc38448a05e?w=400&h=225&fit=crop' },
-          trendingRank: 1
-        },
-        {
-          id: 4, documentId: 'civilization-4', title: 'Civilization',
-          description: 'Build and expand your empire through the ages. Develop technologies, wage wars, and lead your civilization to greatness in this epic strategy game.',
-          category: 'Strategy', slug: 'civilization', featured: true, downloads: 234000,
-          downloadUrl: 'https://goc-cdn.qqby.cn/wm/Civilization_tk_1.5.9.zip',
-          bannerImage: { url: 'https://images.unsplash.com/photo-1511512578047-dfb367046420?w=400&h=225&fit=crop' },
-          trendingRank: 2
-        },
-        {
-          id: 12, documentId: 'minions-12', title: 'Minions',
-          description: 'Join the lovable Minions on their hilarious adventure! Experience fun-filled gameplay with your favorite yellow characters in this family game.',
-          category: 'Adventure', slug: 'minions', featured: false, downloads: 187000,
-          downloadUrl: 'https://goc-cdn.qqby.cn/xiaobing/WarpipsGame_1.2.3.zip',
-          bannerImage: { url: 'https://images.unsplash.com/photo-1593305841991-05c297ba4575?w=400&h=225&fit=crop' },
-          trendingRank: 3
-        },
-        {
-          id: 3, documentId: 'dragonball-showdown-3', title: 'Dragonball Showdown',
-          description: 'High-energy fighting game featuring your favorite Dragon Ball characters. Unleash devastating attacks and experience the ultimate anime fighting experience.',
-          category: 'Action', slug: 'dragonball-showdown', featured: true, downloads: 156000,
-          downloadUrl: 'https://qqby-goc-hangzhou.oss-cn-hangzhou.aliyuncs.com/lzTK/DragonBall_tk_v1.0.3.zip',
-          bannerImage: { url: 'https://images.unsplash.com/photo-1673350808686-209dc177c898?w=400&h=225&fit=crop' },
-          trendingRank: 4
-        },
-        {
-          id: 13, documentId: 'sheep-village-13', title: 'The Sheep Village',
-          description: 'Build and manage your own peaceful sheep village. Take care of your flock, expand your farm, and create the perfect pastoral paradise.',
-          category: 'Simulation', slug: 'sheep-village', featured: false, downloads: 134000,
-          downloadUrl: 'https://goc-cdn.qqby.cn/xiaobing/WarpipsGame_1.2.3.zip',
-          bannerImage: { url: 'https://images.unsplash.com/photo-1543622748-5ee7237e8565?w=400&h=225&fit=crop' },
-          trendingRank: 5
-        },
-        {
-          id: 1, documentId: 'wukong-1', title: 'Wukong',
-          description: 'Epic action RPG based on the legendary Monkey King. Experience breathtaking combat and explore a mystical world filled with ancient legends and powerful enemies.',
-          category: 'Action', slug: 'wukong', featured: true, downloads: 125000,
-          downloadUrl: 'https://goc-cdn.qqby.cn/tg/HihTT_2.6.5.zip',
-          bannerImage: { url: 'https://images.unsplash.com/photo-1511512578047-dfb367046420?w=400&h=225&fit=crop' },
-          trendingRank: 6
-        }
-      ]
-
-      setGames(trendingGames)
-    } catch (error) {
-      console.error('Error fetching trending games:', error)
-    } finally {
-      setLoading(false)
-    }
-  }
-
   const handleDownload = (game) => {
-    window.open(game.downloadUrl, '_blank')
-  }
-
-  if (loading) {
-    return (
-      <div className="min-h-screen bg-gradient-to-br from-blue-900 via-purple-900 to-indigo-900 flex items-center justify-center">
-        <div className="text-white text-xl">{t('loading')}</div>
-      </div>
-    )
+    startDownload(game.slug)
   }
 
   return (
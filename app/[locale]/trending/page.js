@@ -0,0 +1,10 @@
+import { loadTrendingGames } from '@/lib/catalog'
+import TrendingClient from './TrendingClient'
+
+// Regenerated at most every 5 minutes; admin writes revalidate on demand
+export const revalidate = 300
+
+export default async function TrendingPage() {
+  const games = await loadTrendingGames(6)
+  return <TrendingClient initialGames={games} />
+}
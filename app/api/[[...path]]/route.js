@@ -1,458 +1,1114 @@
-import { MongoClient } from 'mongodb'
-import { v4 as uuidv4 } from 'uuid'
+import { createHash, timingSafeEqual } from 'crypto'
 import { NextResponse } from 'next/server'
-import { getAllGames, getFeaturedGames, searchGames, getGameBySlug, createGame, updateGame, deleteGame, createAdminUser } from '@/lib/db'
-import { authenticateAdmin, generateToken, verifyToken, getTokenFromRequest } from '@/lib/auth'
-
-// MongoDB connection (keeping for legacy status endpoints)
-let client
-let db
-
-async function connectToMongo() {
-  if (!client) {
-    client = new MongoClient(process.env.MONGO_URL)
-    await client.connect()
-    db = client.db(process.env.DB_NAME)
-  }
-  return db
-}
+import { getAllGames, getFeaturedGames, searchGames, getGameBySlug, searchArticles, getArticleBySlug, createGame, updateGame, deleteGame, createAdminUser, getPoolStats, parseFields, parseLimit, decodeCursor, suggestGames, bulkWriteGames, iterateGames, patchGame, GAME_FIELDS, GAME_FIELD_TYPES } from '@/lib/db'
+import { authenticateAdmin, verifyToken, getTokenFromRequest, getTokenCacheStats, getClientIp, checkLoginRate, resetLoginRate } from '@/lib/auth'
+import { HasherBusyError, getHasherStats } from '@/lib/passwordHasher'
+import { cachedGames, cachedGamesJson, cachedArticlesJson, invalidateGames, invalidateArticles, gamesCache } from '@/lib/cache'
+import { revalidateGamePages, categoryFacets, trendingGames, toGameView, toGameDetailView, withBannerUrls, fallbackGames } from '@/lib/catalog'
+import { recordDownload, getDownloadStats } from '@/lib/downloads'
+import { toArticleView, toArticleDetailView, revalidateArticlePages } from '@/lib/articles'
+import { createRouter } from '@/lib/router'
+import { withSpan, finishSpan, serverTiming, renderMetrics } from '@/lib/metrics'
+import { getMongoHealth, MongoUnavailableError } from '@/lib/mongo'
+import { IMAGE_VARIANTS } from '@/lib/imageVariants'
+import { GAME_CATEGORIES, isGameCategory } from '@/lib/categories'
+import { getImageVariant, getImageCacheStats, negotiateFormat, resolveSource } from '@/lib/imagePipeline'
+import { parseStatusQuery, listStatusChecks, streamStatusChecks, toStatusCheck, insertStatusChecks, enqueueStatusCheck, MAX_BULK_ITEMS } from '@/lib/status'
 
 // Helper function to handle CORS
 function handleCORS(response) {
   response.headers.set('Access-Control-Allow-Origin', process.env.CORS_ORIGINS || '*')
-  response.headers.set('Access-Control-Allow-Methods', 'GET, POST, PUT, DELETE, OPTIONS')
+  response.headers.set('Access-Control-Allow-Methods', 'GET, POST, PUT, PATCH, DELETE, OPTIONS')
   response.headers.set('Access-Control-Allow-Headers', 'Content-Type, Authorization')
   response.headers.set('Access-Control-Allow-Credentials', 'true')
   return response
 }
 
-// OPTIONS handler for CORS
-export async function OPTIONS() {
-  return handleCORS(new NextResponse(null, { status: 200 }))
+// Apply a ?fields= projection to a transformed game
+function pickFields(game, fields) {
+  if (!fields) {
+    return game
+  }
+  const picked = {}
+  for (const field of fields) {
+    picked[field] = game[field]
+  }
+  return picked
 }
 
-// Route handler function
-async function handleRoute(request, { params }) {
-  const { path = [] } = params
-  const route = `/${path.join('/')}`
-  const method = request.method
-  const url = new URL(request.url)
+// Read limit/cursor/fields for keyset-paginated listings
+function readPageParams(url) {
+  const cursor = url.searchParams.get('cursor')
+  if (cursor && !decodeCursor(cursor)) {
+    return { error: "Invalid cursor" }
+  }
+  return {
+    limit: parseLimit(url.searchParams.get('limit')),
+    cursor,
+    fields: parseFields(url.searchParams.get('fields'))
+  }
+}
+
+// =================================
+// MIDDLEWARE
+// =================================
+
+// Outermost: one span per request, covering the other middleware too.
+// The breakdown goes to /api/metrics and the Server-Timing header.
+function timing(ctx, next) {
+  return withSpan({ method: ctx.request.method, route: ctx.route }, async (span) => {
+    let response
+    try {
+      response = await next()
+    } catch (error) {
+      finishSpan(span, 500)
+      throw error
+    }
+    const length = response.headers.get('content-length')
+    const totalMs = finishSpan(span, response.status, length === null ? null : parseInt(length, 10))
+    response.headers.set('Server-Timing', serverTiming(span, totalMs))
+    return response
+  })
+}
 
+async function cors(ctx, next) {
+  return handleCORS(await next())
+}
+
+async function requireAdmin(ctx, next) {
+  const token = getTokenFromRequest(ctx.request)
+  const admin = token && verifyToken(token)
+  if (!admin) {
+    return NextResponse.json(
+      { error: "Unauthorized" },
+      { status: 401 }
+    )
+  }
+  ctx.admin = admin
+  return next()
+}
+
+// Legacy status routes fail fast with 503 while MongoDB is unreachable
+async function mongoAvailable(ctx, next) {
   try {
-    
-    // =================================
-    // ADMIN AUTHENTICATION ROUTES
-    // =================================
-    
-    // Admin login
-    if (route === '/admin/login' && method === 'POST') {
-      const body = await request.json()
-      const { email, password } = body
-      
-      if (!email || !password) {
-        return handleCORS(NextResponse.json(
-          { error: "Email and password required" },
-          { status: 400 }
-        ))
-      }
-      
-      const result = await authenticateAdmin(email, password)
-      if (result) {
-        return handleCORS(NextResponse.json({
-          message: "Login successful",
-          token: result.token,
-          user: result.user
-        }))
-      } else {
-        return handleCORS(NextResponse.json(
-          { error: "Invalid credentials" },
-          { status: 401 }
-        ))
-      }
+    return await next()
+  } catch (error) {
+    if (!(error instanceof MongoUnavailableError)) {
+      throw error
     }
-    
-    // Create admin user (for initial setup)
-    if (route === '/admin/register' && method === 'POST') {
-      const body = await request.json()
-      const { email, password } = body
-      
-      if (!email || !password) {
-        return handleCORS(NextResponse.json(
-          { error: "Email and password required" },
-          { status: 400 }
-        ))
-      }
-      
-      try {
-        const user = await createAdminUser(email, password)
-        return handleCORS(NextResponse.json({
-          message: "Admin user created successfully",
-          user: { id: user.id, email: user.email }
-        }))
-      } catch (error) {
-        return handleCORS(NextResponse.json(
-          { error: "Failed to create admin user" },
-          { status: 500 }
-        ))
-      }
+    console.error('MongoDB unavailable:', error.message)
+    const response = NextResponse.json(
+      { error: "Status service unavailable" },
+      { status: 503 }
+    )
+    response.headers.set('Retry-After', String(Math.ceil(error.retryAfterMs / 1000)))
+    return response
+  }
+}
+
+// Cache-Control per route. Browsers revalidate (max-age=0) against the
+// ETag; shared caches (CDN) may serve for s-maxage and then keep serving
+// stale while they refetch in the background.
+const CACHE_POLICIES = {
+  list: 'public, max-age=0, s-maxage=60, stale-while-revalidate=300',
+  detail: 'public, max-age=0, s-maxage=300, stale-while-revalidate=600',
+  content: 'public, max-age=300, s-maxage=3600, stale-while-revalidate=86400',
+  // Image variant URLs change whenever their source does
+  immutable: 'public, max-age=31536000, immutable',
+  none: 'no-store',
+}
+
+// Errors are never cached; handlers that set their own header keep it
+function cacheControl(policy) {
+  const value = CACHE_POLICIES[policy]
+  return async (ctx, next) => {
+    const response = await next()
+    if (!response.headers.has('Cache-Control')) {
+      response.headers.set('Cache-Control', response.status < 400 ? value : CACHE_POLICIES.none)
     }
-    
-    // =================================
-    // GAMES API ROUTES (Real Database)
-    // =================================
-    
-    // Get all games with filters
-    if (route === '/games' && method === 'GET') {
-      const search = url.searchParams.get('search')
-      const category = url.searchParams.get('category')
-      const featured = url.searchParams.get('featured')
-      
-      try {
-        let games
-        if (featured === 'true') {
-          games = await getFeaturedGames()
-        } else {
-          games = await searchGames(search, category)
-        }
-        
-        // Transform for frontend compatibility
-        const transformedGames = games.map(game => ({
-          id: game.id,
-          documentId: game.document_id || `game-${game.id}`,
-          title: game.title,
-          description: game.description,
-          category: game.category,
-          downloadUrl: game.download_url,
-          slug: game.slug,
-          featured: game.featured,
-          downloads: game.downloads,
-          bannerImage: { url: `https://images.unsplash.com/photo-1542751371-adc38448a05e?w=400&h=225&fit=crop` }, // Placeholder
-          createdAt: game.created_at,
-          updatedAt: game.updated_at
-        }))
-        
-        return handleCORS(NextResponse.json({ data: transformedGames }))
-      } catch (error) {
-        console.error('Database error:', error)
-        return handleCORS(NextResponse.json(
-          { error: "Failed to fetch games" },
-          { status: 500 }
-        ))
-      }
+    return response
+  }
+}
+
+const noStore = cacheControl('none')
+const cached = (policy) => ({ use: [cacheControl(policy)] })
+const adminOnly = { use: [noStore, requireAdmin] }
+const usesMongo = { use: [noStore, mongoAvailable] }
+
+// =================================
+// ADMIN AUTHENTICATION ROUTES
+// =================================
+
+// Admin login
+async function adminLogin({ request }) {
+  const body = await request.json()
+  const { email, password } = body
+
+  if (!email || !password) {
+    return NextResponse.json(
+      { error: "Email and password required" },
+      { status: 400 }
+    )
+  }
+
+  const ip = getClientIp(request)
+  const rate = checkLoginRate(email, ip)
+  if (!rate.allowed) {
+    const response = NextResponse.json(
+      { error: "Too many login attempts" },
+      { status: 429 }
+    )
+    response.headers.set('Retry-After', String(Math.ceil(rate.retryAfterMs / 1000)))
+    return response
+  }
+
+  let result
+  try {
+    result = await authenticateAdmin(email, password)
+  } catch (error) {
+    if (error instanceof HasherBusyError) {
+      return NextResponse.json(
+        { error: "Login temporarily unavailable" },
+        { status: 503 }
+      )
     }
-    
-    // Get single game by slug
-    if (route.startsWith('/games/') && method === 'GET') {
-      const slug = route.split('/games/')[1]
-      
-      try {
-        const game = await getGameBySlug(slug)
-        if (!game) {
-          return handleCORS(NextResponse.json(
-            { error: "Game not found" },
-            { status: 404 }
-          ))
-        }
-        
-        const transformedGame = {
-          id: game.id,
-          documentId: game.document_id || `game-${game.id}`,
-          title: game.title,
-          description: game.description,
-          category: game.category,
-          downloadUrl: game.download_url,
-          slug: game.slug,
-          featured: game.featured,
-          downloads: game.downloads,
-          bannerImage: { url: `https://images.unsplash.com/photo-1542751371-adc38448a05e?w=800&h=450&fit=crop` },
-          createdAt: game.created_at,
-          updatedAt: game.updated_at
-        }
-        
-        return handleCORS(NextResponse.json({ data: transformedGame }))
-      } catch (error) {
-        console.error('Database error:', error)
-        return handleCORS(NextResponse.json(
-          { error: "Failed to fetch game" },
-          { status: 500 }
-        ))
-      }
+    throw error
+  }
+  if (result) {
+    resetLoginRate(email, ip)
+    return NextResponse.json({
+      message: "Login successful",
+      token: result.token,
+      user: result.user
+    })
+  }
+  return NextResponse.json(
+    { error: "Invalid credentials" },
+    { status: 401 }
+  )
+}
+
+// Create admin user (for initial setup)
+async function adminRegister({ request }) {
+  const body = await request.json()
+  const { email, password } = body
+
+  if (!email || !password) {
+    return NextResponse.json(
+      { error: "Email and password required" },
+      { status: 400 }
+    )
+  }
+
+  try {
+    const user = await createAdminUser(email, password)
+    return NextResponse.json({
+      message: "Admin user created successfully",
+      user: { id: user.id, email: user.email }
+    })
+  } catch (error) {
+    return NextResponse.json(
+      { error: "Failed to create admin user" },
+      { status: 500 }
+    )
+  }
+}
+
+// =================================
+// GAMES API ROUTES (Real Database)
+// =================================
+
+// Send a pre-encoded JSON body with its validators. If-None-Match takes
+// precedence over If-Modified-Since (RFC 9110); either match gets a 304
+// without serializing anything. Weak validators are compared weakly, as
+// allowed for If-None-Match (proxies may weaken ETags when compressing).
+function encodedResponse(request, { body, etag, lastModified }) {
+  const headers = { ETag: etag }
+  if (lastModified) {
+    headers['Last-Modified'] = lastModified
+  }
+
+  const ifNoneMatch = request.headers.get('if-none-match')
+  const ifModifiedSince = request.headers.get('if-modified-since')
+  let notModified = false
+  if (ifNoneMatch) {
+    const tags = ifNoneMatch.split(',').map(tag => tag.trim().replace(/^W\//, ''))
+    notModified = tags.includes('*') || tags.includes(etag)
+  } else if (ifModifiedSince && lastModified) {
+    notModified = Date.parse(lastModified) <= Date.parse(ifModifiedSince)
+  }
+  if (notModified) {
+    return new NextResponse(null, { status: 304, headers })
+  }
+
+  return new NextResponse(body, {
+    headers: { ...headers, 'Content-Type': 'application/json', 'Content-Length': String(body.length) }
+  })
+}
+
+// Listing shared by /games and /strapi/games: one view model and one
+// encoded cache entry per query
+function loadGameList(url, page) {
+  const search = url.searchParams.get('search')
+  const category = url.searchParams.get('category')
+  const featured = url.searchParams.get('featured')
+
+  return cachedGamesJson({ route: '/games', search, category, featured, ...page }, async () => {
+    let games
+    let nextCursor = null
+    if (featured === 'true') {
+      games = await getFeaturedGames()
+    } else {
+      ({ rows: games, nextCursor } = await searchGames(search, category, page))
     }
-    
-    // =================================
-    // ADMIN GAMES MANAGEMENT
-    // =================================
-    
-    // Create new game (admin only)
-    if (route === '/admin/games' && method === 'POST') {
-      const token = getTokenFromRequest(request)
-      if (!token || !verifyToken(token)) {
-        return handleCORS(NextResponse.json(
-          { error: "Unauthorized" },
-          { status: 401 }
-        ))
-      }
-      
-      const body = await request.json()
-      try {
-        const game = await createGame(body)
-        return handleCORS(NextResponse.json({ 
-          message: "Game created successfully",
-          data: game 
-        }))
-      } catch (error) {
-        return handleCORS(NextResponse.json(
-          { error: "Failed to create game" },
-          { status: 500 }
-        ))
-      }
+    if (!page.fields || page.fields.includes('bannerImage')) {
+      games = await withBannerUrls(games)
     }
-    
-    // Update game (admin only)
-    if (route.startsWith('/admin/games/') && method === 'PUT') {
-      const token = getTokenFromRequest(request)
-      if (!token || !verifyToken(token)) {
-        return handleCORS(NextResponse.json(
-          { error: "Unauthorized" },
-          { status: 401 }
-        ))
-      }
-      
-      const gameId = route.split('/admin/games/')[1]
-      const body = await request.json()
-      
-      try {
-        const game = await updateGame(parseInt(gameId), body)
-        return handleCORS(NextResponse.json({
-          message: "Game updated successfully",
-          data: game
-        }))
-      } catch (error) {
-        return handleCORS(NextResponse.json(
-          { error: "Failed to update game" },
-          { status: 500 }
-        ))
-      }
+    return {
+      data: games.map(game => pickFields(toGameView(game), page.fields)),
+      meta: { pagination: { limit: page.limit, nextCursor } }
     }
-    
-    // Delete game (admin only)
-    if (route.startsWith('/admin/games/') && method === 'DELETE') {
-      const token = getTokenFromRequest(request)
-      if (!token || !verifyToken(token)) {
-        return handleCORS(NextResponse.json(
-          { error: "Unauthorized" },
-          { status: 401 }
-        ))
-      }
-      
-      const gameId = route.split('/admin/games/')[1]
-      
-      try {
-        await deleteGame(parseInt(gameId))
-        return handleCORS(NextResponse.json({
-          message: "Game deleted successfully"
-        }))
-      } catch (error) {
-        return handleCORS(NextResponse.json(
-          { error: "Failed to delete game" },
-          { status: 500 }
-        ))
-      }
+  })
+}
+
+// No Last-Modified: the body carries downloads, which the download counter
+// merges without touching updatedAt, so only the ETag tracks every change
+function loadGameDetail(slug) {
+  return cachedGamesJson({ route: '/games/:slug', slug }, async () => {
+    const game = await getGameBySlug(slug)
+    return game ? { data: toGameDetailView((await withBannerUrls([game]))[0]) } : null
+  })
+}
+
+// Get all games with filters
+async function listGames({ request, url }) {
+  const page = readPageParams(url)
+  if (page.error) {
+    return NextResponse.json({ error: page.error }, { status: 400 })
+  }
+
+  try {
+    return encodedResponse(request, await loadGameList(url, page))
+  } catch (error) {
+    console.error('Database error:', error)
+    return NextResponse.json(
+      { error: "Failed to fetch games" },
+      { status: 500 }
+    )
+  }
+}
+
+// Typeahead suggestions (slug + title only)
+async function suggest({ route, url }) {
+  const q = (url.searchParams.get('q') || '').trim()
+  const limit = Math.min(parseLimit(url.searchParams.get('limit')) || 8, 20)
+
+  try {
+    const suggestions = q.length < 2 ? [] : await cachedGames(
+      { route, search: q, limit },
+      () => suggestGames(q, limit)
+    )
+    return NextResponse.json({ data: suggestions })
+  } catch (error) {
+    console.error('Database error:', error)
+    return NextResponse.json(
+      { error: "Failed to fetch suggestions" },
+      { status: 500 }
+    )
+  }
+}
+
+// Count a download and send the browser on to the file. The event is
+// buffered in memory; the slug lookup is served from the games cache.
+async function downloadGame({ params }) {
+  const { slug } = params
+
+  try {
+    const game = await cachedGames({ route: '/games/:slug', slug }, () => getGameBySlug(slug))
+    if (!game || !game.download_url) {
+      return NextResponse.json(
+        { error: "Game not found" },
+        { status: 404 }
+      )
+    }
+
+    recordDownload(game.document_id)
+    return NextResponse.redirect(game.download_url, 303)
+  } catch (error) {
+    console.error('Database error:', error)
+    return NextResponse.json(
+      { error: "Failed to start download" },
+      { status: 500 }
+    )
+  }
+}
+
+// Trending games: time-decayed download scores with 1h/24h/7d counts
+async function listTrending({ request, route, url }) {
+  const limit = parseLimit(url.searchParams.get('limit')) || 10
+
+  try {
+    const encoded = await cachedGamesJson({ route, limit }, async () => ({ data: await trendingGames(limit) }))
+    return encodedResponse(request, encoded)
+  } catch (error) {
+    console.error('Database error:', error)
+    return NextResponse.json(
+      { error: "Failed to fetch trending games" },
+      { status: 500 }
+    )
+  }
+}
+
+// Category filter counts - GET /api/facets/categories?search=
+// { data: [{ category, count }], meta: { total } }
+async function listCategoryFacets({ request, route, url }) {
+  const search = (url.searchParams.get('search') || '').trim()
+
+  try {
+    const encoded = await cachedGamesJson({ route, search }, () => categoryFacets(search))
+    return encodedResponse(request, encoded)
+  } catch (error) {
+    console.error('Database error:', error)
+    return NextResponse.json(
+      { error: "Failed to fetch category facets" },
+      { status: 500 }
+    )
+  }
+}
+
+// Get single game by slug
+async function getGame({ request, params }) {
+  try {
+    const encoded = await loadGameDetail(params.slug)
+    if (!encoded.body) {
+      return NextResponse.json(
+        { error: "Game not found" },
+        { status: 404 }
+      )
     }
-    
-    // Get all games for admin
-    if (route === '/admin/games' && method === 'GET') {
-      const token = getTokenFromRequest(request)
-      if (!token || !verifyToken(token)) {
-        return handleCORS(NextResponse.json(
-          { error: "Unauthorized" },
-          { status: 401 }
-        ))
+    return encodedResponse(request, encoded)
+  } catch (error) {
+    console.error('Database error:', error)
+    return NextResponse.json(
+      { error: "Failed to fetch game" },
+      { status: 500 }
+    )
+  }
+}
+
+// Articles, newest first - GET /api/articles?tag=&category=&limit=&cursor=
+// Listings carry the excerpt only; the body comes with the detail.
+async function listArticles({ request, url }) {
+  const page = readPageParams(url)
+  if (page.error) {
+    return NextResponse.json({ error: page.error }, { status: 400 })
+  }
+  const tag = url.searchParams.get('tag')
+  const category = url.searchParams.get('category')
+  const { limit, cursor } = page
+
+  try {
+    const encoded = await cachedArticlesJson({ route: '/articles', tag, category, limit, cursor }, async () => {
+      const { rows, nextCursor } = await searchArticles({ tag, category, limit, cursor })
+      return {
+        data: rows.map(article => toArticleView(article)),
+        meta: { pagination: { limit, nextCursor } }
       }
-      
-      try {
-        const games = await getAllGames()
-        return handleCORS(NextResponse.json({ data: games }))
-      } catch (error) {
-        return handleCORS(NextResponse.json(
-          { error: "Failed to fetch games" },
-          { status: 500 }
-        ))
+    })
+    return encodedResponse(request, encoded)
+  } catch (error) {
+    console.error('Database error:', error)
+    return NextResponse.json(
+      { error: "Failed to fetch articles" },
+      { status: 500 }
+    )
+  }
+}
+
+async function getArticle({ request, params }) {
+  try {
+    const encoded = await cachedArticlesJson({ route: '/articles/:slug', slug: params.slug }, async () => {
+      const article = await getArticleBySlug(params.slug)
+      return article ? { data: toArticleDetailView(article) } : null
+    }, (payload) => payload.data.updatedAt)
+    if (!encoded.body) {
+      return NextResponse.json(
+        { error: "Article not found" },
+        { status: 404 }
+      )
+    }
+    return encodedResponse(request, encoded)
+  } catch (error) {
+    console.error('Database error:', error)
+    return NextResponse.json(
+      { error: "Failed to fetch article" },
+      { status: 500 }
+    )
+  }
+}
+
+// Resized banner/screenshot - GET /api/images/:variant?src=&dpr=
+// Encoded as AVIF or WebP when the browser accepts it
+async function serveImage({ request, url, params }) {
+  const variant = params.variant
+  const dpr = url.searchParams.get('dpr') === '2' ? 2 : 1
+  const sourceUrl = resolveSource(url.searchParams.get('src'))
+  if (!(variant in IMAGE_VARIANTS) || !sourceUrl) {
+    return NextResponse.json(
+      { error: "Unknown image variant or source" },
+      { status: 400 }
+    )
+  }
+
+  try {
+    const format = negotiateFormat(request.headers.get('accept') || '')
+    const { body, contentType } = await getImageVariant({ sourceUrl, variant, dpr, format })
+    return new NextResponse(body, {
+      headers: {
+        'Content-Type': contentType,
+        'Content-Length': String(body.length),
+        'Vary': 'Accept'
       }
+    })
+  } catch (error) {
+    console.error('Image pipeline error:', error.message)
+    return NextResponse.json(
+      { error: "Failed to process image" },
+      { status: 502 }
+    )
+  }
+}
+
+// =================================
+// ADMIN GAMES MANAGEMENT
+// =================================
+
+// Categories are the Strapi game schema enum
+function unknownCategory() {
+  return NextResponse.json(
+    { error: `category must be one of: ${GAME_CATEGORIES.join(', ')}` },
+    { status: 400 }
+  )
+}
+
+// The partial unique index on published slugs (games-slug-unique migration)
+function slugInUse() {
+  return NextResponse.json(
+    { error: "Slug already in use" },
+    { status: 409 }
+  )
+}
+
+// Create new game (admin only)
+async function adminCreateGame({ request }) {
+  const body = await request.json()
+  if (!isGameCategory(body.category)) {
+    return unknownCategory()
+  }
+  try {
+    const game = await createGame(body)
+    invalidateGames(game)
+    revalidateGamePages(game)
+    return NextResponse.json({
+      message: "Game created successfully",
+      data: game
+    })
+  } catch (error) {
+    if (error.code === '23505') {
+      return slugInUse()
     }
+    return NextResponse.json(
+      { error: "Failed to create game" },
+      { status: 500 }
+    )
+  }
+}
 
-    // =================================
-    // LEGACY STRAPI-STYLE ROUTES (for backwards compatibility)
-    // =================================
-    
-    // Mock Strapi Games API
-    if (route === '/strapi/games' && method === 'GET') {
-      const search = url.searchParams.get('search')
-      const category = url.searchParams.get('category')
-      const featured = url.searchParams.get('featured')
-      
-      try {
-        let games
-        if (featured === 'true') {
-          games = await getFeaturedGames()
-        } else {
-          games = await searchGames(search, category)
-        }
-        
-        // Transform for frontend compatibility with better images
-        const imageUrls = [
-          'https://images.unsplash.com/photo-1673350808686-209dc177c898?w=400&h=225&fit=crop',
-          'https://images.unsplash.com/photo-1543622748-5ee7237e8565?w=400&h=225&fit=crop',
-          'https://images.unsplash.com/photo-1593305841991-05c297ba4575?w=400&h=225&fit=crop',
-          'https://images.unsplash.com/photo-1511512578047-dfb367046420?w=400&h=225&fit=crop',
-          'https://images.unsplash.com/photo-1542751371-adc38448a05e?w=400&h=225&fit=crop'
-        ]
-        
-        const transformedGames = games.map((game, index) => ({
-          id: game.id,
-          documentId: game.document_id || `game-${game.id}`,
-          title: game.title,
-          description: game.description,
-          category: game.category,
-          downloadUrl: game.download_url,
-          slug: game.slug,
-          featured: game.featured,
-          downloads: game.downloads,
-          bannerImage: { url: imageUrls[index % imageUrls.length] },
-          createdAt: game.created_at,
-          updatedAt: game.updated_at
-        }))
-        
-        return handleCORS(NextResponse.json({ data: transformedGames }))
-      } catch (error) {
-        console.error('Database error:', error)
-        // Fallback to mock data if database fails
-        const MOCK_GAMES = [
-          {
-            id: 1, documentId: 'wukong-1', title: 'Wukong', 
-            description: 'Epic action RPG based on the legendary Monkey King.',
-            category: 'Action', slug: 'wukong', featured: true, downloads: 125000,
-            bannerImage: { url: 'https://images.unsplash.com/photo-1673350808686-209dc177c898?w=400&h=225&fit=crop' }
-          }
-        ]
-        return handleCORS(NextResponse.json({ data: MOCK_GAMES }))
+// Update game (admin only)
+async function adminUpdateGame({ request, params }) {
+  const body = await request.json()
+  if (!isGameCategory(body.category)) {
+    return unknownCategory()
+  }
+
+  try {
+    const { game, previous } = await updateGame(params.id, body)
+    invalidateGames(previous, game)
+    revalidateGamePages(previous, game)
+    return NextResponse.json({
+      message: "Game updated successfully",
+      data: game
+    })
+  } catch (error) {
+    if (error.code === '23505') {
+      return slugInUse()
+    }
+    return NextResponse.json(
+      { error: "Failed to update game" },
+      { status: 500 }
+    )
+  }
+}
+
+// Check one writable game field (PATCH and bulk import); returns an error
+// message or null
+function gameFieldError(field, value) {
+  const type = field === 'slug' ? 'text' : GAME_FIELD_TYPES[field]
+  if (!type) {
+    return `Unknown or read-only field: ${field}`
+  }
+  const valid = type === 'boolean' ? typeof value === 'boolean'
+    : type === 'int' ? Number.isInteger(value) && value >= 0
+    : typeof value === 'string' && (field === 'description' || value.trim() !== '')
+  if (!valid || (field === 'category' && !isGameCategory(value))) {
+    return `Invalid value for ${field}`
+  }
+  return null
+}
+
+// Validate a PATCH body against the writable fields; returns { changes }
+// or { error }
+function readGamePatch(body) {
+  const changes = {}
+  for (const [field, value] of Object.entries(body)) {
+    if (field === 'updatedAt') {
+      continue
+    }
+    const error = gameFieldError(field, value)
+    if (error) {
+      return { error }
+    }
+    changes[field] = value
+  }
+  if (Object.keys(changes).length === 0) {
+    return { error: "No fields to update" }
+  }
+  return { changes }
+}
+
+// Partially update game (admin only). Send the updatedAt you last read to
+// make the write conditional; a concurrent edit then answers 409 with the
+// current row instead of being overwritten.
+async function adminPatchGame({ request, params }) {
+  const body = await request.json().catch(() => null)
+  if (!body || typeof body !== 'object' || Array.isArray(body)) {
+    return NextResponse.json({ error: "Expected a JSON object" }, { status: 400 })
+  }
+  const { changes, error } = readGamePatch(body)
+  if (error) {
+    return NextResponse.json({ error }, { status: 400 })
+  }
+  if (body.updatedAt && Number.isNaN(new Date(body.updatedAt).getTime())) {
+    return NextResponse.json({ error: "Invalid updatedAt" }, { status: 400 })
+  }
+
+  try {
+    const { game, previous, conflict } = await patchGame(params.id, changes, body.updatedAt || null)
+    if (conflict) {
+      return NextResponse.json(
+        { error: "Game was modified since updatedAt", data: conflict },
+        { status: 409 }
+      )
+    }
+    if (!game) {
+      return NextResponse.json(
+        { error: "Game not found" },
+        { status: 404 }
+      )
+    }
+    invalidateGames(previous, game)
+    revalidateGamePages(previous, game)
+    return NextResponse.json({
+      message: "Game updated successfully",
+      data: game
+    })
+  } catch (error) {
+    if (error.code === '23505') {
+      return slugInUse()
+    }
+    console.error('Database error:', error)
+    return NextResponse.json(
+      { error: "Failed to update game" },
+      { status: 500 }
+    )
+  }
+}
+
+// Delete game (admin only)
+async function adminDeleteGame({ params }) {
+  try {
+    const deleted = await deleteGame(params.id)
+    invalidateGames(deleted)
+    revalidateGamePages(deleted)
+    return NextResponse.json({
+      message: "Game deleted successfully"
+    })
+  } catch (error) {
+    return NextResponse.json(
+      { error: "Failed to delete game" },
+      { status: 500 }
+    )
+  }
+}
+
+// Get all games for admin
+async function adminListGames({ url }) {
+  const page = readPageParams(url)
+  if (page.error) {
+    return NextResponse.json({ error: page.error }, { status: 400 })
+  }
+
+  try {
+    const { rows: games, nextCursor } = await getAllGames(page)
+    return NextResponse.json({
+      data: games,
+      meta: { pagination: { limit: page.limit, nextCursor } }
+    })
+  } catch (error) {
+    return NextResponse.json(
+      { error: "Failed to fetch games" },
+      { status: 500 }
+    )
+  }
+}
+
+const MAX_BULK_GAMES = 5000
+
+function slugify(text) {
+  return String(text).toLowerCase().replace(/[^a-z0-9]+/g, '-').replace(/-+/g, '-').replace(/^-|-$/g, '')
+}
+
+// Bulk import (admin only): { upsert: [game...], delete: [id...] } in one
+// transaction. Upserts match on slug (derived from title when omitted).
+async function adminBulkGames({ request }) {
+  const body = await request.json().catch(() => null)
+  const upsertItems = Array.isArray(body?.upsert) ? body.upsert : []
+  const deleteIds = Array.isArray(body?.delete) ? body.delete : []
+  if (!body || (upsertItems.length === 0 && deleteIds.length === 0)) {
+    return NextResponse.json(
+      { error: "Expected { upsert: [...], delete: [...] }" },
+      { status: 400 }
+    )
+  }
+  if (upsertItems.length + deleteIds.length > MAX_BULK_GAMES) {
+    return NextResponse.json(
+      { error: `At most ${MAX_BULK_GAMES} items per request` },
+      { status: 413 }
+    )
+  }
+
+  const errors = []
+  if (!deleteIds.every(id => Number.isInteger(id))) {
+    errors.push({ field: 'delete', error: "Ids must be integers" })
+  }
+  // Later items win when a slug repeats
+  const bySlug = new Map()
+  upsertItems.forEach((item, index) => {
+    const slug = item?.slug || (item?.title ? slugify(item.title) : '')
+    if (!slug) {
+      errors.push({ index, error: "slug or title is required" })
+      return
+    }
+    // Same rules as PATCH; null leaves an existing game's value unchanged
+    for (const [field, value] of Object.entries(item)) {
+      const error = value === null || value === undefined ? null : gameFieldError(field, value)
+      if (error) {
+        errors.push({ index, field, error })
+        return
       }
     }
+    bySlug.set(slug, { ...item, slug })
+  })
+  if (errors.length > 0) {
+    return NextResponse.json({ error: "Invalid bulk request", errors }, { status: 400 })
+  }
 
-    // Mock Strapi Articles API
-    if (route === '/strapi/articles' && method === 'GET') {
-      const MOCK_ARTICLES = [
-        {
-          id: 1,
-          documentId: 'gaming-trends-2025',
-          title: 'Top Gaming Trends to Watch in 2025',
-          excerpt: 'Discover the latest trends shaping the gaming industry this year.',
-          slug: 'gaming-trends-2025',
-          publishedDate: '2025-01-15T10:00:00Z',
-          author: 'GameVault Team',
-          featuredImage: { url: 'https://images.unsplash.com/photo-1511512578047-dfb367046420?w=400&h=225&fit=crop' }
-        }
-      ]
-      return handleCORS(NextResponse.json({ data: MOCK_ARTICLES }))
+  try {
+    const result = await bulkWriteGames({ upsert: [...bySlug.values()], deleteIds })
+    if (result.incomplete) {
+      return NextResponse.json({
+        error: "New games need title, category and downloadUrl",
+        slugs: result.incomplete
+      }, { status: 400 })
     }
 
-    // Mock single game detail
-    if (route.startsWith('/strapi/games/') && method === 'GET') {
-      const slug = route.split('/strapi/games/')[1]
-      
+    const { deleted, updated, created } = result
+    invalidateGames(...deleted, ...updated.flatMap(({ game, previous }) => [previous, game]), ...created)
+    revalidateGamePages(...deleted, ...updated.map(({ game }) => game), ...created)
+
+    const written = new Set([...updated.map(({ game }) => game.slug), ...created.map(game => game.slug)])
+    return NextResponse.json({
+      message: "Bulk import applied",
+      created: created.map(game => ({ id: game.id, slug: game.slug })),
+      updated: updated.map(({ game }) => ({ id: game.id, slug: game.slug })),
+      // Slugs another writer created while this import ran
+      skipped: [...bySlug.keys()].filter(slug => !written.has(slug)),
+      deleted: deleted.map(game => game.id)
+    })
+  } catch (error) {
+    console.error('Bulk import error:', error)
+    return NextResponse.json(
+      { error: "Failed to apply bulk import" },
+      { status: 500 }
+    )
+  }
+}
+
+const EXPORT_COLUMNS = Object.keys(GAME_FIELDS)
+
+function csvValue(value) {
+  if (value === null || value === undefined) {
+    return ''
+  }
+  const text = value instanceof Date ? value.toISOString() : String(value)
+  return /[",\r\n]/.test(text) ? `"${text.replace(/"/g, '""')}"` : text
+}
+
+// Export the full catalog (admin only) as CSV or NDJSON (?format=), read in
+// id-ordered batches and streamed so memory stays flat
+async function adminExportGames({ url }) {
+  const format = url.searchParams.get('format') === 'ndjson' ? 'ndjson' : 'csv'
+  const encoder = new TextEncoder()
+  const batches = iterateGames()
+  let headerSent = format !== 'csv'
+
+  const stream = new ReadableStream({
+    async pull(controller) {
       try {
-        const game = await getGameBySlug(slug)
-        if (!game) {
-          return handleCORS(NextResponse.json(
-            { error: "Game not found" }, 
-            { status: 404 }
-          ))
+        let chunk = ''
+        if (!headerSent) {
+          chunk += EXPORT_COLUMNS.join(',') + '\n'
+          headerSent = true
+        }
+        const { value: rows, done } = await batches.next()
+        if (done) {
+          if (chunk) {
+            controller.enqueue(encoder.encode(chunk))
+          }
+          controller.close()
+          return
         }
-        
-        const transformedGame = {
-          id: game.id,
-          documentId: game.document_id || `game-${game.id}`,
-          title: game.title,
-          description: game.description,
-          category: game.category,
-          downloadUrl: game.download_url,
-          slug: game.slug,
-          featured: game.featured,
-          downloads: game.downloads,
-          bannerImage: { url: `https://images.unsplash.com/photo-1542751371-adc38448a05e?w=800&h=450&fit=crop` },
-          createdAt: game.created_at,
-          updatedAt: game.updated_at
+        for (const row of rows) {
+          const game = Object.fromEntries(EXPORT_COLUMNS.map(field => [field, row[GAME_FIELDS[field]]]))
+          chunk += format === 'csv'
+            ? EXPORT_COLUMNS.map(field => csvValue(game[field])).join(',') + '\n'
+            : JSON.stringify(game) + '\n'
         }
-        
-        return handleCORS(NextResponse.json({ data: transformedGame }))
+        controller.enqueue(encoder.encode(chunk))
       } catch (error) {
-        return handleCORS(NextResponse.json(
-          { error: "Failed to fetch game" },
-          { status: 500 }
-        ))
+        console.error('Export error:', error)
+        controller.error(error)
       }
+    },
+    async cancel() {
+      await batches.return()
     }
+  })
 
-    // =================================
-    // LEGACY MONGODB ROUTES
-    // =================================
-    
-    // Original MongoDB routes
-    const db = await connectToMongo()
-
-    // Root endpoint - GET /api/root
-    if (route === '/root' && method === 'GET') {
-      return handleCORS(NextResponse.json({ message: "Hello World" }))
-    }
-    // Root endpoint - GET /api/
-    if (route === '/' && method === 'GET') {
-      return handleCORS(NextResponse.json({ message: "Hello World" }))
+  return new NextResponse(stream, {
+    headers: {
+      'Content-Type': format === 'csv' ? 'text/csv; charset=utf-8' : 'application/x-ndjson; charset=utf-8',
+      'Content-Disposition': `attachment; filename="games.${format === 'csv' ? 'csv' : 'ndjson'}"`
     }
+  })
+}
 
-    // Status endpoints - POST /api/status
-    if (route === '/status' && method === 'POST') {
-      const body = await request.json()
-      
-      if (!body.client_name) {
-        return handleCORS(NextResponse.json(
-          { error: "client_name is required" }, 
-          { status: 400 }
-        ))
-      }
+// Runtime data-layer stats for admin
+async function adminStats() {
+  return NextResponse.json({
+    pool: getPoolStats(),
+    gamesCache: gamesCache.stats(),
+    downloads: getDownloadStats(),
+    mongo: getMongoHealth(),
+    auth: { tokenCache: getTokenCacheStats(), hasher: getHasherStats() },
+    imageCache: await getImageCacheStats()
+  })
+}
+
+// Constant-time bearer token check; hashing first evens out the lengths
+function hasBearer(request, secret) {
+  const digest = (value) => createHash('sha256').update(value).digest()
+  return timingSafeEqual(digest(request.headers.get('authorization') || ''), digest(`Bearer ${secret}`))
+}
+
+// Prometheus scrape target - GET /api/metrics. When METRICS_TOKEN is set
+// the scraper must send it as a bearer token.
+async function metrics({ request }) {
+  const token = process.env.METRICS_TOKEN
+  if (token && !hasBearer(request, token)) {
+    return NextResponse.json(
+      { error: "Unauthorized" },
+      { status: 401 }
+    )
+  }
+  return new NextResponse(renderMetrics(), {
+    headers: { 'Content-Type': 'text/plain; version=0.0.4; charset=utf-8' }
+  })
+}
+
+// CMS sync - POST /api/webhooks/strapi, sent by game-catalog-cms when a
+// published game or article changes: { event, model, entry, previous }.
+// Both versions are invalidated so renamed slugs and moved categories
+// drop their old pages too.
+async function strapiWebhook({ request }) {
+  const secret = process.env.STOREFRONT_WEBHOOK_SECRET
+  if (!secret) {
+    return NextResponse.json(
+      { error: "Webhook not configured" },
+      { status: 503 }
+    )
+  }
+  if (!hasBearer(request, secret)) {
+    return NextResponse.json(
+      { error: "Unauthorized" },
+      { status: 401 }
+    )
+  }
+
+  let payload
+  try {
+    payload = await request.json()
+  } catch (error) {
+    return NextResponse.json({ error: "Invalid JSON body" }, { status: 400 })
+  }
 
-      const statusObj = {
-        id: uuidv4(),
-        client_name: body.client_name,
-        timestamp: new Date()
+  const { model, entry = null, previous = null } = payload || {}
+  if (model === 'game') {
+    const removed = invalidateGames(previous, entry)
+    revalidateGamePages(previous, entry)
+    return NextResponse.json({ received: true, invalidated: removed })
+  }
+  if (model === 'article') {
+    const removed = invalidateArticles(previous, entry)
+    revalidateArticlePages(previous, entry)
+    return NextResponse.json({ received: true, invalidated: removed })
+  }
+  return NextResponse.json({ error: "Unknown model" }, { status: 400 })
+}
+
+// =================================
+// LEGACY STRAPI-STYLE ROUTES (for backwards compatibility)
+// =================================
+
+// Mock Strapi Games API
+async function strapiListGames({ request, url }) {
+  const page = readPageParams(url)
+  if (page.error) {
+    return NextResponse.json({ error: page.error }, { status: 400 })
+  }
+
+  try {
+    return encodedResponse(request, await loadGameList(url, page))
+  } catch (error) {
+    console.error('Database error:', error)
+    // Serve the offline catalog if the database is down
+    const games = await fallbackGames()
+    return NextResponse.json({
+      data: games.map(game => pickFields(toGameView(game), page.fields)),
+      meta: { pagination: { limit: page.limit, nextCursor: null } }
+    })
+  }
+}
+
+// =================================
+// LEGACY MONGODB ROUTES
+// =================================
+
+// Root endpoint - GET /api/root and GET /api/
+async function helloWorld() {
+  return NextResponse.json({ message: "Hello World" })
+}
+
+// Status endpoints - POST /api/status
+async function createStatus({ request }) {
+  const body = await request.json()
+  const { check, error } = toStatusCheck(body)
+  if (error) {
+    return NextResponse.json(
+      { error },
+      { status: 400 }
+    )
+  }
+
+  await enqueueStatusCheck(check)
+  return NextResponse.json(check)
+}
+
+// Read a bulk body: a JSON array (or { items: [...] }), or NDJSON with one
+// check per line. Lines that fail to parse become per-item errors.
+async function readBulkItems(request) {
+  const contentType = request.headers.get('content-type') || ''
+  if (contentType.includes('ndjson')) {
+    const text = await request.text()
+    return text.split('\n').filter(line => line.trim()).map((line) => {
+      try {
+        return JSON.parse(line)
+      } catch (error) {
+        return { __invalid: "Invalid JSON" }
       }
+    })
+  }
+  const body = await request.json()
+  const items = Array.isArray(body) ? body : body?.items
+  return Array.isArray(items) ? items : null
+}
 
-      await db.collection('status_checks').insertOne(statusObj)
-      return handleCORS(NextResponse.json(statusObj))
+// Status endpoints - POST /api/status/bulk
+async function createStatusBulk({ request }) {
+  let items
+  try {
+    items = await readBulkItems(request)
+  } catch (error) {
+    items = null
+  }
+  if (!items) {
+    return NextResponse.json(
+      { error: "Expected a JSON array of status checks or NDJSON" },
+      { status: 400 }
+    )
+  }
+  if (items.length > MAX_BULK_ITEMS) {
+    return NextResponse.json(
+      { error: `At most ${MAX_BULK_ITEMS} status checks per request` },
+      { status: 413 }
+    )
+  }
+
+  const results = items.map((item, index) => {
+    if (item?.__invalid) {
+      return { index, status: 'error', error: item.__invalid }
     }
+    const { check, error } = toStatusCheck(item)
+    return error ? { index, status: 'error', error } : { index, status: 'created', check }
+  })
 
-    // Status endpoints - GET /api/status
-    if (route === '/status' && method === 'GET') {
-      const statusChecks = await db.collection('status_checks')
-        .find({})
-        .limit(1000)
-        .toArray()
-
-      // Remove MongoDB's _id field from response
-      const cleanedStatusChecks = statusChecks.map(({ _id, ...rest }) => rest)
-      
-      return handleCORS(NextResponse.json(cleanedStatusChecks))
+  const valid = results.filter(result => result.check)
+  const failed = valid.length > 0 ? await insertStatusChecks(valid.map(result => result.check)) : new Map()
+  valid.forEach((result, position) => {
+    if (failed.has(position)) {
+      result.status = 'error'
+      result.error = failed.get(position)
+      delete result.check
     }
+  })
+
+  const inserted = results.filter(result => result.status === 'created').length
+  return NextResponse.json({
+    inserted,
+    failed: results.length - inserted,
+    results: results.map(({ check, ...result }) => check ? { ...result, id: check.id, timestamp: check.timestamp } : result)
+  })
+}
+
+// Status endpoints - GET /api/status
+// ?since=&until=&client_name= select a time range, newest first unless
+// order=asc. JSON responses are paginated with cursor/limit; NDJSON
+// (?format=ndjson or Accept: application/x-ndjson) streams the whole range.
+async function listStatus({ request, url }) {
+  const statusQuery = parseStatusQuery(url)
+  if (statusQuery.error) {
+    return NextResponse.json({ error: statusQuery.error }, { status: 400 })
+  }
+
+  const wantsNdjson = url.searchParams.get('format') === 'ndjson' ||
+    (request.headers.get('accept') || '').includes('application/x-ndjson')
+  if (wantsNdjson) {
+    const stream = await streamStatusChecks(statusQuery)
+    return new NextResponse(stream, {
+      headers: { 'Content-Type': 'application/x-ndjson; charset=utf-8' }
+    })
+  }
+
+  const limit = parseLimit(url.searchParams.get('limit')) || 100
+  const { rows, nextCursor } = await listStatusChecks(statusQuery, limit)
+  return NextResponse.json({
+    data: rows,
+    meta: { pagination: { limit, nextCursor } }
+  })
+}
+
+// =================================
+// ROUTE TABLE
+// =================================
+
+const router = createRouter({ middleware: [timing, cors] })
+  .post('/admin/login', adminLogin, { use: [noStore] })
+  .post('/admin/register', adminRegister, { use: [noStore] })
+
+  .get('/games', listGames, cached('list'))
+  .get('/games/:slug', getGame, cached('detail'))
+  .post('/games/:slug/download', downloadGame, { use: [noStore] })
+  .get('/search/suggest', suggest, cached('list'))
+  .get('/trending', listTrending, cached('list'))
+  .get('/facets/categories', listCategoryFacets, cached('list'))
+  .get('/images/:variant', serveImage, cached('immutable'))
+  .get('/articles', listArticles, cached('list'))
+  .get('/articles/:slug', getArticle, cached('detail'))
+
+  .get('/admin/games', adminListGames, adminOnly)
+  .post('/admin/games', adminCreateGame, adminOnly)
+  .post('/admin/games/bulk', adminBulkGames, adminOnly)
+  .get('/admin/games/export', adminExportGames, adminOnly)
+  .put('/admin/games/:id(int)', adminUpdateGame, adminOnly)
+  .patch('/admin/games/:id(int)', adminPatchGame, adminOnly)
+  .delete('/admin/games/:id(int)', adminDeleteGame, adminOnly)
+  .get('/admin/stats', adminStats, adminOnly)
+  .get('/metrics', metrics, { use: [noStore] })
+  .post('/webhooks/strapi', strapiWebhook, { use: [noStore] })
+
+  .get('/strapi/games', strapiListGames, cached('list'))
+  .get('/strapi/games/:slug', getGame, cached('detail'))
+  .get('/strapi/articles', listArticles, cached('list'))
+  .get('/strapi/articles/:slug', getArticle, cached('detail'))
+
+  .get('/', helloWorld)
+  .get('/root', helloWorld)
+  .post('/status', createStatus, usesMongo)
+  .post('/status/bulk', createStatusBulk, usesMongo)
+  .get('/status', listStatus, usesMongo)
+
+// OPTIONS handler for CORS
+export async function OPTIONS() {
+  return handleCORS(new NextResponse(null, { status: 200 }))
+}
+
+// Route handler function
+async function handleRoute(request, { params }) {
+  const { path = [] } = params
+  const route = `/${path.join('/')}`
+  const method = request.method
+
+  try {
+    // Next.js has already decoded the segments
+    const matched = router.match(method, path)
 
     // Route not found
-    return handleCORS(NextResponse.json(
-      { error: `Route ${route} not found` }, 
-      { status: 404 }
-    ))
+    if (!matched) {
+      return handleCORS(NextResponse.json(
+        { error: `Route ${route} not found` },
+        { status: 404 }
+      ))
+    }
+
+    if (!matched.handler) {
+      const response = NextResponse.json(
+        { error: `Method ${method} not allowed for ${route}` },
+        { status: 405 }
+      )
+      response.headers.set('Allow', [...matched.allowed, 'OPTIONS'].join(', '))
+      return handleCORS(response)
+    }
 
+    return await matched.handler({
+      request,
+      url: new URL(request.url),
+      route: matched.pattern,
+      params: matched.params
+    })
   } catch (error) {
     console.error('API Error:', error)
     return handleCORS(NextResponse.json(
-      { error: "Internal server error" }, 
+      { error: "Internal server error" },
       { status: 500 }
     ))
   }
@@ -463,4 +1119,4 @@ export const GET = handleRoute
 export const POST = handleRoute
 export const PUT = handleRoute
 export const DELETE = handleRoute
-export const PATCH = handleRoute
\ No newline at end of file
+export const PATCH = handleRoute
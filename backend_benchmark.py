@@ -0,0 +1,354 @@
+#!/usr/bin/env python3
+"""
+Backend API Load Benchmark
+Drives the endpoints exercised by the backend test scripts concurrently and
+reports latency percentiles, throughput and error rate as JSON
+
+Run against a local server seeded with seed-strapi-db.js:
+
+    python3 backend_benchmark.py --concurrency 50 --duration 30 --output run.json
+    python3 backend_benchmark.py --compare baseline.json run.json
+
+The admin/login scenario is throttled by the server's login rate limit;
+start the server with LOGIN_MAX_ATTEMPTS_PER_EMAIL and
+LOGIN_MAX_ATTEMPTS_PER_IP raised to measure it, otherwise most requests
+come back 429 and count as errors.
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import ssl
+import subprocess
+import sys
+import time
+from contextlib import redirect_stdout
+from datetime import datetime, timezone
+from urllib.parse import urlsplit
+
+# backend_test reports its .env lookup on import; keep stdout for the JSON
+with redirect_stdout(sys.stderr):
+    from backend_test import ADMIN_EMAIL, ADMIN_PASSWORD
+    from comprehensive_backend_test import LOCAL_ENDPOINTS
+
+DEFAULT_BASE_URL = "http://localhost:3000/api"
+
+# Scenarios use test_api_endpoint's arguments: (endpoint, method,
+# expected_status, description, data)
+GAME_SCENARIOS = [
+    ("games", "GET", 200, "Get all games from PostgreSQL", None),
+    ("games?featured=true", "GET", 200, "Get featured games from PostgreSQL", None),
+    ("games?search=wukong", "GET", 200, "Search for 'wukong' in database", None),
+    ("games?category=Action", "GET", 200, "Get Action category games from database", None),
+    ("games/wukong", "GET", 200, "Get individual game by slug from database", None),
+    ("trending", "GET", 200, "Get trending games", None),
+    ("search/suggest?q=wu", "GET", 200, "Search suggestions", None),
+]
+
+ADMIN_SCENARIOS = [
+    ("admin/login", "POST", 200, "Admin login",
+     {"email": ADMIN_EMAIL, "password": ADMIN_PASSWORD}),
+]
+
+SCENARIOS = (
+    GAME_SCENARIOS
+    + [(endpoint, "GET", 200, description, None) for endpoint, description in LOCAL_ENDPOINTS]
+    + ADMIN_SCENARIOS
+)
+
+
+class Connection:
+    """One keep-alive HTTP/1.1 connection (the benchmark's pool holds one
+    per concurrent worker)"""
+
+    def __init__(self, host, port, use_ssl):
+        self.host = host
+        self.port = port
+        self.ssl = ssl.create_default_context() if use_ssl else None
+        self.reader = None
+        self.writer = None
+
+    async def open(self):
+        self.reader, self.writer = await asyncio.open_connection(self.host, self.port, ssl=self.ssl)
+
+    async def close(self):
+        if self.writer:
+            self.writer.close()
+            try:
+                await self.writer.wait_closed()
+            except OSError:
+                pass
+        self.reader = self.writer = None
+
+    async def request(self, method, target, body=None, headers=None):
+        """Send a request and read the whole response; returns (status, bytes)"""
+        if self.writer is None:
+            await self.open()
+        lines = [
+            f"{method} {target} HTTP/1.1",
+            f"Host: {self.host}:{self.port}",
+            "Connection: keep-alive",
+            "Accept: application/json",
+            "Accept-Encoding: identity",
+        ]
+        for name, value in (headers or {}).items():
+            lines.append(f"{name}: {value}")
+        if body is not None:
+            lines.append("Content-Type: application/json")
+            lines.append(f"Content-Length: {len(body)}")
+        self.writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1") + (body or b""))
+        await self.writer.drain()
+
+        status_line = await self.reader.readline()
+        if not status_line:
+            raise ConnectionError("Connection closed by server")
+        status = int(status_line.split()[1])
+        response_headers = {}
+        while True:
+            line = await self.reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            response_headers[name.strip().lower()] = value.strip()
+
+        if status in (204, 304) or method == "HEAD":
+            payload = b""
+        elif response_headers.get("transfer-encoding", "").lower() == "chunked":
+            payload = await self._read_chunked()
+        elif "content-length" in response_headers:
+            payload = await self.reader.readexactly(int(response_headers["content-length"]))
+        else:
+            payload = await self.reader.read()
+            await self.close()
+            return status, payload
+
+        if response_headers.get("connection", "").lower() == "close":
+            await self.close()
+        return status, payload
+
+    async def _read_chunked(self):
+        chunks = []
+        while True:
+            size = int((await self.reader.readline()).split(b";")[0], 16)
+            if size == 0:
+                # Trailers, then the blank line
+                while (await self.reader.readline()) not in (b"\r\n", b"\n", b""):
+                    pass
+                return b"".join(chunks)
+            chunks.append(await self.reader.readexactly(size))
+            await self.reader.readexactly(2)
+
+
+def percentile(sorted_values, fraction):
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return None
+    rank = max(1, math.ceil(fraction * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def summarize(samples, statuses, errors, elapsed):
+    latencies = sorted(samples)
+    total = len(latencies)
+    to_ms = lambda value: round(value * 1000, 2) if value is not None else None
+    return {
+        "requests": total,
+        "errors": errors,
+        "error_rate": round(errors / total, 4) if total else 0,
+        "throughput_rps": round(total / elapsed, 2) if elapsed else 0,
+        "latency_ms": {
+            "min": to_ms(latencies[0] if latencies else None),
+            "mean": to_ms(sum(latencies) / total if total else None),
+            "p50": to_ms(percentile(latencies, 0.50)),
+            "p95": to_ms(percentile(latencies, 0.95)),
+            "p99": to_ms(percentile(latencies, 0.99)),
+            "max": to_ms(latencies[-1] if latencies else None),
+        },
+        "status_codes": {str(code): count for code, count in sorted(statuses.items(), key=lambda item: str(item[0]))},
+    }
+
+
+async def run_scenario(base_url, scenario, concurrency, rate, duration, max_requests, timeout):
+    """Run one scenario with `concurrency` workers for `duration` seconds
+    (or until `max_requests`). With a target `rate`, requests are sent on a
+    fixed schedule and latency is measured from the scheduled send time, so
+    a slow server is not hidden by workers backing off."""
+    endpoint, method, expected_status, _description, data = scenario
+    parts = urlsplit(base_url.rstrip("/") + "/" + endpoint)
+    use_ssl = parts.scheme == "https"
+    port = parts.port or (443 if use_ssl else 80)
+    target = parts.path + (f"?{parts.query}" if parts.query else "")
+    body = json.dumps(data).encode() if data is not None else None
+
+    samples = []
+    statuses = {}
+    errors = 0
+    issued = 0
+    started = time.perf_counter()
+    deadline = started + duration
+    interval = 1.0 / rate if rate else 0
+
+    def next_slot():
+        nonlocal issued
+        if max_requests and issued >= max_requests:
+            return None
+        scheduled = started + issued * interval if interval else time.perf_counter()
+        if scheduled >= deadline:
+            return None
+        issued += 1
+        return scheduled
+
+    async def worker():
+        nonlocal errors
+        connection = Connection(parts.hostname, port, use_ssl)
+        try:
+            while True:
+                scheduled = next_slot()
+                if scheduled is None:
+                    return
+                delay = scheduled - time.perf_counter()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                sent = scheduled if interval else time.perf_counter()
+                try:
+                    status, _ = await asyncio.wait_for(connection.request(method, target, body), timeout)
+                except (OSError, asyncio.TimeoutError, asyncio.IncompleteReadError, ValueError, IndexError) as error:
+                    await connection.close()
+                    status = type(error).__name__
+                samples.append(time.perf_counter() - sent)
+                statuses[status] = statuses.get(status, 0) + 1
+                if status != expected_status:
+                    errors += 1
+        finally:
+            await connection.close()
+
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return summarize(samples, statuses, errors, time.perf_counter() - started)
+
+
+def verify_scenarios(base_url, scenarios):
+    """One blocking pass through test_api_endpoint, so a broken endpoint is
+    reported before it is measured"""
+    import backend_test
+    backend_test.BASE_URL = base_url
+    failures = []
+    for endpoint, method, expected_status, description, data in scenarios:
+        response, _ = backend_test.test_api_endpoint(
+            endpoint, method=method, expected_status=expected_status,
+            description=description, data=data)
+        if response is None or response.status_code != expected_status:
+            failures.append(endpoint)
+    return failures
+
+
+def git_revision():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+                              text=True, check=True, cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(baseline_path, current_path):
+    """Print per-scenario changes between two result files"""
+    with open(baseline_path) as f:
+        baseline = json.load(f)["scenarios"]
+    with open(current_path) as f:
+        current = json.load(f)["scenarios"]
+
+    def change(before, after):
+        if not before or after is None:
+            return "n/a"
+        return f"{(after - before) / before * 100:+.1f}%"
+
+    print(f"{'scenario':<40} {'p50':>9} {'p95':>9} {'p99':>9} {'rps':>9} {'errors':>9}")
+    for name, result in current.items():
+        before = baseline.get(name)
+        if not before:
+            print(f"{name:<40} (not in baseline)")
+            continue
+        print(f"{name:<40} "
+              f"{change(before['latency_ms']['p50'], result['latency_ms']['p50']):>9} "
+              f"{change(before['latency_ms']['p95'], result['latency_ms']['p95']):>9} "
+              f"{change(before['latency_ms']['p99'], result['latency_ms']['p99']):>9} "
+              f"{change(before['throughput_rps'], result['throughput_rps']):>9} "
+              f"{result['error_rate'] - before['error_rate']:>+9.4f}")
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--base-url", default=os.environ.get("BENCHMARK_BASE_URL", DEFAULT_BASE_URL))
+    parser.add_argument("--concurrency", type=int, default=20, help="concurrent connections per scenario")
+    parser.add_argument("--rate", type=float, default=0, help="target requests/second per scenario (0 = as fast as possible)")
+    parser.add_argument("--duration", type=float, default=15, help="seconds per scenario")
+    parser.add_argument("--requests", type=int, default=0, help="stop each scenario after this many requests")
+    parser.add_argument("--timeout", type=float, default=10, help="per-request timeout in seconds")
+    parser.add_argument("--warmup", type=float, default=2, help="unmeasured seconds per scenario before the run")
+    parser.add_argument("--scenario", action="append", help="only run endpoints containing this text (repeatable)")
+    parser.add_argument("--skip-verify", action="store_true", help="skip the test_api_endpoint pass")
+    parser.add_argument("--output", help="write the JSON report here instead of stdout")
+    parser.add_argument("--compare", nargs=2, metavar=("BASELINE", "CURRENT"), help="compare two reports and exit")
+    return parser.parse_args()
+
+
+async def run(args, scenarios):
+    results = {}
+    for scenario in scenarios:
+        name = f"{scenario[1]} {scenario[0]}"
+        if args.warmup > 0:
+            await run_scenario(args.base_url, scenario, args.concurrency, args.rate, args.warmup, 0, args.timeout)
+        print(f"Benchmarking {name} ...", file=sys.stderr)
+        results[name] = await run_scenario(args.base_url, scenario, args.concurrency, args.rate,
+                                           args.duration, args.requests, args.timeout)
+        summary = results[name]
+        print(f"   p50 {summary['latency_ms']['p50']} ms, p99 {summary['latency_ms']['p99']} ms, "
+              f"{summary['throughput_rps']} req/s, error rate {summary['error_rate']}", file=sys.stderr)
+    return results
+
+
+def main():
+    args = parse_args()
+    if args.compare:
+        compare(*args.compare)
+        return True
+
+    scenarios = [s for s in SCENARIOS if not args.scenario or any(text in s[0] for text in args.scenario)]
+    if not scenarios:
+        print("❌ No scenarios match", file=sys.stderr)
+        return False
+
+    if not args.skip_verify:
+        # test_api_endpoint prints its report; keep stdout for the JSON
+        with redirect_stdout(sys.stderr):
+            failures = verify_scenarios(args.base_url, scenarios)
+        if failures:
+            print(f"⚠️  Unexpected responses before load from: {', '.join(failures)}", file=sys.stderr)
+
+    report = {
+        "meta": {
+            "base_url": args.base_url,
+            "started_at": datetime.now(timezone.utc).isoformat(),
+            "git_revision": git_revision(),
+            "concurrency": args.concurrency,
+            "rate": args.rate or None,
+            "duration_s": args.duration,
+            "max_requests": args.requests or None,
+        },
+        "scenarios": asyncio.run(run(args, scenarios)),
+    }
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output + "\n")
+        print(f"✅ Report written to {args.output}", file=sys.stderr)
+    else:
+        print(output)
+    return all(result["error_rate"] == 0 for result in report["scenarios"].values())
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
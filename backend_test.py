@@ -313,7 +313,7 @@ def main():
         new_game_data = {
             "title": "Test Game for API Testing",
             "description": "A test game created during API testing",
-            "category": "Test",
+            "category": "Action",
             "downloadUrl": "https://example.com/test-game.zip",
             "slug": "test-game-api-testing",
             "featured": False,
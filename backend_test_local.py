@@ -156,7 +156,7 @@ def main():
         new_game_data = {
             "title": "Local Test Game",
             "description": "A test game created during local testing",
-            "category": "Test",
+            "category": "Action",
             "downloadUrl": "https://example.com/local-test.zip",
             "slug": "local-test-game",
             "featured": False,
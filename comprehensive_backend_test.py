@@ -9,6 +9,21 @@ import json
 import sys
 import subprocess
 
+# Public endpoints checked against the local server (also the scenarios
+# for backend_benchmark.py)
+LOCAL_ENDPOINTS = [
+    ("strapi/games", "Get all games"),
+    ("strapi/games?featured=true", "Get featured games"),
+    ("strapi/games?search=wukong", "Search for wukong"),
+    ("strapi/games?category=Action", "Get Action games"),
+    ("facets/categories?search=war", "Get category facets for a search"),
+    ("strapi/articles", "Get articles"),
+    ("strapi/articles?tag=Gaming&limit=2", "Get articles tagged Gaming"),
+    ("strapi/articles/gaming-trends-2025", "Get individual article"),
+    ("strapi/games/wukong", "Get individual game"),
+    ("root", "Test root endpoint")
+]
+
 def test_local_endpoints():
     """Test all endpoints locally"""
     print("🔍 Testing Local Endpoints (localhost:3000)")
@@ -17,17 +32,7 @@ def test_local_endpoints():
     base_url = "http://localhost:3000/api"
     test_results = []
     
-    endpoints = [
-        ("strapi/games", "Get all games"),
-        ("strapi/games?featured=true", "Get featured games"),
-        ("strapi/games?search=wukong", "Search for wukong"),
-        ("strapi/games?category=Action", "Get Action games"),
-        ("strapi/articles", "Get articles"),
-        ("strapi/games/wukong", "Get individual game"),
-        ("root", "Test root endpoint")
-    ]
-    
-    for endpoint, description in endpoints:
+    for endpoint, description in LOCAL_ENDPOINTS:
         url = f"{base_url}/{endpoint}"
         try:
             response = requests.get(url, timeout=5)
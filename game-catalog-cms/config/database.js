@@ -9,9 +9,11 @@ module.exports = ({ env }) => ({
       password: env('DATABASE_PASSWORD', 'secure_password_123'),
       schema: env('DATABASE_SCHEMA', 'public'),
     },
+    // The storefront reads the catalog through its own pool (and replica),
+    // so the CMS only carries editorial traffic
     pool: {
-      min: env.int('DATABASE_POOL_MIN', 2),
-      max: env.int('DATABASE_POOL_MAX', 10),
+      min: env.int('DATABASE_POOL_MIN', 0),
+      max: env.int('DATABASE_POOL_MAX', 5),
     },
     debug: false,
   },
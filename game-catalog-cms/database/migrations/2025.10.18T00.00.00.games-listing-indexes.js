@@ -0,0 +1,39 @@
+'use strict';
+
+/**
+ * Indexes backing the storefront's keyset-paginated game listings
+ * (ORDER BY downloads DESC, id DESC and created_at DESC, id DESC).
+ */
+
+module.exports = {
+  async up(knex) {
+    // On a fresh database Strapi runs migrations before its schema sync
+    // creates games; run `node migrate-db.js` again once it exists
+    const { rows } = await knex.raw("SELECT to_regclass('games') IS NOT NULL AS present");
+    if (!rows[0].present) {
+      return;
+    }
+
+    await knex.raw(`
+      CREATE INDEX IF NOT EXISTS games_published_downloads_idx
+      ON games (downloads DESC, id DESC)
+      WHERE published_at IS NOT NULL
+    `);
+    await knex.raw(`
+      CREATE INDEX IF NOT EXISTS games_published_category_downloads_idx
+      ON games (category, downloads DESC, id DESC)
+      WHERE published_at IS NOT NULL
+    `);
+    await knex.raw(`
+      CREATE INDEX IF NOT EXISTS games_published_created_at_idx
+      ON games (created_at DESC, id DESC)
+      WHERE published_at IS NOT NULL
+    `);
+  },
+
+  async down(knex) {
+    await knex.raw('DROP INDEX IF EXISTS games_published_downloads_idx');
+    await knex.raw('DROP INDEX IF EXISTS games_published_category_downloads_idx');
+    await knex.raw('DROP INDEX IF EXISTS games_published_created_at_idx');
+  },
+};
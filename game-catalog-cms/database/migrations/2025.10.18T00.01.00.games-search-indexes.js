@@ -0,0 +1,42 @@
+'use strict';
+
+/**
+ * Full-text and trigram indexes for storefront game search.
+ *
+ * The tsvector expression must match SEARCH_DOCUMENT in the Next.js app's
+ * lib/db.js exactly, or the planner will not use the GIN index. It is an
+ * expression index rather than a stored column so Strapi's schema sync
+ * never sees a column it does not know about.
+ *
+ * pg_trgm needs CREATE privilege on the database; if the Strapi user lacks
+ * it, run `CREATE EXTENSION pg_trgm;` once as a superuser first.
+ */
+
+module.exports = {
+  async up(knex) {
+    // On a fresh database Strapi runs migrations before its schema sync
+    // creates games; run `node migrate-db.js` again once it exists
+    const { rows } = await knex.raw("SELECT to_regclass('games') IS NOT NULL AS present");
+    if (!rows[0].present) {
+      return;
+    }
+
+    await knex.raw('CREATE EXTENSION IF NOT EXISTS pg_trgm');
+    await knex.raw(`
+      CREATE INDEX IF NOT EXISTS games_search_document_idx
+      ON games USING GIN ((
+        setweight(to_tsvector('simple', coalesce(title, '')), 'A') ||
+        setweight(to_tsvector('simple', coalesce(description, '')), 'B')
+      ))
+    `);
+    await knex.raw(`
+      CREATE INDEX IF NOT EXISTS games_title_trgm_idx
+      ON games USING GIN (title gin_trgm_ops)
+    `);
+  },
+
+  async down(knex) {
+    await knex.raw('DROP INDEX IF EXISTS games_search_document_idx');
+    await knex.raw('DROP INDEX IF EXISTS games_title_trgm_idx');
+  },
+};
@@ -0,0 +1,47 @@
+'use strict';
+
+/**
+ * Hourly download counts per game, the aggregate behind the trending
+ * scores. The storefront merges buffered download events into these rows
+ * in batches; rows older than the longest trending window are pruned.
+ *
+ * Rows are keyed by the game's document id rather than its row id: each
+ * publish in Strapi replaces the published row, so the id changes while
+ * the document id stays. There is no foreign key for the same reason;
+ * buckets of deleted games are pruned with the rest.
+ */
+
+module.exports = {
+  async up(knex) {
+    // On a fresh database Strapi runs migrations before its schema sync
+    // creates games; run `node migrate-db.js` again once it exists
+    const { rows } = await knex.raw("SELECT to_regclass('games') IS NOT NULL AS present");
+    if (!rows[0].present) {
+      return;
+    }
+
+    // Games created through the storefront admin API before it assigned
+    // document ids have none; give each one, as Strapi would
+    await knex.raw(`
+      UPDATE games SET document_id = substr(md5(id || clock_timestamp()::text), 1, 24)
+      WHERE document_id IS NULL
+    `);
+
+    await knex.raw(`
+      CREATE TABLE IF NOT EXISTS game_download_buckets (
+        document_id varchar(255) NOT NULL,
+        bucket_start timestamptz NOT NULL,
+        downloads integer NOT NULL DEFAULT 0,
+        PRIMARY KEY (document_id, bucket_start)
+      )
+    `);
+    await knex.raw(`
+      CREATE INDEX IF NOT EXISTS game_download_buckets_bucket_start_idx
+      ON game_download_buckets (bucket_start)
+    `);
+  },
+
+  async down(knex) {
+    await knex.raw('DROP TABLE IF EXISTS game_download_buckets');
+  },
+};
@@ -0,0 +1,54 @@
+'use strict';
+
+/**
+ * One published game per slug, so bulk imports can upsert by slug.
+ * Partial on published rows: Strapi keeps a draft row alongside each
+ * published one with the same slug.
+ *
+ * Published games that already share a slug (older imports, repeated test
+ * runs) would make the index fail, so every duplicate but the oldest is
+ * renamed to "<slug>-<id>" first, draft rows of the same document
+ * included. The renames are logged.
+ */
+
+module.exports = {
+  async up(knex) {
+    // On a fresh database Strapi runs migrations before its schema sync
+    // creates games; run `node migrate-db.js` again once it exists
+    const { rows } = await knex.raw("SELECT to_regclass('games') IS NOT NULL AS present");
+    if (!rows[0].present) {
+      return;
+    }
+
+    const { rows: renamed } = await knex.raw(`
+      WITH duplicates AS (
+        SELECT id, document_id, slug, slug || '-' || id AS new_slug
+        FROM (
+          SELECT id, document_id, slug,
+                 row_number() OVER (PARTITION BY slug ORDER BY id) AS position
+          FROM games
+          WHERE published_at IS NOT NULL
+        ) AS ranked
+        WHERE position > 1
+      )
+      UPDATE games SET slug = duplicates.new_slug
+      FROM duplicates
+      WHERE games.id = duplicates.id
+         OR (games.document_id = duplicates.document_id AND games.published_at IS NULL)
+      RETURNING games.id, duplicates.slug AS old_slug, games.slug
+    `);
+    for (const row of renamed) {
+      console.warn(`games-slug-unique: renamed duplicate slug "${row.old_slug}" to "${row.slug}" (id ${row.id})`);
+    }
+
+    await knex.raw(`
+      CREATE UNIQUE INDEX IF NOT EXISTS games_published_slug_unique_idx
+      ON games (slug)
+      WHERE published_at IS NOT NULL
+    `);
+  },
+
+  async down(knex) {
+    await knex.raw('DROP INDEX IF EXISTS games_published_slug_unique_idx');
+  },
+};
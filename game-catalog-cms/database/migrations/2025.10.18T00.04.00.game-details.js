@@ -0,0 +1,125 @@
+'use strict';
+
+/**
+ * Extended game details (long description, screenshots, rating, version,
+ * requirements) as columns on games, matching the attributes added to the
+ * Strapi game content type. Backfills the details the storefront used to
+ * hard-code for the launch titles; rows that already have details are
+ * left alone.
+ */
+
+const DETAILS = [
+  {
+    slug: 'wukong',
+    full_description: 'Embark on an epic journey as the legendary Monkey King in this stunning action RPG. With incredible combat mechanics, breathtaking visuals, and a rich storyline rooted in Chinese mythology, Wukong delivers an unforgettable gaming experience.\n\nFeatures:\n• Fluid combat system with 72 transformations\n• Stunning visuals powered by Unreal Engine\n• Epic boss battles against mythical creatures\n• Rich storytelling based on Journey to the West\n• Customizable abilities and weapons\n• Immersive world exploration',
+    screenshots: [
+      { url: 'https://images.unsplash.com/photo-1511512578047-dfb367046420' },
+      { url: 'https://images.unsplash.com/photo-1542751371-adc38448a05e' },
+      { url: 'https://images.unsplash.com/photo-1593305841991-05c297ba4575' },
+    ],
+    rating: 4.8,
+    reviews: 892,
+    file_size: '2.6 GB',
+    version: '2.6.5',
+    developer: 'Game Science Studio',
+    release_date: '2024-08-20',
+    requirements: 'Android 8.0+ / iOS 12.0+',
+    languages: ['English', 'Chinese', 'Japanese', 'Korean'],
+  },
+  {
+    slug: 'call-me-champion',
+    full_description: 'Step into the arena and prove yourself in this intense fighting game. With precise controls, diverse fighters, and competitive gameplay, Call Me Champion offers the ultimate fighting experience for mobile devices.\n\nFeatures:\n• 20+ unique fighters with distinct abilities\n• Competitive ranked matches\n• Story mode with epic battles\n• Customizable combos and special moves\n• Online tournaments and events\n• Regular updates with new fighters',
+    screenshots: [
+      { url: 'https://images.unsplash.com/photo-1673350808686-209dc177c898' },
+      { url: 'https://images.unsplash.com/photo-1542751371-adc38448a05e' },
+    ],
+    rating: 4.5,
+    reviews: 654,
+    file_size: '1.8 GB',
+    version: '2.2.2',
+    developer: 'Fighting Studio',
+    release_date: '2024-07-15',
+    requirements: 'Android 7.0+ / iOS 11.0+',
+    languages: ['English', 'Spanish', 'Portuguese'],
+  },
+  {
+    slug: 'civilization',
+    full_description: 'Lead your civilization from ancient times to the modern era in this epic strategy game. Build cities, research technologies, wage wars, and make alliances as you compete to build the greatest civilization in history.\n\nFeatures:\n• Deep strategic gameplay\n• Multiple victory conditions\n• Historical leaders and civilizations\n• Technology tree spanning millennia\n• Diplomatic system\n• World wonders and great people',
+    screenshots: [
+      { url: 'https://images.unsplash.com/photo-1593305841991-05c297ba4575' },
+      { url: 'https://images.unsplash.com/photo-1542751371-adc38448a05e' },
+    ],
+    rating: 4.7,
+    reviews: 1203,
+    file_size: '3.2 GB',
+    version: '1.5.9',
+    developer: 'Strategy Masters',
+    release_date: '2024-06-10',
+    requirements: 'Android 9.0+ / iOS 13.0+',
+    languages: ['English', 'French', 'German', 'Russian'],
+  },
+];
+
+module.exports = {
+  async up(knex) {
+    // On a fresh database Strapi runs migrations before its schema sync
+    // creates games; run `node migrate-db.js` again once it exists
+    const { rows } = await knex.raw("SELECT to_regclass('games') IS NOT NULL AS present");
+    if (!rows[0].present) {
+      return;
+    }
+
+    await knex.raw(`
+      ALTER TABLE games
+        ADD COLUMN IF NOT EXISTS full_description text,
+        ADD COLUMN IF NOT EXISTS screenshots jsonb,
+        ADD COLUMN IF NOT EXISTS rating numeric(10, 2),
+        ADD COLUMN IF NOT EXISTS reviews integer,
+        ADD COLUMN IF NOT EXISTS file_size varchar(255),
+        ADD COLUMN IF NOT EXISTS version varchar(255),
+        ADD COLUMN IF NOT EXISTS developer varchar(255),
+        ADD COLUMN IF NOT EXISTS release_date date,
+        ADD COLUMN IF NOT EXISTS requirements varchar(255),
+        ADD COLUMN IF NOT EXISTS languages jsonb
+    `);
+
+    // Inlined as a literal: knex and migrate-db.js use different
+    // placeholder syntax
+    const details = JSON.stringify(DETAILS).replace(/'/g, "''");
+    await knex.raw(`
+      UPDATE games SET
+        full_description = d.full_description,
+        screenshots = d.screenshots,
+        rating = d.rating,
+        reviews = d.reviews,
+        file_size = d.file_size,
+        version = d.version,
+        developer = d.developer,
+        release_date = d.release_date,
+        requirements = d.requirements,
+        languages = d.languages
+      FROM jsonb_to_recordset('${details}'::jsonb) AS d(
+        slug text, full_description text, screenshots jsonb, rating numeric,
+        reviews integer, file_size text, version text, developer text,
+        release_date date, requirements text, languages jsonb
+      )
+      WHERE games.slug = d.slug AND games.full_description IS NULL
+    `);
+  },
+
+  async down(knex) {
+    await knex.raw(`
+      ALTER TABLE games
+        DROP COLUMN IF EXISTS full_description,
+        DROP COLUMN IF EXISTS screenshots,
+        DROP COLUMN IF EXISTS rating,
+        DROP COLUMN IF EXISTS reviews,
+        DROP COLUMN IF EXISTS file_size,
+        DROP COLUMN IF EXISTS version,
+        DROP COLUMN IF EXISTS developer,
+        DROP COLUMN IF EXISTS release_date,
+        DROP COLUMN IF EXISTS requirements,
+        DROP COLUMN IF EXISTS languages
+    `);
+  },
+};
@@ -0,0 +1,348 @@
+'use strict';
+
+/**
+ * Storefront reads of published articles: columns for the fields the
+ * lifecycles fill in at publish time (rendered body, reading time) plus
+ * category, and indexes for the newest-first keyset listing and the tag
+ * and category filters. Seeds the launch articles the storefront used to
+ * bundle; slugs that already exist are left alone.
+ *
+ * Strapi creates the articles table itself on first boot, after
+ * migrations have run, so this is a no-op until then; run
+ * `node migrate-db.js` again once the CMS has started.
+ */
+
+const { renderMarkdown } = require('../../src/utils/render-article');
+
+const ARTICLES = [
+  {
+    title: 'Top Gaming Trends to Watch in 2025',
+    excerpt: 'Discover the latest trends shaping the gaming industry this year, from AI-powered NPCs to immersive virtual worlds that are changing how we play.',
+    content: `# The Gaming Industry is Evolving Rapidly
+
+The gaming industry continues to evolve at breakneck speed, with 2025 bringing exciting new developments that are reshaping how we play, interact, and experience digital entertainment. From artificial intelligence revolutionizing game design to cloud gaming making high-end titles accessible anywhere, this year promises to be transformative for gamers worldwide.
+
+## AI-Powered Game Development
+
+One of the most significant trends we're seeing is the integration of artificial intelligence in game development. AI is no longer just powering NPCs with better decision-making capabilities – it's fundamentally changing how games are created, balanced, and experienced.
+
+**Key developments include:**
+- Procedural content generation using machine learning
+- Dynamic difficulty adjustment based on player behavior  
+- Real-time narrative adaptation
+- AI-driven quality assurance and bug detection
+
+## Cloud Gaming Goes Mainstream
+
+Cloud gaming has finally reached a tipping point in 2025. With improved internet infrastructure and more powerful data centers, playing AAA games on any device is becoming a reality for millions of players.
+
+**Major platforms leading the charge:**
+- Google Stadia 2.0 with enhanced streaming technology
+- Microsoft xCloud integration with Game Pass
+- NVIDIA GeForce Now expanding globally
+- New regional players entering the market
+
+## The Metaverse Gaming Experience
+
+Virtual worlds are becoming more interconnected, creating shared experiences that blur the lines between gaming, social media, and digital commerce. Players can now carry their avatars, achievements, and virtual assets across multiple games and platforms.
+
+## Sustainable Gaming Practices
+
+Environmental consciousness is driving changes in how games are developed and distributed. Digital-first releases, energy-efficient gaming hardware, and carbon-neutral gaming initiatives are becoming industry standards.
+
+## Looking Ahead
+
+As we progress through 2025, these trends will continue to mature and intersect in fascinating ways. The gaming industry's ability to adapt and innovate ensures that the best is yet to come for gamers everywhere.
+
+*What gaming trends are you most excited about? Share your thoughts with us on social media!*`,
+    slug: 'gaming-trends-2025',
+    published_date: '2025-01-15T10:00:00Z',
+    author: 'GameVault Team',
+    read_minutes: 5,
+    tags: ['Trends', 'Gaming', '2025'],
+    category: 'Industry News'
+  },
+  {
+    title: 'The Mobile Gaming Revolution: How Smartphones Changed Everything',
+    excerpt: 'Explore how mobile gaming has transformed from simple puzzles to complex AAA experiences, and what this means for the future of gaming.',
+    content: `# From Snake to Stunning: The Mobile Gaming Journey
+
+Remember when the most sophisticated game on your phone was Snake? Those days feel like ancient history now that our smartphones pack more processing power than desktop computers from just a decade ago. The mobile gaming revolution hasn't just changed how we play – it's fundamentally altered the entire gaming landscape.
+
+## The Numbers Don't Lie
+
+Mobile gaming now represents over 50% of the global gaming market, generating more revenue than console and PC gaming combined. With over 3 billion mobile gamers worldwide, the reach and impact of mobile gaming cannot be overstated.
+
+**Market Statistics:**
+- $95+ billion in mobile gaming revenue in 2024
+- Average smartphone user plays games 7+ hours per week
+- 78% of mobile game revenue comes from in-app purchases
+- Asia-Pacific leads with 1.4+ billion mobile gamers
+
+## Technical Evolution
+
+The journey from basic 2D sprites to console-quality 3D graphics on mobile devices has been remarkable. Modern smartphones now feature:
+
+- Dedicated gaming processors and GPU cores
+- High refresh rate displays (120Hz+)  
+- Advanced cooling systems
+- 5G connectivity for seamless multiplayer experiences
+
+## Changing Player Demographics
+
+Mobile gaming has democratized gaming, bringing interactive entertainment to demographics that traditional gaming never reached:
+
+- **Age diversity:** Players range from children to seniors
+- **Gender balance:** Nearly 50/50 male-female split
+- **Global reach:** Available in markets where consoles are rare
+- **Accessibility:** Lower barrier to entry than traditional gaming
+
+## Business Model Revolution
+
+The shift to free-to-play models with in-app purchases has created sustainable revenue streams while making games accessible to everyone. This has led to:
+
+- Live service games with regular content updates
+- Community-driven gameplay experiences  
+- Cross-platform play becoming standard
+- Social features integrated into core gameplay
+
+## What's Next?
+
+As 5G networks expand and mobile hardware continues advancing, we can expect:
+- Cloud gaming integration eliminating storage limitations
+- AR/VR experiences becoming mainstream on mobile
+- AI-powered personalized gaming experiences
+- Deeper integration with IoT and smart home devices
+
+The mobile gaming revolution is far from over – it's just getting started.`,
+    slug: 'mobile-gaming-revolution',
+    published_date: '2025-01-12T14:30:00Z',
+    author: 'Sarah Chen',
+    read_minutes: 7,
+    tags: ['Mobile', 'Gaming', 'Technology'],
+    category: 'Technology'
+  },
+  {
+    title: 'Mastering Strategy Games: A Beginner\'s Guide',
+    excerpt: 'New to strategy games? Learn the fundamentals and discover which games are perfect for beginners looking to dive into the strategic gaming world.',
+    content: `# Your Journey into Strategic Gaming Starts Here
+
+Strategy games can seem intimidating at first glance – with complex systems, multiple layers of decision-making, and seemingly endless possibilities. But don't let that scare you away! With the right approach and understanding of core concepts, anyone can become a strategic gaming master.
+
+## Understanding Strategy Game Types
+
+Strategy games come in many flavors, each with unique characteristics:
+
+### Real-Time Strategy (RTS)
+- Action happens continuously
+- Quick decision-making required
+- Examples: StarCraft, Age of Empires
+- Best for: Players who enjoy fast-paced action
+
+### Turn-Based Strategy (TBS)  
+- Take your time to plan each move
+- Deep strategic thinking encouraged
+- Examples: Civilization, XCOM
+- Best for: Thoughtful, methodical players
+
+### Grand Strategy
+- Long-term empire management
+- Complex diplomatic systems
+- Examples: Europa Universalis, Crusader Kings
+- Best for: History buffs and patient gamers
+
+## Essential Strategic Concepts
+
+### Resource Management
+Every strategy game revolves around managing limited resources efficiently:
+- **Economy:** Build income-generating structures early
+- **Population:** Balance growth with infrastructure needs  
+- **Military:** Maintain adequate defenses without overspending
+- **Technology:** Research upgrades that support your strategy
+
+### The Art of Planning
+
+Successful strategic gaming requires thinking several moves ahead:
+
+1. **Short-term goals** (next 1-3 turns/minutes)
+2. **Medium-term objectives** (5-10 turns/minutes)  
+3. **Long-term vision** (entire game strategy)
+
+### Information is Power
+- Scout enemy positions and capabilities
+- Understand the game's victory conditions
+- Learn from each defeat to improve your strategy
+- Watch replays of successful players
+
+## Beginner-Friendly Games to Start With
+
+### Civilization VI
+- Turn-based gameplay allows thoughtful decisions
+- Excellent tutorial system
+- Multiple victory paths to explore
+- Strong modding community for extended play
+
+### Age of Empires II: Definitive Edition
+- Classic RTS with modern quality-of-life improvements
+- Comprehensive campaigns teach historical strategy
+- Active competitive scene with learning resources
+- Balanced civilizations offer varied playstyles
+
+### Total War: Warhammer III
+- Combines turn-based campaign with real-time battles
+- Fantasy setting makes it accessible to newcomers
+- Excellent visual feedback for learning
+- Multiple difficulty settings for gradual improvement
+
+## Tips for New Strategy Gamers
+
+### Start Small
+- Play tutorial campaigns completely
+- Begin with easier difficulty settings
+- Focus on one strategy at a time
+- Don't worry about optimal play initially
+
+### Learn from Failure
+- Every loss is a learning opportunity
+- Analyze what went wrong after each game
+- Watch replays to spot missed opportunities
+- Join online communities for advice and tips
+
+### Practice Core Skills
+- **Multitasking:** Managing multiple priorities simultaneously
+- **Pattern recognition:** Identifying threats and opportunities quickly  
+- **Resource optimization:** Getting maximum value from limited assets
+- **Adaptability:** Adjusting strategy based on changing circumstances
+
+## Building Your Strategic Mindset
+
+The most important skill in strategy gaming isn't memorizing build orders or unit counters – it's developing strategic thinking that applies across all games in the genre.
+
+**Key principles:**
+- Always have a plan, but be ready to adapt
+- Information gathering is never wasted time
+- Economic strength often trumps military might
+- Patience usually beats aggression
+
+## Advanced Concepts to Explore Later
+
+Once you're comfortable with the basics, these advanced topics will take your game to the next level:
+- Multi-resource economies and trade-offs
+- Military unit composition and counters
+- Diplomatic relationships and alliance building
+- Map control and territorial advantages
+- Psychological warfare and misdirection
+
+Remember, becoming proficient at strategy games is a journey, not a destination. Every game teaches new lessons, and even experienced players continue learning and adapting their strategies.
+
+Welcome to the wonderful world of strategic gaming – your empire awaits!`,
+    slug: 'strategy-games-guide',
+    published_date: '2025-01-10T09:15:00Z',
+    author: 'Mike Rodriguez',
+    read_minutes: 10,
+    tags: ['Strategy', 'Guide', 'Beginner'],
+    category: 'Gaming Guide'
+  },
+  {
+    title: 'The Evolution of Action RPGs: From Classic to Modern',
+    excerpt: 'Trace the journey of Action RPGs from their humble beginnings to today\'s spectacular adventures that combine fast-paced action with deep storytelling.',
+    slug: 'action-rpg-evolution',
+    published_date: '2025-01-08T16:45:00Z',
+    author: 'Alex Kim',
+    read_minutes: 8,
+    tags: ['RPG', 'Action', 'History'],
+    category: 'Game History'
+  },
+  {
+    title: 'Indie Games Spotlight: Hidden Gems You Should Play',
+    excerpt: 'Discover amazing independent games that are pushing creative boundaries and delivering unique gaming experiences you won\'t find anywhere else.',
+    slug: 'indie-games-spotlight',
+    published_date: '2025-01-05T11:20:00Z',
+    author: 'Emma Watson',
+    read_minutes: 6,
+    tags: ['Indie', 'Spotlight', 'Reviews'],
+    category: 'Game Reviews'
+  },
+  {
+    title: 'Building Gaming Communities: The Social Side of Games',
+    excerpt: 'Learn how modern games are fostering communities and creating lasting friendships through shared gaming experiences and social features.',
+    slug: 'gaming-community-building',
+    published_date: '2025-01-03T13:10:00Z',
+    author: 'GameVault Team',
+    read_minutes: 9,
+    tags: ['Community', 'Social', 'Gaming'],
+    category: 'Community'
+  }
+];
+
+module.exports = {
+  async up(knex) {
+    const { rows } = await knex.raw("SELECT to_regclass('articles') IS NOT NULL AS present");
+    if (!rows[0].present) {
+      return;
+    }
+
+    await knex.raw(`
+      ALTER TABLE articles
+        ADD COLUMN IF NOT EXISTS category varchar(255),
+        ADD COLUMN IF NOT EXISTS content_html text,
+        ADD COLUMN IF NOT EXISTS read_minutes integer
+    `);
+    await knex.raw(`
+      CREATE INDEX IF NOT EXISTS articles_published_date_idx
+      ON articles (published_date DESC, id DESC)
+      WHERE published_at IS NOT NULL
+    `);
+    await knex.raw(`
+      CREATE INDEX IF NOT EXISTS articles_published_category_date_idx
+      ON articles (category, published_date DESC, id DESC)
+      WHERE published_at IS NOT NULL
+    `);
+    await knex.raw(`
+      CREATE INDEX IF NOT EXISTS articles_tags_idx
+      ON articles USING gin (tags jsonb_path_ops)
+      WHERE published_at IS NOT NULL
+    `);
+
+    // Inlined as a literal: knex and migrate-db.js use different
+    // placeholder syntax. Each article gets a draft and a published row
+    // sharing one document id, as Strapi stores them.
+    const articles = JSON.stringify(ARTICLES.map((article) => ({
+      ...article,
+      content_html: article.content ? renderMarkdown(article.content) : null,
+    }))).replace(/'/g, "''");
+    await knex.raw(`
+      WITH seed AS (
+        SELECT a.*, substr(md5(a.slug || clock_timestamp()::text), 1, 24) AS document_id
+        FROM jsonb_to_recordset('${articles}'::jsonb) AS a(
+          slug text, title text, excerpt text, content text, content_html text,
+          read_minutes integer, category text, author text, tags jsonb,
+          published_date timestamp
+        )
+        WHERE NOT EXISTS (SELECT 1 FROM articles WHERE articles.slug = a.slug)
+      )
+      INSERT INTO articles (
+        document_id, title, excerpt, content, content_html, read_minutes,
+        category, author, tags, slug, published_date, created_at, updated_at,
+        published_at
+      )
+      SELECT document_id, title, excerpt, content, content_html, read_minutes,
+             category, author, tags, slug, published_date, now(), now(),
+             version.published_at
+      FROM seed
+      CROSS JOIN (VALUES (NULL::timestamp), (now()::timestamp)) AS version(published_at)
+    `);
+  },
+
+  async down(knex) {
+    await knex.raw('DROP INDEX IF EXISTS articles_published_date_idx');
+    await knex.raw('DROP INDEX IF EXISTS articles_published_category_date_idx');
+    await knex.raw('DROP INDEX IF EXISTS articles_tags_idx');
+    await knex.raw(`
+      ALTER TABLE IF EXISTS articles
+        DROP COLUMN IF EXISTS category,
+        DROP COLUMN IF EXISTS content_html,
+        DROP COLUMN IF EXISTS read_minutes
+    `);
+  },
+};
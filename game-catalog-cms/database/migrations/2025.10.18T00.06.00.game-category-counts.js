@@ -0,0 +1,77 @@
+'use strict';
+
+/**
+ * Published games per category, for the storefront's category facets.
+ * A trigger on games keeps the counts current on every write (storefront
+ * admin API and CMS alike) by adjusting the affected rows by one, so
+ * reading the facets never aggregates over games. Updates that touch
+ * neither category nor published_at (download counters) do not fire it.
+ */
+
+module.exports = {
+  async up(knex) {
+    // On a fresh database Strapi runs migrations before its schema sync
+    // creates games; run `node migrate-db.js` again once it exists
+    const { rows } = await knex.raw("SELECT to_regclass('games') IS NOT NULL AS present");
+    if (!rows[0].present) {
+      return;
+    }
+
+    await knex.raw(`
+      CREATE TABLE IF NOT EXISTS game_category_counts (
+        category varchar(255) PRIMARY KEY,
+        games integer NOT NULL DEFAULT 0 CHECK (games >= 0)
+      )
+    `);
+
+    await knex.raw(`
+      CREATE OR REPLACE FUNCTION game_category_counts_sync() RETURNS trigger AS $$
+      BEGIN
+        IF TG_OP <> 'INSERT' AND OLD.published_at IS NOT NULL AND OLD.category IS NOT NULL THEN
+          UPDATE game_category_counts SET games = games - 1 WHERE category = OLD.category;
+        END IF;
+        IF TG_OP <> 'DELETE' AND NEW.published_at IS NOT NULL AND NEW.category IS NOT NULL THEN
+          INSERT INTO game_category_counts (category, games) VALUES (NEW.category, 1)
+          ON CONFLICT (category) DO UPDATE SET games = game_category_counts.games + 1;
+        END IF;
+        RETURN NULL;
+      END;
+      $$ LANGUAGE plpgsql
+    `);
+
+    await knex.raw('DROP TRIGGER IF EXISTS games_category_counts_write ON games');
+    await knex.raw(`
+      CREATE TRIGGER games_category_counts_write
+      AFTER INSERT OR DELETE ON games
+      FOR EACH ROW EXECUTE FUNCTION game_category_counts_sync()
+    `);
+    await knex.raw('DROP TRIGGER IF EXISTS games_category_counts_update ON games');
+    await knex.raw(`
+      CREATE TRIGGER games_category_counts_update
+      AFTER UPDATE OF category, published_at ON games
+      FOR EACH ROW
+      WHEN (OLD.category IS DISTINCT FROM NEW.category
+            OR (OLD.published_at IS NULL) <> (NEW.published_at IS NULL))
+      EXECUTE FUNCTION game_category_counts_sync()
+    `);
+
+    // Recount once, with writers held off so no trigger update is lost
+    // between the count and the triggers taking over
+    await knex.raw('LOCK TABLE games IN SHARE ROW EXCLUSIVE MODE');
+    await knex.raw('DELETE FROM game_category_counts');
+    await knex.raw(`
+      INSERT INTO game_category_counts (category, games)
+      SELECT category, count(*)
+      FROM games
+      WHERE published_at IS NOT NULL AND category IS NOT NULL
+      GROUP BY category
+    `);
+  },
+
+  async down(knex) {
+    await knex.raw('DROP TRIGGER IF EXISTS games_category_counts_write ON games');
+    await knex.raw('DROP TRIGGER IF EXISTS games_category_counts_update ON games');
+    await knex.raw('DROP FUNCTION IF EXISTS game_category_counts_sync()');
+    await knex.raw('DROP TABLE IF EXISTS game_category_counts');
+  },
+};
@@ -0,0 +1,28 @@
+'use strict';
+
+/**
+ * article lifecycles
+ *
+ * Publishing writes a new published row from the draft; that is where the
+ * body is rendered to HTML (contentHtml) and the reading time computed, so
+ * the storefront serves stored HTML. Draft saves are left untouched.
+ */
+
+const { renderMarkdown, readMinutes } = require('../../../../utils/render-article');
+
+function renderPublished({ params }) {
+  const { data } = params;
+  if (!data || !data.publishedAt || typeof data.content !== 'string') {
+    return;
+  }
+  data.contentHtml = renderMarkdown(data.content);
+  data.readMinutes = readMinutes(data.content);
+  if (!data.publishedDate) {
+    data.publishedDate = data.publishedAt;
+  }
+}
+
+module.exports = {
+  beforeCreate: renderPublished,
+  beforeUpdate: renderPublished,
+};
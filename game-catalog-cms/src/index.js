@@ -1,12 +1,22 @@
 'use strict';
 
+const storefrontSync = require('./utils/storefront-sync');
+
 module.exports = {
   /**
    * An asynchronous register function that runs before
    * your application is initialized.
    */
-  register(/*{ strapi }*/) {
-    // register your global middlewares, configurations, policies, services...
+  register({ strapi }) {
+    // Push game and article changes to the storefront's cache sync webhook
+    const url = process.env.STOREFRONT_WEBHOOK_URL;
+    if (url) {
+      strapi.documents.use(storefrontSync({
+        strapi,
+        url,
+        secret: process.env.STOREFRONT_WEBHOOK_SECRET || '',
+      }));
+    }
   },
 
   /**
@@ -1,4 +1,5 @@
-// import type { Core } from '@strapi/strapi';
+import type { Core } from '@strapi/strapi';
+import storefrontSync from './utils/storefront-sync';
 
 export default {
   /**
@@ -7,7 +8,17 @@ export default {
    *
    * This gives you an opportunity to extend code.
    */
-  register(/* { strapi }: { strapi: Core.Strapi } */) {},
+  register({ strapi }: { strapi: Core.Strapi }) {
+    // Push game and article changes to the storefront's cache sync webhook
+    const url = process.env.STOREFRONT_WEBHOOK_URL;
+    if (url) {
+      strapi.documents.use(storefrontSync({
+        strapi,
+        url,
+        secret: process.env.STOREFRONT_WEBHOOK_SECRET || '',
+      }));
+    }
+  },
 
   /**
    * An asynchronous bootstrap function that runs before
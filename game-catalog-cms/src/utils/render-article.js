@@ -0,0 +1,171 @@
+'use strict';
+
+/**
+ * Article body rendering
+ *
+ * Turns the Markdown stored in an article's richtext `content` into the
+ * HTML the storefront shows, once per publish (see the article lifecycles)
+ * instead of on every page view. Covers the Markdown the editor produces
+ * for articles: headings, paragraphs, bullet and numbered lists (nested
+ * by indentation), block quotes, fenced code, rules, and bold, italic,
+ * inline code and links. All text is escaped before formatting is
+ * applied, so the output contains no markup the author did not get from
+ * these rules.
+ */
+
+const WORDS_PER_MINUTE = 200;
+
+function escapeHtml(text) {
+  return text
+    .replace(/&/g, '&amp;')
+    .replace(/</g, '&lt;')
+    .replace(/>/g, '&gt;')
+    .replace(/"/g, '&quot;')
+    .replace(/'/g, '&#39;');
+}
+
+// Links are limited to http(s), site-relative paths and anchors
+function safeHref(href) {
+  return /^(https?:\/\/|\/|#)/i.test(href) ? href : null;
+}
+
+function emphasis(html) {
+  return html
+    .replace(/\*\*(.+?)\*\*/g, '<strong>$1</strong>')
+    .replace(/__(.+?)__/g, '<strong>$1</strong>')
+    .replace(/\*(.+?)\*/g, '<em>$1</em>')
+    .replace(/(^|\W)_(.+?)_(?=\W|$)/g, '$1<em>$2</em>');
+}
+
+// Link targets may contain one level of balanced parentheses, as in
+// Wikipedia URLs like /wiki/Foo_(bar)
+const LINK = /\[([^\]]+)\]\(((?:[^()\s]|\([^()\s]*\))+)\)/g;
+
+// Code spans and link targets are set aside first so emphasis markers
+// inside them are left alone
+function renderInline(text) {
+  const held = [];
+  const hold = (html) => {
+    held.push(html);
+    return `\u0000${held.length - 1}\u0000`;
+  };
+  const html = escapeHtml(text)
+    .replace(/`([^`]+)`/g, (match, code) => hold(`<code>${code}</code>`))
+    .replace(LINK, (match, label, href) => {
+      const url = safeHref(href);
+      return url ? hold(`<a href="${url}" rel="noopener noreferrer">${emphasis(label)}</a>`) : label;
+    });
+  return emphasis(html).replace(/\u0000(\d+)\u0000/g, (match, index) => held[index]);
+}
+
+const LIST_ITEM = /^(\s*)([-*+]|\d+[.)])\s+(.*)$/;
+const RULE = /^\s*([-*_])(\s*\1){2,}\s*$/;
+
+function renderList(lines, start) {
+  const ordered = /\d/.test(LIST_ITEM.exec(lines[start])[2]);
+  const indent = LIST_ITEM.exec(lines[start])[1].length;
+  const items = [];
+  let i = start;
+  while (i < lines.length) {
+    const match = LIST_ITEM.exec(lines[i]);
+    if (!match || match[1].length < indent) {
+      break;
+    }
+    if (match[1].length === indent && /\d/.test(match[2]) !== ordered) {
+      break;
+    }
+    if (match[1].length > indent && items.length > 0) {
+      const nested = renderList(lines, i);
+      items[items.length - 1] += nested.html;
+      i = nested.next;
+      continue;
+    }
+    items.push(renderInline(match[3].trim()));
+    i++;
+  }
+  const tag = ordered ? 'ol' : 'ul';
+  return {
+    html: `<${tag}>${items.map((item) => `<li>${item}</li>`).join('')}</${tag}>`,
+    next: i,
+  };
+}
+
+function renderMarkdown(markdown) {
+  const lines = String(markdown || '').replace(/\r\n?/g, '\n').split('\n');
+  const blocks = [];
+  let i = 0;
+
+  while (i < lines.length) {
+    const line = lines[i];
+
+    if (!line.trim()) {
+      i++;
+      continue;
+    }
+
+    if (/^```/.test(line)) {
+      const code = [];
+      i++;
+      while (i < lines.length && !/^```/.test(lines[i])) {
+        code.push(lines[i]);
+        i++;
+      }
+      i++;
+      blocks.push(`<pre><code>${escapeHtml(code.join('\n'))}</code></pre>`);
+      continue;
+    }
+
+    const heading = /^(#{1,6})\s+(.*?)\s*#*\s*$/.exec(line);
+    if (heading) {
+      const level = heading[1].length;
+      blocks.push(`<h${level}>${renderInline(heading[2])}</h${level}>`);
+      i++;
+      continue;
+    }
+
+    if (RULE.test(line)) {
+      blocks.push('<hr>');
+      i++;
+      continue;
+    }
+
+    if (LIST_ITEM.test(line)) {
+      const list = renderList(lines, i);
+      blocks.push(list.html);
+      i = list.next;
+      continue;
+    }
+
+    if (/^>\s?/.test(line)) {
+      const quote = [];
+      while (i < lines.length && /^>\s?/.test(lines[i])) {
+        quote.push(lines[i].replace(/^>\s?/, ''));
+        i++;
+      }
+      blocks.push(`<blockquote>${renderMarkdown(quote.join('\n'))}</blockquote>`);
+      continue;
+    }
+
+    const paragraph = [];
+    while (
+      i < lines.length &&
+      lines[i].trim() &&
+      !/^(#{1,6}\s|```|>)/.test(lines[i]) &&
+      !RULE.test(lines[i]) &&
+      !LIST_ITEM.test(lines[i])
+    ) {
+      paragraph.push(lines[i].trim());
+      i++;
+    }
+    blocks.push(`<p>${renderInline(paragraph.join(' '))}</p>`);
+  }
+
+  return blocks.join('\n');
+}
+
+function readMinutes(markdown) {
+  const words = String(markdown || '').split(/\s+/).filter(Boolean).length;
+  return Math.max(1, Math.round(words / WORDS_PER_MINUTE));
+}
+
+module.exports = { renderMarkdown, readMinutes };
@@ -0,0 +1,101 @@
+'use strict';
+
+/**
+ * Storefront sync
+ *
+ * Document service middleware that tells the Next.js storefront when a
+ * published game or article changes, so it can drop cached API responses
+ * and regenerate the affected pages right away instead of waiting for TTLs.
+ * The storefront reads the games table directly; this is its only signal
+ * that editorial content changed.
+ *
+ * Payload (POST STOREFRONT_WEBHOOK_URL):
+ *   { event, model, uid, entry, previous }
+ * entry is the published version after the action (null once it left the
+ * storefront), previous the published version before it.
+ */
+
+const SYNCED_MODELS = {
+  'api::game.game': 'game',
+  'api::article.article': 'article',
+};
+
+const EVENTS = {
+  publish: 'entry.publish',
+  unpublish: 'entry.unpublish',
+  update: 'entry.update',
+  delete: 'entry.delete',
+};
+
+const TIMEOUT_MS = 5000;
+const MAX_ATTEMPTS = 3;
+
+const sleep = (ms) => new Promise((resolve) => setTimeout(resolve, ms));
+
+function findPublished(strapi, uid, documentId, locale) {
+  return strapi.documents(uid).findOne({ documentId, locale, status: 'published' });
+}
+
+async function send(strapi, { url, secret }, payload) {
+  const body = JSON.stringify(payload);
+  for (let attempt = 1; attempt <= MAX_ATTEMPTS; attempt++) {
+    try {
+      const response = await fetch(url, {
+        method: 'POST',
+        headers: {
+          'Content-Type': 'application/json',
+          Authorization: `Bearer ${secret}`,
+        },
+        body,
+        signal: AbortSignal.timeout(TIMEOUT_MS),
+      });
+      if (response.ok) {
+        return;
+      }
+      // A 4xx will not get better on retry (bad secret, unknown model)
+      if (response.status < 500) {
+        strapi.log.warn(`Storefront sync rejected ${payload.event} (${payload.uid}): ${response.status}`);
+        return;
+      }
+    } catch (error) {
+      if (attempt === MAX_ATTEMPTS) {
+        strapi.log.warn(`Storefront sync failed for ${payload.event} (${payload.uid}): ${error.message}`);
+        return;
+      }
+    }
+    await sleep(attempt * 1000);
+  }
+  strapi.log.warn(`Storefront sync gave up on ${payload.event} (${payload.uid})`);
+}
+
+module.exports = ({ strapi, url, secret }) => {
+  return async (context, next) => {
+    const model = SYNCED_MODELS[context.uid];
+    const event = EVENTS[context.action];
+    const { documentId, locale } = context.params || {};
+    if (!model || !event || !documentId) {
+      return next();
+    }
+
+    const previous = await findPublished(strapi, context.uid, documentId, locale);
+    const result = await next();
+    const entry = await findPublished(strapi, context.uid, documentId, locale);
+
+    // Saving a draft leaves the published version untouched; the storefront
+    // never shows drafts, so there is nothing to tell it
+    if (!previous && !entry) {
+      return result;
+    }
+    if (context.action === 'update' && previous && entry && previous.updatedAt === entry.updatedAt) {
+      return result;
+    }
+
+    // Fire and forget: a slow or unreachable storefront must not hold up
+    // the editor, and its caches expire on their own anyway
+    send(strapi, { url, secret }, { event, model, uid: context.uid, entry, previous }).catch((error) => {
+      strapi.log.warn(`Storefront sync error: ${error.message}`);
+    });
+
+    return result;
+  };
+};
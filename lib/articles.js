@@ -0,0 +1,78 @@
+// Blog articles for the blog, article and home pages, read from the Strapi
+// article content type. Bodies arrive as HTML rendered by the CMS at
+// publish time; listings never load them.
+import { revalidatePath } from 'next/cache'
+import { getArticleBySlug, getArticleSlugs, searchArticles } from './db'
+import { cachedArticles } from './cache'
+import { placeholderImage, safely } from './catalog'
+import { imageUrl } from './imageVariants'
+import { LOCALES } from './i18n'
+
+// Featured image through the image pipeline: the Strapi upload when there
+// is one, else a placeholder picked by id
+function featuredImageFor(article, variant) {
+  return { url: imageUrl(article.featured_image_url || placeholderImage(article.id), variant) }
+}
+
+// Listing view: excerpt, no body
+export function toArticleView(article, { variant = 'card' } = {}) {
+  return {
+    id: article.id,
+    documentId: article.document_id,
+    title: article.title,
+    excerpt: article.excerpt,
+    slug: article.slug,
+    category: article.category || null,
+    author: article.author,
+    tags: article.tags || [],
+    readMinutes: article.read_minutes || null,
+    publishedDate: article.published_date,
+    updatedAt: article.updated_at,
+    hasContent: article.has_content,
+    featuredImage: featuredImageFor(article, variant)
+  }
+}
+
+export function toArticleDetailView(article) {
+  return {
+    ...toArticleView(article, { variant: 'detail' }),
+    contentHtml: article.content_html
+  }
+}
+
+export function loadArticles(limit = null) {
+  return safely(
+    () => cachedArticles({ route: 'page:articles', limit }, async () => {
+      const { rows } = await searchArticles({ limit })
+      return rows.map(article => toArticleView(article))
+    }),
+    () => []
+  )
+}
+
+export function loadArticle(slug) {
+  return safely(
+    () => cachedArticles({ route: 'page:article', slug }, async () => {
+      const article = await getArticleBySlug(slug)
+      return article ? toArticleDetailView(article) : null
+    }),
+    () => null
+  )
+}
+
+export function loadArticleSlugs() {
+  return safely(() => getArticleSlugs(), () => [])
+}
+
+// Regenerate the pages that list or show these articles (CMS sync webhook)
+export function revalidateArticlePages(...articles) {
+  for (const locale of LOCALES) {
+    revalidatePath(`/${locale}`)
+    revalidatePath(`/${locale}/blog`)
+    for (const article of articles) {
+      if (article?.slug) {
+        revalidatePath(`/${locale}/article/${article.slug}`)
+      }
+    }
+  }
+}
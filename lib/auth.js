@@ -1,8 +1,29 @@
+import { createHash } from 'crypto'
 import jwt from 'jsonwebtoken'
 import { validateAdminUser } from './db'
+import { LRUCache } from './cache'
+import { createRateLimiter } from './rateLimit'
+import { envInt } from './utils'
 
 const JWT_SECRET = process.env.JWT_SECRET || 'your-secret-key-change-in-production'
 
+// Verified tokens, keyed by a hash of the token so the cache never holds
+// the bearer credential itself. Entries expire no later than the token.
+const verifiedTokens = new LRUCache({
+  maxEntries: envInt('AUTH_TOKEN_CACHE_MAX_ENTRIES', 1000),
+  ttlMs: envInt('AUTH_TOKEN_CACHE_TTL_MS', 5 * 60 * 1000),
+})
+
+// Login attempts are limited per account and per client address
+const loginByEmail = createRateLimiter({
+  limit: envInt('LOGIN_MAX_ATTEMPTS_PER_EMAIL', 5),
+  windowMs: envInt('LOGIN_WINDOW_MS', 15 * 60 * 1000),
+})
+const loginByIp = createRateLimiter({
+  limit: envInt('LOGIN_MAX_ATTEMPTS_PER_IP', 20),
+  windowMs: envInt('LOGIN_WINDOW_MS', 15 * 60 * 1000),
+})
+
 export function generateToken(user) {
   return jwt.sign(
     { userId: user.id, email: user.email },
@@ -11,14 +32,74 @@ export function generateToken(user) {
   )
 }
 
+function tokenKey(token) {
+  return createHash('sha256').update(token).digest('base64url')
+}
+
 export function verifyToken(token) {
+  const key = tokenKey(token)
+  const cached = verifiedTokens.get(key)
+  if (cached) {
+    return cached
+  }
   try {
-    return jwt.verify(token, JWT_SECRET)
+    const decoded = jwt.verify(token, JWT_SECRET)
+    const remainingMs = decoded.exp ? decoded.exp * 1000 - Date.now() : verifiedTokens.ttlMs
+    if (remainingMs > 0) {
+      verifiedTokens.set(key, decoded, { ttlMs: Math.min(remainingMs, verifiedTokens.ttlMs) })
+    }
+    return decoded
   } catch (error) {
     return null
   }
 }
 
+export function getTokenCacheStats() {
+  return verifiedTokens.stats()
+}
+
+// Number of reverse proxies in front of the app that append to
+// X-Forwarded-For (1 for the nginx setup in the README). With 0, proxy
+// headers are ignored, since any client can send them.
+const TRUSTED_PROXY_HOPS = envInt('TRUSTED_PROXY_HOPS', 0)
+
+// Client address for rate limiting, or null when it is not known. Each
+// trusted proxy appends the address it was connected from, so the client
+// is the entry TRUSTED_PROXY_HOPS from the right; everything left of it is
+// client-supplied.
+export function getClientIp(request) {
+  if (TRUSTED_PROXY_HOPS > 0) {
+    const forwarded = (request.headers.get('x-forwarded-for') || '')
+      .split(',')
+      .map((address) => address.trim())
+      .filter(Boolean)
+    if (forwarded.length > 0) {
+      return forwarded[Math.max(0, forwarded.length - TRUSTED_PROXY_HOPS)]
+    }
+  }
+  return request.ip || null
+}
+
+// Count a login attempt against the email and the client address before
+// any password hashing happens; returns { allowed, retryAfterMs }. Without
+// a known address only the per-account limit applies: one shared bucket
+// would let anyone lock every admin out.
+export function checkLoginRate(email, ip) {
+  const byEmail = loginByEmail.hit(String(email).trim().toLowerCase())
+  const byIp = ip ? loginByIp.hit(ip) : { allowed: true, retryAfterMs: 0 }
+  return {
+    allowed: byEmail.allowed && byIp.allowed,
+    retryAfterMs: Math.max(byEmail.retryAfterMs, byIp.retryAfterMs)
+  }
+}
+
+export function resetLoginRate(email, ip) {
+  loginByEmail.reset(String(email).trim().toLowerCase())
+  if (ip) {
+    loginByIp.reset(ip)
+  }
+}
+
 export async function authenticateAdmin(email, password) {
   const user = await validateAdminUser(email, password)
   if (user) {
@@ -0,0 +1,261 @@
+// In-process read-through cache for public catalog reads
+import { createHash } from 'crypto'
+import { envInt } from './utils'
+import { recordSerialize } from './metrics'
+
+// Bounded LRU with per-entry TTL and tag-based invalidation.
+// Map iteration order doubles as recency order: the first key is the oldest.
+// Each tag also counts its invalidations (one small integer per tag ever
+// invalidated), so a read-through can tell whether its tags were
+// invalidated while the loader ran.
+export class LRUCache {
+  constructor({ maxEntries = 500, ttlMs = 60000 } = {}) {
+    this.maxEntries = maxEntries
+    this.ttlMs = ttlMs
+    this.entries = new Map()
+    this.tagIndex = new Map()
+    this.tagGenerations = new Map()
+    this.generation = 0
+    this.counters = { hits: 0, misses: 0, evictions: 0, invalidations: 0, staleLoads: 0 }
+  }
+
+  get(key) {
+    const entry = this.entries.get(key)
+    if (!entry) {
+      this.counters.misses++
+      return undefined
+    }
+    if (entry.expiresAt <= Date.now()) {
+      this.delete(key)
+      this.counters.misses++
+      return undefined
+    }
+    // Refresh recency
+    this.entries.delete(key)
+    this.entries.set(key, entry)
+    this.counters.hits++
+    return entry.value
+  }
+
+  set(key, value, { tags = [], ttlMs = this.ttlMs } = {}) {
+    this.delete(key)
+    this.entries.set(key, { value, tags, expiresAt: Date.now() + ttlMs })
+    for (const tag of tags) {
+      if (!this.tagIndex.has(tag)) {
+        this.tagIndex.set(tag, new Set())
+      }
+      this.tagIndex.get(tag).add(key)
+    }
+    while (this.entries.size > this.maxEntries) {
+      this.delete(this.entries.keys().next().value)
+      this.counters.evictions++
+    }
+  }
+
+  delete(key) {
+    const entry = this.entries.get(key)
+    if (!entry) {
+      return false
+    }
+    this.entries.delete(key)
+    for (const tag of entry.tags) {
+      const keys = this.tagIndex.get(tag)
+      if (keys) {
+        keys.delete(key)
+        if (keys.size === 0) {
+          this.tagIndex.delete(tag)
+        }
+      }
+    }
+    return true
+  }
+
+  // Changes whenever any of these tags is invalidated or the cache cleared
+  version(tags) {
+    return tags.reduce((sum, tag) => sum + (this.tagGenerations.get(tag) || 0), this.generation)
+  }
+
+  invalidateTag(tag) {
+    this.tagGenerations.set(tag, (this.tagGenerations.get(tag) || 0) + 1)
+    const keys = this.tagIndex.get(tag)
+    if (!keys) {
+      return 0
+    }
+    let removed = 0
+    for (const key of [...keys]) {
+      if (this.delete(key)) {
+        removed++
+      }
+    }
+    this.counters.invalidations += removed
+    return removed
+  }
+
+  clear() {
+    this.entries.clear()
+    this.tagIndex.clear()
+    this.generation++
+  }
+
+  stats() {
+    return {
+      ...this.counters,
+      size: this.entries.size,
+      maxEntries: this.maxEntries,
+      ttlMs: this.ttlMs,
+    }
+  }
+}
+
+export const gamesCache = new LRUCache({
+  maxEntries: envInt('GAMES_CACHE_MAX_ENTRIES', 500),
+  ttlMs: envInt('GAMES_CACHE_TTL_MS', 60000),
+})
+
+// Lists without a category filter can contain games of every category
+const ALL_CATEGORIES_TAG = 'category:*'
+
+export function gamesCacheKey({ route, search = '', category = '', featured = false, slug = '', limit = null, cursor = '', fields = null }) {
+  return JSON.stringify([
+    route,
+    (search || '').toLowerCase(),
+    category && category !== 'all' ? category : '',
+    featured === true || featured === 'true',
+    slug || '',
+    limit || null,
+    cursor || '',
+    fields ? fields.join(',') : '',
+  ])
+}
+
+// Tags describe which game changes make a cached entry stale
+export function gamesCacheTags({ category = '', featured = false, slug = '' }) {
+  if (slug) {
+    return [`slug:${slug}`]
+  }
+  if (featured === true || featured === 'true') {
+    return ['featured']
+  }
+  if (category && category !== 'all') {
+    return [`category:${category}`]
+  }
+  return [ALL_CATEGORIES_TAG]
+}
+
+// A loader that started before a write may return pre-write data after the
+// write has invalidated its tags; that value is returned to its caller but
+// not cached, so the next read loads again
+async function readThrough(key, tags, loader) {
+  const cached = gamesCache.get(key)
+  if (cached !== undefined) {
+    return cached
+  }
+  const version = gamesCache.version(tags)
+  const value = await loader()
+  if (gamesCache.version(tags) === version) {
+    gamesCache.set(key, value, { tags })
+  } else {
+    gamesCache.counters.staleLoads++
+  }
+  return value
+}
+
+function encodePayload(payload, lastModifiedOf) {
+  if (payload === null) {
+    return { body: null, etag: null }
+  }
+  return encodeJson(payload, lastModifiedOf ? lastModifiedOf(payload) : null)
+}
+
+// Read-through helper: loader runs only on a miss
+export function cachedGames(params, loader) {
+  return readThrough(gamesCacheKey(params), gamesCacheTags(params), loader)
+}
+
+// Serialized variant of cachedGames for API responses: the entry holds the
+// encoded JSON body and a strong ETag over those bytes, so a hit costs
+// neither a query nor JSON.stringify. lastModifiedOf(payload), when given,
+// supplies a Last-Modified date. A null payload (not found) is cached as
+// { body: null }. Shares tags, and therefore invalidation, with the object
+// entries; a body whose tags were invalidated while it was being built is
+// never stored (see readThrough).
+export function cachedGamesJson(params, loader, lastModifiedOf = null) {
+  return readThrough(`json:${gamesCacheKey(params)}`, gamesCacheTags(params), async () => (
+    encodePayload(await loader(), lastModifiedOf)
+  ))
+}
+
+// Articles share the cache, with their own keys and tags: a change to one
+// article drops its detail entry and every listing
+const ARTICLE_LISTS_TAG = 'articles:*'
+
+function articlesCacheKey({ route, tag = '', category = '', slug = '', limit = null, cursor = '' }) {
+  return JSON.stringify(['articles', route, tag || '', category || '', slug || '', limit || null, cursor || ''])
+}
+
+function articlesCacheTags({ slug = '' }) {
+  return slug ? [`article:${slug}`] : [ARTICLE_LISTS_TAG]
+}
+
+export function cachedArticles(params, loader) {
+  return readThrough(articlesCacheKey(params), articlesCacheTags(params), loader)
+}
+
+// Same contract as cachedGamesJson
+export function cachedArticlesJson(params, loader, lastModifiedOf = null) {
+  return readThrough(`json:${articlesCacheKey(params)}`, articlesCacheTags(params), async () => (
+    encodePayload(await loader(), lastModifiedOf)
+  ))
+}
+
+export function encodeJson(payload, lastModified = null) {
+  const start = performance.now()
+  const body = Buffer.from(JSON.stringify(payload))
+  const etag = `"${createHash('sha1').update(body).digest('base64url')}"`
+  recordSerialize(performance.now() - start)
+  return {
+    body,
+    etag,
+    lastModified: lastModified ? new Date(lastModified).toUTCString() : null,
+  }
+}
+
+// Drop every entry a write to these game rows could have changed. Pass both
+// the previous and current row on update so a slug/category move clears both.
+export function invalidateGames(...games) {
+  let removed = 0
+  let listsTouched = false
+  for (const game of games) {
+    if (!game) {
+      continue
+    }
+    listsTouched = true
+    removed += gamesCache.invalidateTag(`slug:${game.slug}`)
+    removed += gamesCache.invalidateTag(`category:${game.category}`)
+    if (game.featured) {
+      removed += gamesCache.invalidateTag('featured')
+    }
+  }
+  if (listsTouched) {
+    removed += gamesCache.invalidateTag(ALL_CATEGORIES_TAG)
+  }
+  return removed
+}
+
+// Drop the entries a change to these articles could have changed (pass the
+// previous version too, so a renamed slug clears its old entry)
+export function invalidateArticles(...articles) {
+  let removed = 0
+  let listsTouched = false
+  for (const article of articles) {
+    if (!article) {
+      continue
+    }
+    listsTouched = true
+    removed += gamesCache.invalidateTag(`article:${article.slug}`)
+  }
+  if (listsTouched) {
+    removed += gamesCache.invalidateTag(ARTICLE_LISTS_TAG)
+  }
+  return removed
+}
@@ -0,0 +1,215 @@
+// Server-side catalog loaders for the statically regenerated pages.
+// Reads go through the same in-process cache as the public API.
+import { revalidatePath } from 'next/cache'
+import { getAllGames, getBannerUrls, getCategoryCounts, getFeaturedGames, getGameBySlug, getTrendingGames, searchGames } from './db'
+import { imageUrl } from './imageVariants'
+import { cachedGames } from './cache'
+import { GAME_CATEGORIES } from './categories'
+import { LOCALES } from './i18n'
+import { envInt } from './utils'
+
+// Placeholder artwork for games without an uploaded banner
+const BANNER_IMAGES = [
+  'https://images.unsplash.com/photo-1673350808686-209dc177c898',
+  'https://images.unsplash.com/photo-1543622748-5ee7237e8565',
+  'https://images.unsplash.com/photo-1593305841991-05c297ba4575',
+  'https://images.unsplash.com/photo-1511512578047-dfb367046420',
+  'https://images.unsplash.com/photo-1542751371-adc38448a05e'
+]
+
+// Banner through the image pipeline: the Strapi upload when there is one
+// (game.banner_url, see withBannerUrls), else a placeholder picked by id
+export function bannerImageFor(game, variant = 'card') {
+  return { url: imageUrl(game.banner_url || placeholderImage(game.id), variant) }
+}
+
+export function placeholderImage(id) {
+  return BANNER_IMAGES[id % BANNER_IMAGES.length]
+}
+
+export function toGameView(game, { variant = 'card' } = {}) {
+  return {
+    id: game.id,
+    documentId: game.document_id || `game-${game.id}`,
+    title: game.title,
+    description: game.description,
+    category: game.category,
+    downloadUrl: game.download_url,
+    slug: game.slug,
+    featured: game.featured,
+    downloads: game.downloads,
+    bannerImage: bannerImageFor(game, variant),
+    createdAt: game.created_at,
+    updatedAt: game.updated_at
+  }
+}
+
+// Card fields plus the extended details shown on the game page
+export function toGameDetailView(game) {
+  return {
+    ...toGameView(game, { variant: 'detail' }),
+    fullDescription: game.full_description || null,
+    screenshots: (game.screenshots || []).map(shot => ({ url: imageUrl(shot.url, 'screenshot') })),
+    rating: game.rating ?? null,
+    reviews: game.reviews ?? null,
+    fileSize: game.file_size || null,
+    version: game.version || null,
+    developer: game.developer || null,
+    releaseDate: game.release_date || null,
+    requirements: game.requirements || null,
+    languages: game.languages || null
+  }
+}
+
+// Attach banner_url from Strapi uploads. Missing media tables (Strapi not
+// bootstrapped yet) just mean placeholders.
+export async function withBannerUrls(games) {
+  let urls
+  try {
+    urls = await getBannerUrls(games.map(game => game.id))
+  } catch (error) {
+    console.error('Banner lookup error:', error.message)
+    return games
+  }
+  return games.map(game => ({ ...game, banner_url: urls.get(game.id) || null }))
+}
+
+// A database outage during build or regeneration should not fail the page:
+// it renders from the offline catalog until the next revalidation.
+export async function safely(loader, fallback) {
+  try {
+    return await loader()
+  } catch (error) {
+    console.error('Catalog load error:', error)
+    return fallback()
+  }
+}
+
+// Offline catalog rows, most downloaded first; imported only on failure
+export async function fallbackGames() {
+  const { FALLBACK_GAMES } = await import('./fallbackCatalog')
+  return [...FALLBACK_GAMES].sort((a, b) => b.downloads - a.downloads)
+}
+
+export function loadFeaturedGames() {
+  return safely(
+    () => cachedGames({ route: 'page:featured', featured: true }, async () => {
+      const games = await withBannerUrls(await getFeaturedGames())
+      return games.map(game => toGameView(game))
+    }),
+    async () => (await fallbackGames()).filter(game => game.featured).map(game => toGameView(game))
+  )
+}
+
+export function loadCatalogPage(limit) {
+  return safely(
+    () => cachedGames({ route: 'page:catalog', limit }, async () => {
+      const { rows, nextCursor } = await searchGames(null, null, { limit })
+      const games = await withBannerUrls(rows)
+      return { games: games.map(game => toGameView(game)), nextCursor }
+    }),
+    async () => ({ games: (await fallbackGames()).map(game => toGameView(game)), nextCursor: null })
+  )
+}
+
+// Category filter facets in schema enum order, with the number of
+// published games in each (matching the search text, when given)
+function toCategoryFacets(counts) {
+  const data = GAME_CATEGORIES.map(category => ({ category, count: counts.get(category) || 0 }))
+  return { data, meta: { total: data.reduce((sum, facet) => sum + facet.count, 0) } }
+}
+
+export async function categoryFacets(search) {
+  return toCategoryFacets(await getCategoryCounts(search))
+}
+
+export function loadCategoryFacets() {
+  return safely(
+    () => cachedGames({ route: 'page:facets' }, () => categoryFacets(null)),
+    async () => {
+      const counts = new Map()
+      for (const game of await fallbackGames()) {
+        counts.set(game.category, (counts.get(game.category) || 0) + 1)
+      }
+      return toCategoryFacets(counts)
+    }
+  )
+}
+
+const TRENDING_HALF_LIFE_HOURS = envInt('TRENDING_HALF_LIFE_HOURS', 24)
+
+// Games ranked by time-decayed recent downloads. Until enough games have
+// download events (fresh install, quiet week) the list is topped up with
+// the all-time most downloaded.
+function toTrendingView(game, index) {
+  return {
+    ...toGameView(game),
+    trendingRank: index + 1,
+    recentDownloads: {
+      lastHour: game.downloads_1h || 0,
+      lastDay: game.downloads_24h || 0,
+      lastWeek: game.downloads_7d || 0
+    }
+  }
+}
+
+export async function trendingGames(limit) {
+  const trending = await getTrendingGames({ limit, halfLifeHours: TRENDING_HALF_LIFE_HOURS })
+  let games = trending
+  if (trending.length < limit) {
+    const seen = new Set(trending.map(game => game.id))
+    const { rows } = await searchGames(null, null, { limit: limit + trending.length })
+    games = [...trending, ...rows.filter(game => !seen.has(game.id))].slice(0, limit)
+  }
+  games = await withBannerUrls(games)
+  return games.map(toTrendingView)
+}
+
+export function loadTrendingGames(limit) {
+  return safely(
+    () => cachedGames({ route: 'page:trending', limit }, () => trendingGames(limit)),
+    async () => (await fallbackGames()).slice(0, limit).map(toTrendingView)
+  )
+}
+
+export function loadGame(slug) {
+  return safely(
+    async () => {
+      const game = await cachedGames({ route: 'page:game', slug }, async () => {
+        const row = await getGameBySlug(slug)
+        return row ? (await withBannerUrls([row]))[0] : null
+      })
+      return game ? toGameDetailView(game) : null
+    },
+    async () => {
+      const game = (await fallbackGames()).find(row => row.slug === slug)
+      return game ? toGameDetailView(game) : null
+    }
+  )
+}
+
+export function loadGameSlugs() {
+  return safely(
+    async () => {
+      const { rows } = await getAllGames({ fields: ['slug'] })
+      return rows.map(game => game.slug)
+    },
+    () => []
+  )
+}
+
+// On-demand ISR: regenerate every page that can show these games, in every
+// locale. Pass the previous row too on update so a renamed slug drops its
+// old page.
+export function revalidateGamePages(...games) {
+  for (const locale of LOCALES) {
+    revalidatePath(`/${locale}`)
+    revalidatePath(`/${locale}/catalog`)
+    revalidatePath(`/${locale}/trending`)
+    for (const game of games) {
+      if (game?.slug) {
+        revalidatePath(`/${locale}/game/${game.slug}`)
+      }
+    }
+  }
+}
@@ -0,0 +1,9 @@
+// Game categories come from the enum in the Strapi game schema, so the
+// storefront filters, admin forms and API validation follow the CMS
+import gameSchema from '../game-catalog-cms/src/api/game/content-types/game/schema.json'
+
+export const GAME_CATEGORIES = gameSchema.attributes.category.enum
+
+export function isGameCategory(value) {
+  return GAME_CATEGORIES.includes(value)
+}
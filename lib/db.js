@@ -1,198 +1,910 @@
 // Database connection utility for admin operations
 import pkg from 'pg'
-const { Client } = pkg
+const { Pool } = pkg
+import { envInt } from './utils'
+import { hashPassword, comparePassword } from './passwordHasher'
+import { recordDbConnect, recordDbQuery, registerGauge } from './metrics'
 
+// Same variables as migrate-db.js and the Strapi CMS
 const dbConfig = {
-  host: 'localhost',
-  port: 5432,
-  database: 'game_catalog_db', 
-  user: 'strapi_user',
-  password: 'secure_password_123',
+  host: process.env.DATABASE_HOST || 'localhost',
+  port: envInt('DATABASE_PORT', 5432),
+  database: process.env.DATABASE_NAME || 'game_catalog_db',
+  user: process.env.DATABASE_USERNAME || 'strapi_user',
+  password: process.env.DATABASE_PASSWORD || 'secure_password_123',
 }
 
-export async function connectDB() {
-  const client = new Client(dbConfig)
-  await client.connect()
+// Optional streaming replica for public catalog reads, so editorial write
+// bursts in the CMS do not slow the storefront. Unset = primary only.
+const replicaConfig = process.env.DATABASE_REPLICA_HOST
+  ? {
+      ...dbConfig,
+      host: process.env.DATABASE_REPLICA_HOST,
+      port: envInt('DATABASE_REPLICA_PORT', dbConfig.port),
+      user: process.env.DATABASE_REPLICA_USERNAME || dbConfig.user,
+      password: process.env.DATABASE_REPLICA_PASSWORD || dbConfig.password,
+    }
+  : null
+
+// Pool sizing and timeouts, overridable per deployment
+const poolConfig = {
+  min: envInt('DB_POOL_MIN', 0),
+  max: envInt('DB_POOL_MAX', 10),
+  idleTimeoutMillis: envInt('DB_POOL_IDLE_TIMEOUT_MS', 30000),
+  connectionTimeoutMillis: envInt('DB_POOL_ACQUIRE_TIMEOUT_MS', 5000),
+  statement_timeout: envInt('DB_STATEMENT_TIMEOUT_MS', 10000),
+}
+
+const replicaPoolConfig = {
+  ...poolConfig,
+  max: envInt('DB_REPLICA_POOL_MAX', poolConfig.max),
+}
+
+// Keep a single pool per process; Next.js dev mode re-evaluates modules on
+// every reload, so the pool lives on globalThis instead of module scope.
+const globalForDb = globalThis
+
+function createPool(config, name) {
+  const pool = new Pool(config)
+
+  // An idle client erroring (e.g. Postgres restart) must not crash the process
+  pool.on('error', (error) => {
+    console.error(`Idle database client error (${name}):`, error)
+  })
+
+  return pool
+}
+
+function registerDrain() {
+  if (globalForDb.__gameDrainRegistered) {
+    return
+  }
+  globalForDb.__gameDrainRegistered = true
+  const drain = (signal) => {
+    shutdown().finally(() => process.kill(process.pid, signal))
+  }
+  process.once('SIGTERM', drain)
+  process.once('SIGINT', drain)
+}
+
+// Work that must reach the database before the pool closes (write-behind
+// buffers). Kept on globalThis so dev hot reloads do not stack duplicates.
+if (!globalForDb.__gameShutdownHooks) {
+  globalForDb.__gameShutdownHooks = new Map()
+}
+
+export function onShutdown(name, hook) {
+  globalForDb.__gameShutdownHooks.set(name, hook)
+}
+
+export async function shutdown() {
+  for (const [name, hook] of globalForDb.__gameShutdownHooks) {
+    try {
+      await hook()
+    } catch (error) {
+      console.error(`Shutdown hook "${name}" failed:`, error)
+    }
+  }
+  await closePool()
+}
+
+export function getPool() {
+  if (!globalForDb.__gamePool) {
+    globalForDb.__gamePool = createPool({ ...dbConfig, ...poolConfig }, 'primary')
+    registerDrain()
+  }
+  return globalForDb.__gamePool
+}
+
+// Pool for catalog reads: the replica when one is configured
+export function getReadPool() {
+  if (!replicaConfig) {
+    return getPool()
+  }
+  if (!globalForDb.__gameReplicaPool) {
+    globalForDb.__gameReplicaPool = createPool({ ...replicaConfig, ...replicaPoolConfig }, 'replica')
+    registerDrain()
+  }
+  return globalForDb.__gameReplicaPool
+}
+
+// Statements slower than this are logged with their normalized SQL
+const SLOW_QUERY_MS = envInt('DB_SLOW_QUERY_MS', 200)
+
+// One line, no indentation: the form the slow-query log prints. Values are
+// always bound parameters, so the text carries no data.
+export function normalizeSql(text) {
+  return text.replace(/\s+/g, ' ').trim()
+}
+
+// Low-cardinality metric label for a statement: verb and first table, e.g.
+// "SELECT games" or "INSERT game_download_buckets"
+export function statementName(text) {
+  const sql = normalizeSql(text)
+  const verb = (sql.match(/^\w+/)?.[0] || 'SQL').toUpperCase()
+  const table = sql.match(/\b(?:FROM|INTO|UPDATE)\s+([a-z_][\w.]*)/i)
+  return table ? `${verb} ${table[1]}` : verb
+}
+
+async function timedQuery(client, text, params) {
+  const start = performance.now()
+  const result = await client.query(text, params)
+  const ms = performance.now() - start
+  const slow = SLOW_QUERY_MS > 0 && ms >= SLOW_QUERY_MS
+  if (slow) {
+    console.warn(`Slow query (${ms.toFixed(1)} ms, ${result.rowCount ?? 0} rows): ${normalizeSql(text)}`)
+  }
+  recordDbQuery(statementName(text), ms, slow)
+  return result
+}
+
+async function acquire(pool) {
+  const start = performance.now()
+  const client = await pool.connect()
+  recordDbConnect(performance.now() - start)
   return client
 }
 
-export async function getAllGames() {
-  const client = await connectDB()
+async function poolQuery(pool, text, params) {
+  const client = await acquire(pool)
   try {
-    const result = await client.query(`
-      SELECT id, document_id, title, description, category, download_url, 
-             slug, featured, downloads, created_at, updated_at, published_at 
-      FROM games 
-      WHERE published_at IS NOT NULL
-      ORDER BY created_at DESC
-    `)
-    return result.rows
-  } finally {
-    await client.end()
+    const result = await timedQuery(client, text, params)
+    client.release()
+    return result
+  } catch (error) {
+    // As pool.query does: a client that failed a query is not reused
+    client.release(error)
+    throw error
   }
 }
 
-export async function getGameBySlug(slug) {
-  const client = await connectDB()
+// Same contract as pool.query, with the connection wait and the statement
+// timed separately
+export function query(text, params) {
+  return poolQuery(getPool(), text, params)
+}
+
+// Public catalog reads that tolerate replica lag. Admin reads and anything
+// that must see its own writes use query().
+export function readQuery(text, params) {
+  return poolQuery(getReadPool(), text, params)
+}
+
+// Check out a pooled client for multi-statement work; callers must release()
+export async function connectDB() {
+  const client = await acquire(getPool())
+  return {
+    query: (text, params) => timedQuery(client, text, params),
+    release: (error) => client.release(error),
+  }
+}
+
+export async function closePool() {
+  const pools = [globalForDb.__gamePool, globalForDb.__gameReplicaPool].filter(Boolean)
+  globalForDb.__gamePool = null
+  globalForDb.__gameReplicaPool = null
+  await Promise.all(pools.map(pool => pool.end()))
+}
+
+function poolStats(pool, config) {
+  return {
+    total: pool ? pool.totalCount : 0,
+    idle: pool ? pool.idleCount : 0,
+    inUse: pool ? pool.totalCount - pool.idleCount : 0,
+    waiting: pool ? pool.waitingCount : 0,
+    min: config.min,
+    max: config.max,
+  }
+}
+
+export function getPoolStats() {
+  const stats = poolStats(globalForDb.__gamePool, poolConfig)
+  if (replicaConfig) {
+    stats.replica = poolStats(globalForDb.__gameReplicaPool, replicaPoolConfig)
+  }
+  return stats
+}
+
+registerGauge('db_pool_connections', 'Pooled Postgres connections by pool and state', () => {
+  const stats = getPoolStats()
+  const series = []
+  for (const [pool, pooled] of [['primary', stats], ['replica', stats.replica]]) {
+    if (pooled) {
+      series.push(
+        [{ pool, state: 'idle' }, pooled.idle],
+        [{ pool, state: 'in_use' }, pooled.inUse],
+        [{ pool, state: 'waiting' }, pooled.waiting]
+      )
+    }
+  }
+  return series
+})
+
+// API field name -> games column, used for ?fields= projection
+export const GAME_FIELDS = {
+  id: 'id',
+  documentId: 'document_id',
+  title: 'title',
+  description: 'description',
+  category: 'category',
+  downloadUrl: 'download_url',
+  slug: 'slug',
+  featured: 'featured',
+  downloads: 'downloads',
+  createdAt: 'created_at',
+  updatedAt: 'updated_at',
+  publishedAt: 'published_at',
+}
+
+const MAX_PAGE_SIZE = 100
+
+// Parse a ?fields=a,b,c list into known API field names (null = all fields)
+export function parseFields(value) {
+  if (!value) {
+    return null
+  }
+  const fields = value.split(',').map(f => f.trim()).filter(f => f in GAME_FIELDS || f === 'bannerImage')
+  return fields.length > 0 ? fields : null
+}
+
+export function parseLimit(value) {
+  const limit = parseInt(value, 10)
+  if (Number.isNaN(limit) || limit < 1) {
+    return null
+  }
+  return Math.min(limit, MAX_PAGE_SIZE)
+}
+
+// Cursors are opaque to clients: base64url-encoded JSON of the sort key
+export function encodeCursor(values) {
+  return Buffer.from(JSON.stringify(values)).toString('base64url')
+}
+
+export function decodeCursor(cursor) {
+  if (!cursor) {
+    return null
+  }
   try {
-    const result = await client.query(`
-      SELECT id, document_id, title, description, category, download_url, 
-             slug, featured, downloads, created_at, updated_at, published_at 
-      FROM games 
-      WHERE slug = $1 AND published_at IS NOT NULL
-    `, [slug])
-    return result.rows[0] || null
-  } finally {
-    await client.end()
+    const values = JSON.parse(Buffer.from(cursor, 'base64url').toString('utf8'))
+    return Array.isArray(values) && values.length >= 2 ? values : null
+  } catch (error) {
+    return null
   }
 }
 
+// id and slug are always selected (keys for cursors and cache tags), as are
+// the columns the caller sorts on
+function selectColumns(fields, sortColumns = []) {
+  const columns = fields
+    ? fields.filter(f => f in GAME_FIELDS).map(f => GAME_FIELDS[f])
+    : Object.values(GAME_FIELDS)
+  return [...new Set(['id', 'slug', ...sortColumns, ...columns])].join(', ')
+}
+
+// Fetch one extra row to learn whether another page exists
+async function paginate(sql, params, limit, cursorKey, run = query) {
+  if (!limit) {
+    const result = await run(sql, params)
+    return { rows: result.rows.map(stripCursorColumns), nextCursor: null }
+  }
+  const result = await run(`${sql} LIMIT $${params.length + 1}`, [...params, limit + 1])
+  const rows = result.rows.slice(0, limit)
+  const nextCursor = result.rows.length > limit ? encodeCursor(cursorKey(rows[rows.length - 1])) : null
+  return { rows: rows.map(stripCursorColumns), nextCursor }
+}
+
+function stripCursorColumns({ cursor_created_at, cursor_published_date, search_rank, ...row }) {
+  return row
+}
+
+export async function getAllGames({ limit, cursor, fields } = {}) {
+  const params = []
+  let sql = `
+    SELECT ${selectColumns(fields, ['created_at'])}, created_at::text AS cursor_created_at
+    FROM games
+    WHERE published_at IS NOT NULL
+  `
+
+  const after = decodeCursor(cursor)
+  if (after && after.length === 2) {
+    sql += ` AND (created_at, id) < ($${params.length + 1}::timestamp, $${params.length + 2})`
+    params.push(after[0], after[1])
+  }
+
+  sql += ` ORDER BY created_at DESC, id DESC`
+
+  return paginate(sql, params, limit, (row) => [row.cursor_created_at, row.id])
+}
+
+// Includes the extended details shown on the game page
+export async function getGameBySlug(slug) {
+  const result = await readQuery(`
+    SELECT id, document_id, title, description, category, download_url,
+           slug, featured, downloads, created_at, updated_at, published_at,
+           full_description, screenshots, rating::float8 AS rating, reviews,
+           file_size, version, developer, requirements, languages,
+           to_char(release_date, 'YYYY-MM-DD') AS release_date
+    FROM games
+    WHERE slug = $1 AND published_at IS NOT NULL
+  `, [slug])
+  return result.rows[0] || null
+}
+
 export async function getFeaturedGames() {
-  const client = await connectDB()
-  try {
-    const result = await client.query(`
-      SELECT id, document_id, title, description, category, download_url, 
-             slug, featured, downloads, created_at, updated_at, published_at 
-      FROM games 
-      WHERE featured = true AND published_at IS NOT NULL
-      ORDER BY downloads DESC
-      LIMIT 6
-    `)
-    return result.rows
-  } finally {
-    await client.end()
+  const result = await readQuery(`
+    SELECT id, document_id, title, description, category, download_url,
+           slug, featured, downloads, created_at, updated_at, published_at
+    FROM games
+    WHERE featured = true AND published_at IS NOT NULL
+    ORDER BY downloads DESC
+    LIMIT 6
+  `)
+  return result.rows
+}
+
+// Strapi bannerImage uploads for these games: Map of game id -> file url.
+// Media links live in Strapi's polymorphic files_related_mph table.
+export async function getBannerUrls(gameIds) {
+  if (gameIds.length === 0) {
+    return new Map()
   }
+  const result = await readQuery(`
+    SELECT DISTINCT ON (related.related_id) related.related_id AS game_id, files.url
+    FROM files_related_mph AS related
+    JOIN files ON files.id = related.file_id
+    WHERE related.related_type = 'api::game.game'
+      AND related.field = 'bannerImage'
+      AND related.related_id = ANY($1::int[])
+    ORDER BY related.related_id, related."order"
+  `, [gameIds])
+  return new Map(result.rows.map(row => [row.game_id, row.url]))
 }
 
-export async function searchGames(searchQuery, categoryFilter) {
-  const client = await connectDB()
-  try {
-    let query = `
-      SELECT id, document_id, title, description, category, download_url, 
-             slug, featured, downloads, created_at, updated_at, published_at 
-      FROM games 
-      WHERE published_at IS NOT NULL
-    `
-    const params = []
-    
-    if (searchQuery) {
-      query += ` AND title ILIKE $${params.length + 1}`
-      params.push(`%${searchQuery}%`)
-    }
-    
-    if (categoryFilter && categoryFilter !== 'all') {
-      query += ` AND category = $${params.length + 1}`
-      params.push(categoryFilter)
-    }
-    
-    query += ` ORDER BY downloads DESC`
-    
-    const result = await client.query(query, params)
-    return result.rows
-  } finally {
-    await client.end()
+// Full-text document for search. Must stay identical to the expression
+// indexed by game-catalog-cms/database/migrations/*games-search-indexes.js,
+// otherwise Postgres cannot use the GIN index.
+const SEARCH_DOCUMENT = `(
+  setweight(to_tsvector('simple', coalesce(title, '')), 'A') ||
+  setweight(to_tsvector('simple', coalesce(description, '')), 'B')
+)`
+
+// Turn free text into a prefix tsquery ("clash cl" -> "clash:* & cl:*") so
+// results update while the user is still typing. Returns null when the
+// text has no searchable words.
+export function toPrefixTsQuery(text) {
+  const terms = (text || '')
+    .toLowerCase()
+    .split(/[^\p{L}\p{N}]+/u)
+    .filter(Boolean)
+  return terms.length > 0 ? terms.map(term => `${term}:*`).join(' & ') : null
+}
+
+// Match and rank expressions for free-text search, as $1 (text) and $2
+// (prefix tsquery, when the text has any words)
+function searchExpressions(text) {
+  const params = [text]
+  const tsQuery = toPrefixTsQuery(text)
+  let match = `title % $1 OR $1 <% title`
+  let rank = `word_similarity($1, title)`
+  if (tsQuery) {
+    params.push(tsQuery)
+    match = `${SEARCH_DOCUMENT} @@ to_tsquery('simple', $2) OR ${match}`
+    rank = `ts_rank(${SEARCH_DOCUMENT}, to_tsquery('simple', $2)) + ${rank}`
   }
+  return { params, match, rank }
 }
 
-export async function createGame(gameData) {
+// Ranked search over title and description. Matches are full-text prefix
+// hits or trigram-similar titles (typo tolerance); results order by
+// relevance, then downloads. Without search text this is a plain listing
+// ordered by downloads.
+export async function searchGames(searchQuery, categoryFilter, { limit, cursor, fields } = {}) {
+  const text = (searchQuery || '').trim()
+  if (!text) {
+    return listGames(categoryFilter, { limit, cursor, fields })
+  }
+
+  const { params, match, rank } = searchExpressions(text)
+
+  let sql = `
+    SELECT ${selectColumns(fields, ['downloads'])},
+           round((${rank})::numeric, 6) AS search_rank
+    FROM games
+    WHERE published_at IS NOT NULL AND (${match})
+  `
+
+  if (categoryFilter && categoryFilter !== 'all') {
+    sql += ` AND category = $${params.length + 1}`
+    params.push(categoryFilter)
+  }
+
+  sql = `SELECT * FROM (${sql}) AS ranked`
+
+  const after = decodeCursor(cursor)
+  if (after && after.length === 3) {
+    sql += ` WHERE (search_rank, downloads, id) < ($${params.length + 1}::numeric, $${params.length + 2}, $${params.length + 3})`
+    params.push(after[0], after[1], after[2])
+  }
+
+  sql += ` ORDER BY search_rank DESC, downloads DESC, id DESC`
+
+  return paginate(sql, params, limit, (row) => [row.search_rank, row.downloads, row.id], readQuery)
+}
+
+// Published games per category: Map of category -> count. Unfiltered
+// counts come from the game_category_counts aggregate, which a trigger on
+// games keeps current; with search text only the matching games are
+// counted, through the same search indexes as searchGames.
+export async function getCategoryCounts(searchQuery) {
+  const text = (searchQuery || '').trim()
+  let result
+  if (!text) {
+    result = await readQuery('SELECT category, games FROM game_category_counts')
+  } else {
+    const { params, match } = searchExpressions(text)
+    result = await readQuery(`
+      SELECT category, count(*)::int AS games
+      FROM games
+      WHERE published_at IS NOT NULL AND (${match})
+      GROUP BY category
+    `, params)
+  }
+  return new Map(result.rows.map(row => [row.category, row.games]))
+}
+
+// Lightweight typeahead: slug and title only, best matches first
+export async function suggestGames(text, limit = 8) {
+  const prefix = (text || '').trim()
+  const tsQuery = toPrefixTsQuery(prefix)
+  if (!tsQuery) {
+    return []
+  }
+  const result = await readQuery(`
+    SELECT slug, title
+    FROM games
+    WHERE published_at IS NOT NULL
+      AND (${SEARCH_DOCUMENT} @@ to_tsquery('simple', $2) OR $1 <% title)
+    ORDER BY ts_rank(${SEARCH_DOCUMENT}, to_tsquery('simple', $2)) + word_similarity($1, title) DESC,
+             downloads DESC
+    LIMIT $3
+  `, [prefix, tsQuery, limit])
+  return result.rows
+}
+
+// Merge buffered download counts in one transaction: the hourly trending
+// buckets, and the per-game totals into games.downloads with a single
+// multi-row UPDATE. Counts are keyed by document id, which survives
+// republishing in Strapi. Totals go to the draft row as well as the
+// published one, since each publish rebuilds the published row from the
+// draft. Rows are sorted so concurrent flushes from several processes lock
+// games and buckets in the same order.
+export async function mergeDownloads(buckets) {
+  if (buckets.length === 0) {
+    return
+  }
+  const sorted = [...buckets].sort((a, b) =>
+    (a.documentId < b.documentId ? -1 : a.documentId > b.documentId ? 1 : 0) || a.bucketStart - b.bucketStart
+  )
+  const totals = new Map()
+  for (const { documentId, count } of sorted) {
+    totals.set(documentId, (totals.get(documentId) || 0) + count)
+  }
+
   const client = await connectDB()
   try {
-    const result = await client.query(`
-      INSERT INTO games (
-        title, description, category, download_url, slug, 
-        featured, downloads, created_at, updated_at, published_at, locale
-      ) VALUES ($1, $2, $3, $4, $5, $6, $7, NOW(), NOW(), NOW(), 'en')
-      RETURNING *
+    await client.query('BEGIN')
+    await client.query(`
+      UPDATE games SET downloads = games.downloads + delta.count
+      FROM unnest($1::text[], $2::int[]) AS delta(document_id, count)
+      WHERE games.document_id = delta.document_id
+    `, [[...totals.keys()], [...totals.values()]])
+    await client.query(`
+      INSERT INTO game_download_buckets (document_id, bucket_start, downloads)
+      SELECT * FROM unnest($1::text[], $2::timestamptz[], $3::int[])
+      ON CONFLICT (document_id, bucket_start)
+      DO UPDATE SET downloads = game_download_buckets.downloads + EXCLUDED.downloads
     `, [
-      gameData.title,
-      gameData.description,
-      gameData.category,
-      gameData.downloadUrl,
-      gameData.slug,
-      gameData.featured || false,
-      gameData.downloads || 0
+      sorted.map(b => b.documentId),
+      sorted.map(b => new Date(b.bucketStart)),
+      sorted.map(b => b.count)
     ])
-    return result.rows[0]
+    await client.query('COMMIT')
+  } catch (error) {
+    await client.query('ROLLBACK').catch(() => {})
+    throw error
   } finally {
-    await client.end()
+    client.release()
   }
 }
 
+export async function pruneDownloadBuckets(olderThanHours) {
+  const result = await query(
+    `DELETE FROM game_download_buckets WHERE bucket_start < NOW() - make_interval(hours => $1)`,
+    [olderThanHours]
+  )
+  return result.rowCount
+}
+
+// Trending = downloads decayed exponentially by bucket age (halving every
+// halfLifeHours) over the last 7 days. Window counts are hour-aligned: the
+// 1h/24h figures include the whole bucket the window starts in.
+export async function getTrendingGames({ limit, halfLifeHours }) {
+  const result = await readQuery(`
+    WITH scores AS (
+      SELECT document_id,
+             SUM(downloads) FILTER (WHERE bucket_start >= date_trunc('hour', NOW() - INTERVAL '1 hour')) AS downloads_1h,
+             SUM(downloads) FILTER (WHERE bucket_start >= date_trunc('hour', NOW() - INTERVAL '24 hours')) AS downloads_24h,
+             SUM(downloads) AS downloads_7d,
+             SUM(downloads * power(0.5, extract(epoch FROM NOW() - bucket_start) / 3600 / $2)) AS trending_score
+      FROM game_download_buckets
+      WHERE bucket_start >= date_trunc('hour', NOW() - INTERVAL '7 days')
+      GROUP BY document_id
+    )
+    SELECT g.id, g.document_id, g.title, g.description, g.category, g.download_url,
+           g.slug, g.featured, g.downloads, g.created_at, g.updated_at, g.published_at,
+           coalesce(s.downloads_1h, 0)::int AS downloads_1h,
+           coalesce(s.downloads_24h, 0)::int AS downloads_24h,
+           s.downloads_7d::int AS downloads_7d, s.trending_score
+    FROM scores s
+    JOIN games g ON g.document_id = s.document_id
+    WHERE g.published_at IS NOT NULL
+    ORDER BY s.trending_score DESC, g.downloads DESC, g.id DESC
+    LIMIT $1
+  `, [limit, halfLifeHours])
+  return result.rows
+}
+
+async function listGames(categoryFilter, { limit, cursor, fields } = {}) {
+  let sql = `
+    SELECT ${selectColumns(fields, ['downloads'])}
+    FROM games
+    WHERE published_at IS NOT NULL
+  `
+  const params = []
+
+  if (categoryFilter && categoryFilter !== 'all') {
+    sql += ` AND category = $${params.length + 1}`
+    params.push(categoryFilter)
+  }
+
+  const after = decodeCursor(cursor)
+  if (after && after.length === 2) {
+    sql += ` AND (downloads, id) < ($${params.length + 1}, $${params.length + 2})`
+    params.push(after[0], after[1])
+  }
+
+  sql += ` ORDER BY downloads DESC, id DESC`
+
+  return paginate(sql, params, limit, (row) => [row.downloads, row.id], readQuery)
+}
+
+export async function createGame(gameData) {
+  const result = await query(`
+    INSERT INTO games (
+      document_id, title, description, category, download_url, slug,
+      featured, downloads, created_at, updated_at, published_at, locale
+    ) VALUES (substr(md5($5 || clock_timestamp()::text), 1, 24),
+              $1, $2, $3, $4, $5, $6, $7, NOW(), NOW(), NOW(), 'en')
+    RETURNING *
+  `, [
+    gameData.title,
+    gameData.description,
+    gameData.category,
+    gameData.downloadUrl,
+    gameData.slug,
+    gameData.featured || false,
+    gameData.downloads || 0
+  ])
+  return result.rows[0]
+}
+
+// Returns { game, previous } so callers can invalidate whatever the row
+// used to be listed under (old slug, old category, old featured flag)
 export async function updateGame(id, gameData) {
-  const client = await connectDB()
-  try {
-    const result = await client.query(`
-      UPDATE games SET
-        title = $1, description = $2, category = $3, download_url = $4,
-        slug = $5, featured = $6, downloads = $7, updated_at = NOW()
-      WHERE id = $8
-      RETURNING *
-    `, [
-      gameData.title,
-      gameData.description,
-      gameData.category,
-      gameData.downloadUrl,
-      gameData.slug,
-      gameData.featured || false,
-      gameData.downloads || 0,
-      id
-    ])
-    return result.rows[0]
-  } finally {
-    await client.end()
+  const result = await query(`
+    UPDATE games SET
+      title = $1, description = $2, category = $3, download_url = $4,
+      slug = $5, featured = $6, downloads = $7, updated_at = NOW()
+    FROM (SELECT id, slug, category, featured FROM games WHERE id = $8) AS previous
+    WHERE games.id = previous.id
+    RETURNING games.*, previous.slug AS previous_slug,
+              previous.category AS previous_category, previous.featured AS previous_featured
+  `, [
+    gameData.title,
+    gameData.description,
+    gameData.category,
+    gameData.downloadUrl,
+    gameData.slug,
+    gameData.featured || false,
+    gameData.downloads || 0,
+    id
+  ])
+  const row = result.rows[0]
+  if (!row) {
+    return { game: null, previous: null }
+  }
+  const { previous_slug, previous_category, previous_featured, ...game } = row
+  return {
+    game,
+    previous: { slug: previous_slug, category: previous_category, featured: previous_featured }
   }
 }
 
+// Returns the deleted row (or null) for cache invalidation
 export async function deleteGame(id) {
-  const client = await connectDB()
-  try {
-    await client.query('DELETE FROM games WHERE id = $1', [id])
-    return true
-  } finally {
-    await client.end()
+  const result = await query(
+    'DELETE FROM games WHERE id = $1 RETURNING id, slug, category, featured',
+    [id]
+  )
+  return result.rows[0] || null
+}
+
+// Admin-writable game fields (besides slug) and their Postgres types
+export const GAME_FIELD_TYPES = {
+  title: 'text',
+  description: 'text',
+  category: 'text',
+  downloadUrl: 'text',
+  featured: 'boolean',
+  downloads: 'int',
+}
+
+// games.updated_at is a timestamp without time zone, which node-postgres
+// reads as local time. Turn an instant back into that same local
+// wall-clock text so it compares equal to the column in SQL.
+function toLocalTimestamp(value) {
+  const date = new Date(value)
+  const pad = (number, width = 2) => String(number).padStart(width, '0')
+  return `${date.getFullYear()}-${pad(date.getMonth() + 1)}-${pad(date.getDate())} ` +
+    `${pad(date.getHours())}:${pad(date.getMinutes())}:${pad(date.getSeconds())}.${pad(date.getMilliseconds(), 3)}`
+}
+
+// Partial update: only the supplied fields are written. With
+// expectedUpdatedAt the update is conditional on the row not having been
+// edited since (compared at millisecond precision, as the API reports it).
+// The check is on the target row, not the previous snapshot, so an update
+// that waited on a concurrent one rechecks it against the new version.
+// Returns { game, previous }, { conflict: currentRow }, or { game: null }.
+export async function patchGame(id, changes, expectedUpdatedAt = null) {
+  const assignments = []
+  const params = [id]
+  for (const [field, value] of Object.entries(changes)) {
+    params.push(value)
+    assignments.push(`${field === 'slug' ? 'slug' : GAME_FIELDS[field]} = $${params.length}`)
+  }
+
+  let condition = ''
+  if (expectedUpdatedAt) {
+    params.push(toLocalTimestamp(expectedUpdatedAt))
+    condition = ` AND date_trunc('milliseconds', games.updated_at) = $${params.length}::timestamp`
+  }
+
+  const result = await query(`
+    UPDATE games SET ${[...assignments, 'updated_at = NOW()'].join(', ')}
+    FROM (SELECT id, slug, category, featured FROM games WHERE id = $1) AS previous
+    WHERE games.id = previous.id${condition}
+    RETURNING games.*, previous.slug AS previous_slug,
+              previous.category AS previous_category, previous.featured AS previous_featured
+  `, params)
+
+  const row = result.rows[0]
+  if (!row) {
+    const current = await query('SELECT * FROM games WHERE id = $1', [id])
+    return current.rows[0] ? { conflict: current.rows[0] } : { game: null }
+  }
+  const { previous_slug, previous_category, previous_featured, ...game } = row
+  return {
+    game,
+    previous: { slug: previous_slug, category: previous_category, featured: previous_featured }
   }
 }
 
-// Admin authentication helpers
-export async function createAdminUser(email, password) {
-  const bcrypt = await import('bcryptjs')
-  const hashedPassword = await bcrypt.hash(password, 10)
-  
+// Apply a bulk import in one transaction: deletes by id, then an upsert by
+// slug. Existing games only get the fields the item supplies; new games
+// fall back to the insert defaults. Returns the deleted rows and, per
+// upserted slug, the new row plus what it replaced (for invalidation).
+// New slugs missing a required field roll everything back: { incomplete }.
+export async function bulkWriteGames({ upsert = [], deleteIds = [] }) {
   const client = await connectDB()
   try {
-    const result = await client.query(`
-      INSERT INTO admin_users (firstname, lastname, email, password, is_active, created_at, updated_at, published_at)
-      VALUES ('Admin', 'User', $1, $2, true, NOW(), NOW(), NOW())
-      RETURNING id, email
-    `, [email, hashedPassword])
-    return result.rows[0]
+    await client.query('BEGIN')
+
+    let deleted = []
+    if (deleteIds.length > 0) {
+      const result = await client.query(
+        'DELETE FROM games WHERE id = ANY($1::int[]) RETURNING id, slug, category, featured',
+        [deleteIds]
+      )
+      deleted = result.rows
+    }
+
+    const columns = Object.keys(GAME_FIELD_TYPES)
+    const arrays = [
+      upsert.map(game => game.slug),
+      ...columns.map(field => upsert.map(game => game[field] ?? null)),
+    ]
+    const source = `unnest($1::text[], ${columns.map((field, i) => `$${i + 2}::${GAME_FIELD_TYPES[field]}[]`).join(', ')})
+      AS item(slug, ${columns.map(field => GAME_FIELDS[field]).join(', ')})`
+
+    let updated = []
+    let created = []
+    if (upsert.length > 0) {
+      const updateResult = await client.query(`
+        UPDATE games SET
+          ${columns.map(field => `${GAME_FIELDS[field]} = coalesce(item.${GAME_FIELDS[field]}, games.${GAME_FIELDS[field]})`).join(',\n          ')},
+          updated_at = NOW()
+        FROM ${source}, (SELECT id, slug, category, featured FROM games WHERE published_at IS NOT NULL) AS previous
+        WHERE games.id = previous.id AND previous.slug = item.slug
+        RETURNING games.*, previous.category AS previous_category, previous.featured AS previous_featured
+      `, arrays)
+      updated = updateResult.rows.map(({ previous_category, previous_featured, ...game }) => ({
+        game,
+        previous: { slug: game.slug, category: previous_category, featured: previous_featured }
+      }))
+
+      // Whatever did not match an existing game is created, and needs the
+      // columns Strapi requires
+      const updatedSlugs = new Set(updated.map(({ game }) => game.slug))
+      const incomplete = upsert
+        .filter(game => !updatedSlugs.has(game.slug))
+        .filter(game => !game.title || !game.category || !game.downloadUrl)
+        .map(game => game.slug)
+      if (incomplete.length > 0) {
+        await client.query('ROLLBACK')
+        return { incomplete }
+      }
+
+      const insertResult = await client.query(`
+        INSERT INTO games (
+          document_id, slug, title, description, category, download_url,
+          featured, downloads, created_at, updated_at, published_at, locale
+        )
+        SELECT substr(md5(item.slug || clock_timestamp()::text), 1, 24),
+               item.slug, item.title, item.description, item.category, item.download_url,
+               coalesce(item.featured, false), coalesce(item.downloads, 0), NOW(), NOW(), NOW(), 'en'
+        FROM ${source}
+        WHERE NOT (item.slug = ANY($${arrays.length + 1}::text[]))
+        ON CONFLICT (slug) WHERE published_at IS NOT NULL DO NOTHING
+        RETURNING *
+      `, [...arrays, [...updatedSlugs]])
+      created = insertResult.rows
+    }
+
+    await client.query('COMMIT')
+    return { deleted, updated, created }
+  } catch (error) {
+    await client.query('ROLLBACK').catch(() => {})
+    throw error
   } finally {
-    await client.end()
+    client.release()
   }
 }
 
-export async function validateAdminUser(email, password) {
-  const bcrypt = await import('bcryptjs')
-  
-  const client = await connectDB()
-  try {
-    const result = await client.query(`
-      SELECT id, email, password FROM admin_users WHERE email = $1 AND is_active = true
-    `, [email])
-    
+// Walk every published game in id order, batchSize rows per query, for
+// exports that must not hold the whole catalog in memory
+export async function* iterateGames(batchSize = 500) {
+  let lastId = 0
+  while (true) {
+    const result = await query(`
+      SELECT ${selectColumns(null)}
+      FROM games
+      WHERE published_at IS NOT NULL AND id > $1
+      ORDER BY id
+      LIMIT $2
+    `, [lastId, batchSize])
     if (result.rows.length === 0) {
-      return null
+      return
     }
-    
-    const user = result.rows[0]
-    const isValid = await bcrypt.compare(password, user.password)
-    
-    if (isValid) {
-      return { id: user.id, email: user.email }
+    yield result.rows
+    lastId = result.rows[result.rows.length - 1].id
+    if (result.rows.length < batchSize) {
+      return
     }
-    
+  }
+}
+
+// Articles (Strapi article content type). Listings select the excerpt
+// projection only; the body is stored pre-rendered in content_html by the
+// CMS at publish time. The featured image comes from Strapi's media links.
+const ARTICLE_COLUMNS = `
+  a.id, a.document_id, a.title, a.excerpt, a.slug, a.category, a.author,
+  a.tags, a.read_minutes, a.published_date, a.updated_at,
+  a.content_html IS NOT NULL AS has_content, image.url AS featured_image_url
+`
+
+const ARTICLE_IMAGE_JOIN = `
+  LEFT JOIN LATERAL (
+    SELECT files.url
+    FROM files_related_mph AS related
+    JOIN files ON files.id = related.file_id
+    WHERE related.related_type = 'api::article.article'
+      AND related.field = 'featuredImage'
+      AND related.related_id = a.id
+    ORDER BY related."order"
+    LIMIT 1
+  ) AS image ON true
+`
+
+// Newest first, keyset-paginated on (published_date, id); tag and category
+// filters are served by the indexes in *articles.js migration
+export async function searchArticles({ tag, category, limit, cursor } = {}) {
+  const params = []
+  let sql = `
+    SELECT ${ARTICLE_COLUMNS}, a.published_date::text AS cursor_published_date
+    FROM articles AS a
+    ${ARTICLE_IMAGE_JOIN}
+    WHERE a.published_at IS NOT NULL
+  `
+
+  if (tag) {
+    sql += ` AND a.tags @> $${params.length + 1}::jsonb`
+    params.push(JSON.stringify([tag]))
+  }
+
+  if (category) {
+    sql += ` AND a.category = $${params.length + 1}`
+    params.push(category)
+  }
+
+  const after = decodeCursor(cursor)
+  if (after && after.length === 2) {
+    sql += ` AND (a.published_date, a.id) < ($${params.length + 1}::timestamp, $${params.length + 2})`
+    params.push(after[0], after[1])
+  }
+
+  sql += ` ORDER BY a.published_date DESC, a.id DESC`
+
+  return paginate(sql, params, limit, (row) => [row.cursor_published_date, row.id], readQuery)
+}
+
+// Only articles with a body have a detail page
+export async function getArticleBySlug(slug) {
+  const result = await readQuery(`
+    SELECT ${ARTICLE_COLUMNS}, a.content_html
+    FROM articles AS a
+    ${ARTICLE_IMAGE_JOIN}
+    WHERE a.slug = $1 AND a.published_at IS NOT NULL AND a.content_html IS NOT NULL
+  `, [slug])
+  return result.rows[0] || null
+}
+
+export async function getArticleSlugs() {
+  const result = await readQuery(`
+    SELECT slug
+    FROM articles
+    WHERE published_at IS NOT NULL AND content_html IS NOT NULL
+    ORDER BY published_date DESC, id DESC
+  `)
+  return result.rows.map(row => row.slug)
+}
+
+// Admin authentication helpers
+export async function createAdminUser(email, password) {
+  const hashedPassword = await hashPassword(password, 10)
+
+  const result = await query(`
+    INSERT INTO admin_users (firstname, lastname, email, password, is_active, created_at, updated_at, published_at)
+    VALUES ('Admin', 'User', $1, $2, true, NOW(), NOW(), NOW())
+    RETURNING id, email
+  `, [email, hashedPassword])
+  return result.rows[0]
+}
+
+export async function validateAdminUser(email, password) {
+  const result = await query(`
+    SELECT id, email, password FROM admin_users WHERE email = $1 AND is_active = true
+  `, [email])
+
+  if (result.rows.length === 0) {
     return null
-  } finally {
-    await client.end()
   }
-}
\ No newline at end of file
+
+  const user = result.rows[0]
+  const isValid = await comparePassword(password, user.password)
+
+  if (isValid) {
+    return { id: user.id, email: user.email }
+  }
+
+  return null
+}
@@ -0,0 +1,132 @@
+// Write-behind download counter. Clicks are counted in memory per
+// (game document, hour) and merged in periodic batches into games.downloads and the
+// trending buckets, so a burst on one hot game costs one row update per
+// flush instead of one per click.
+//
+// Clicks not yet flushed are lost if the process crashes. That loss is
+// bounded by DOWNLOAD_FLUSH_INTERVAL_MS in time and DOWNLOAD_MAX_PENDING in
+// clicks, whichever is reached first (while the database is reachable).
+import { mergeDownloads, pruneDownloadBuckets, onShutdown } from './db'
+import { envInt } from './utils'
+
+const HOUR_MS = 60 * 60 * 1000
+
+const config = {
+  flushIntervalMs: envInt('DOWNLOAD_FLUSH_INTERVAL_MS', 5000),
+  // Flush early once this many clicks are pending
+  maxPending: envInt('DOWNLOAD_MAX_PENDING', 5000),
+  // Longest trending window; older buckets are pruned
+  retentionHours: envInt('DOWNLOAD_RETENTION_HOURS', 7 * 24),
+}
+
+const globalForDownloads = globalThis
+
+function createBuffer() {
+  const buffer = {
+    pending: new Map(),
+    pendingCount: 0,
+    flushing: null,
+    lastPruneAt: 0,
+    counters: { recorded: 0, flushed: 0, flushes: 0, failures: 0 },
+  }
+  const timer = setInterval(() => {
+    flushDownloads().catch(() => {})
+  }, config.flushIntervalMs)
+  timer.unref?.()
+  onShutdown('downloads', drainDownloads)
+  return buffer
+}
+
+function getBuffer() {
+  if (!globalForDownloads.__gameDownloads) {
+    globalForDownloads.__gameDownloads = createBuffer()
+  }
+  return globalForDownloads.__gameDownloads
+}
+
+function addPending(buffer, documentId, bucketStart, count) {
+  const key = `${documentId}:${bucketStart}`
+  const entry = buffer.pending.get(key)
+  if (entry) {
+    entry.count += count
+  } else {
+    buffer.pending.set(key, { documentId, bucketStart, count })
+  }
+  buffer.pendingCount += count
+}
+
+// Keyed by document id: Strapi gives a game a new row id on every publish
+export function recordDownload(documentId, at = Date.now()) {
+  const buffer = getBuffer()
+  addPending(buffer, documentId, Math.floor(at / HOUR_MS) * HOUR_MS, 1)
+  buffer.counters.recorded++
+  if (buffer.pendingCount >= config.maxPending) {
+    flushDownloads().catch(() => {})
+  }
+}
+
+// Swap the pending map out before writing so clicks arriving mid-flush go
+// to the next batch. On failure the batch is merged back and retried.
+export function flushDownloads() {
+  const buffer = getBuffer()
+  if (buffer.flushing) {
+    return buffer.flushing
+  }
+  if (buffer.pending.size === 0) {
+    return Promise.resolve()
+  }
+
+  const batch = [...buffer.pending.values()]
+  const batchCount = buffer.pendingCount
+  buffer.pending = new Map()
+  buffer.pendingCount = 0
+
+  buffer.flushing = (async () => {
+    try {
+      await mergeDownloads(batch)
+      buffer.counters.flushed += batchCount
+      buffer.counters.flushes++
+    } catch (error) {
+      buffer.counters.failures++
+      for (const { documentId, bucketStart, count } of batch) {
+        addPending(buffer, documentId, bucketStart, count)
+      }
+      console.error('Download flush error:', error)
+      throw error
+    } finally {
+      buffer.flushing = null
+    }
+    // Clicks that piled up during a slow flush should not wait a full interval
+    if (buffer.pendingCount >= config.maxPending) {
+      flushDownloads().catch(() => {})
+    }
+    if (Date.now() - buffer.lastPruneAt > HOUR_MS) {
+      buffer.lastPruneAt = Date.now()
+      await pruneDownloadBuckets(config.retentionHours).catch((error) => {
+        console.error('Download bucket prune error:', error)
+      })
+    }
+  })()
+  return buffer.flushing
+}
+
+// On shutdown, keep flushing until nothing is pending: joining an in-flight
+// flush alone would drop the clicks recorded while it ran. A failed flush
+// ends the drain, since its batch went back into pending and retrying
+// against an unreachable database would hold up the exit.
+async function drainDownloads() {
+  const buffer = getBuffer()
+  while (buffer.flushing || buffer.pending.size > 0) {
+    await flushDownloads()
+  }
+}
+
+export function getDownloadStats() {
+  const buffer = globalForDownloads.__gameDownloads
+  return {
+    ...(buffer ? buffer.counters : { recorded: 0, flushed: 0, flushes: 0, failures: 0 }),
+    pending: buffer ? buffer.pendingCount : 0,
+    flushIntervalMs: config.flushIntervalMs,
+    maxPending: config.maxPending,
+  }
+}
@@ -0,0 +1,102 @@
+// Offline copy of the launch catalog, in games-row shape. Used only when
+// Postgres is unreachable; the loaders import it on demand, so it is never
+// part of a client bundle or loaded while the database is healthy.
+
+export const FALLBACK_GAMES = [
+  {
+    id: 1, slug: 'wukong', title: 'Wukong',
+    description: 'Epic action RPG based on the legendary Monkey King. Experience breathtaking combat and explore a mystical world filled with ancient legends and powerful enemies.',
+    category: 'Action', featured: true, downloads: 125000,
+    download_url: 'https://goc-cdn.qqby.cn/tg/HihTT_2.6.5.zip',
+    banner_url: 'https://images.unsplash.com/photo-1673350808686-209dc177c898',
+    full_description: 'Embark on an epic journey as the legendary Monkey King in this stunning action RPG. With incredible combat mechanics, breathtaking visuals, and a rich storyline rooted in Chinese mythology, Wukong delivers an unforgettable gaming experience.\n\nFeatures:\n• Fluid combat system with 72 transformations\n• Stunning visuals powered by Unreal Engine\n• Epic boss battles against mythical creatures\n• Rich storytelling based on Journey to the West\n• Customizable abilities and weapons\n• Immersive world exploration',
+    screenshots: [
+      { url: 'https://images.unsplash.com/photo-1511512578047-dfb367046420' },
+      { url: 'https://images.unsplash.com/photo-1542751371-adc38448a05e' },
+      { url: 'https://images.unsplash.com/photo-1593305841991-05c297ba4575' }
+    ],
+    rating: 4.8,
+    reviews: 892,
+    file_size: '2.6 GB',
+    version: '2.6.5',
+    developer: 'Game Science Studio',
+    release_date: '2024-08-20',
+    requirements: 'Android 8.0+ / iOS 12.0+',
+    languages: ['English', 'Chinese', 'Japanese', 'Korean']
+  },
+  {
+    id: 2, slug: 'call-me-champion', title: 'Call Me Champion',
+    description: 'Intense competitive fighting game where you battle to become the ultimate champion. Master various fighting styles and defeat opponents in epic tournaments.',
+    category: 'Action', featured: true, downloads: 89000,
+    download_url: 'https://goc-cdn.qqby.cn/jwgj/ChampionTK_2.2.2.zip',
+    banner_url: 'https://images.unsplash.com/photo-1543622748-5ee7237e8565',
+    full_description: 'Step into the arena and prove yourself in this intense fighting game. With precise controls, diverse fighters, and competitive gameplay, Call Me Champion offers the ultimate fighting experience for mobile devices.\n\nFeatures:\n• 20+ unique fighters with distinct abilities\n• Competitive ranked matches\n• Story mode with epic battles\n• Customizable combos and special moves\n• Online tournaments and events\n• Regular updates with new fighters',
+    screenshots: [
+      { url: 'https://images.unsplash.com/photo-1673350808686-209dc177c898' },
+      { url: 'https://images.unsplash.com/photo-1542751371-adc38448a05e' }
+    ],
+    rating: 4.5,
+    reviews: 654,
+    file_size: '1.8 GB',
+    version: '2.2.2',
+    developer: 'Fighting Studio',
+    release_date: '2024-07-15',
+    requirements: 'Android 7.0+ / iOS 11.0+',
+    languages: ['English', 'Spanish', 'Portuguese']
+  },
+  {
+    id: 3, slug: 'dragonball-showdown', title: 'Dragonball Showdown',
+    description: 'High-energy fighting game featuring your favorite Dragon Ball characters. Unleash devastating attacks and experience the ultimate anime fighting experience.',
+    category: 'Action', featured: true, downloads: 156000,
+    download_url: 'https://qqby-goc-hangzhou.oss-cn-hangzhou.aliyuncs.com/lzTK/DragonBall_tk_v1.0.3.zip',
+    banner_url: 'https://images.unsplash.com/photo-1593305841991-05c297ba4575'
+  },
+  {
+    id: 4, slug: 'civilization', title: 'Civilization',
+    description: 'Build and expand your empire through the ages. Develop technologies, wage wars, and lead your civilization to greatness in this epic strategy game.',
+    category: 'Strategy', featured: true, downloads: 234000,
+    download_url: 'https://goc-cdn.qqby.cn/wm/Civilization_tk_1.5.9.zip',
+    banner_url: 'https://images.unsplash.com/photo-1511512578047-dfb367046420',
+    full_description: 'Lead your civilization from ancient times to the modern era in this epic strategy game. Build cities, research technologies, wage wars, and make alliances as you compete to build the greatest civilization in history.\n\nFeatures:\n• Deep strategic gameplay\n• Multiple victory conditions\n• Historical leaders and civilizations\n• Technology tree spanning millennia\n• Diplomatic system\n• World wonders and great people',
+    screenshots: [
+      { url: 'https://images.unsplash.com/photo-1593305841991-05c297ba4575' },
+      { url: 'https://images.unsplash.com/photo-1542751371-adc38448a05e' }
+    ],
+    rating: 4.7,
+    reviews: 1203,
+    file_size: '3.2 GB',
+    version: '1.5.9',
+    developer: 'Strategy Masters',
+    release_date: '2024-06-10',
+    requirements: 'Android 9.0+ / iOS 13.0+',
+    languages: ['English', 'French', 'German', 'Russian']
+  },
+  {
+    id: 5, slug: 'clash-of-clans', title: 'Clash of Clans',
+    description: 'The classic strategy game where you build your village, train troops, and battle other players. Join clans and participate in epic clan wars.',
+    category: 'Strategy', featured: true, downloads: 456000,
+    download_url: 'https://qqby-goc-hk.oss-cn-hongkong.aliyuncs.com/blct/blctTT_1.0.10.zip',
+    banner_url: 'https://images.unsplash.com/photo-1542751371-adc38448a05e'
+  },
+  {
+    id: 6, slug: 'jiang-hu', title: 'Jiang Hu',
+    description: 'Immersive martial arts RPG set in ancient China. Master kung fu techniques, explore vast landscapes, and forge your legend in the world of martial arts.',
+    category: 'RPG', featured: false, downloads: 67000,
+    download_url: 'https://goc-cdn.qqby.cn/jh/JiangHu_tk_v1.0.18.zip',
+    banner_url: null
+  },
+  {
+    id: 12, slug: 'minions', title: 'Minions',
+    description: 'Join the lovable Minions on their hilarious adventure! Experience fun-filled gameplay with your favorite yellow characters in this family game.',
+    category: 'Adventure', featured: false, downloads: 187000,
+    download_url: 'https://goc-cdn.qqby.cn/xiaobing/WarpipsGame_1.2.3.zip',
+    banner_url: 'https://images.unsplash.com/photo-1593305841991-05c297ba4575'
+  },
+  {
+    id: 13, slug: 'sheep-village', title: 'The Sheep Village',
+    description: 'Build and manage your own peaceful sheep village. Take care of your flock, expand your farm, and create the perfect pastoral paradise.',
+    category: 'Simulation', featured: false, downloads: 134000,
+    download_url: 'https://goc-cdn.qqby.cn/xiaobing/WarpipsGame_1.2.3.zip',
+    banner_url: 'https://images.unsplash.com/photo-1543622748-5ee7237e8565'
+  }
+]
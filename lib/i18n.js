@@ -0,0 +1,34 @@
+// Locale selection shared by the middleware, the root layout and the
+// client-side switcher. Kept free of dictionaries so the middleware bundle
+// stays small.
+
+export const LOCALES = ['id', 'en']
+export const DEFAULT_LOCALE = 'id'
+export const LOCALE_COOKIE = 'gameVaultLanguage'
+
+export function isLocale(value) {
+  return LOCALES.includes(value)
+}
+
+// Best supported language from an Accept-Language header, honouring q
+// weights ("en-US,en;q=0.9,id;q=0.8")
+export function negotiateLocale(acceptLanguage = '') {
+  const ranked = acceptLanguage
+    .split(',')
+    .map((part) => {
+      const [tag, ...params] = part.trim().split(';')
+      const q = params.find(param => param.trim().startsWith('q='))
+      return { language: tag.split('-')[0].toLowerCase(), q: q ? parseFloat(q.trim().slice(2)) : 1 }
+    })
+    .filter(entry => entry.q > 0 && isLocale(entry.language))
+    .sort((a, b) => b.q - a.q)
+  return ranked.length > 0 ? ranked[0].language : null
+}
+
+// The saved choice wins; otherwise the browser's preference
+export function resolveLocale(cookieValue, acceptLanguage) {
+  if (isLocale(cookieValue)) {
+    return cookieValue
+  }
+  return negotiateLocale(acceptLanguage || '') || DEFAULT_LOCALE
+}
@@ -0,0 +1,13 @@
+// next/image loader (next.config.js images.loaderFile). Pipeline URLs pick
+// the 2x variant when the browser asks for a wider image than 1x; any
+// other source is already sized and is used as-is.
+import { IMAGE_VARIANTS } from './imageVariants'
+
+export default function imageLoader({ src, width }) {
+  const match = src.match(/^\/api\/images\/(\w+)\?/)
+  const variant = match && IMAGE_VARIANTS[match[1]]
+  if (!variant) {
+    return src
+  }
+  return width >= variant.width * 1.5 ? `${src}&dpr=2` : src
+}
@@ -0,0 +1,164 @@
+// Resizes and re-encodes catalog images (AVIF/WebP/JPEG) on first request
+// and keeps the results on local disk, bounded by total size with
+// least-recently-used eviction. Variant URLs name their source, size and
+// density, so responses are served as immutable.
+import { createHash } from 'crypto'
+import { promises as fs } from 'fs'
+import path from 'path'
+import { IMAGE_VARIANTS } from './imageVariants'
+import { envInt } from './utils'
+
+const STRAPI_URL = process.env.STRAPI_URL || 'http://localhost:1337'
+
+const config = {
+  cacheDir: process.env.IMAGE_CACHE_DIR || path.join(process.cwd(), '.next', 'cache', 'images'),
+  maxBytes: envInt('IMAGE_CACHE_MAX_BYTES', 512 * 1024 * 1024),
+  fetchTimeoutMs: envInt('IMAGE_FETCH_TIMEOUT_MS', 10000),
+  maxSourceBytes: envInt('IMAGE_MAX_SOURCE_BYTES', 20 * 1024 * 1024),
+}
+
+// Only our own uploads and the placeholder CDN are fetched, so the
+// endpoint cannot be used as an open proxy
+const ALLOWED_HOSTS = new Set(['images.unsplash.com', new URL(STRAPI_URL).host])
+
+const FORMATS = {
+  avif: { contentType: 'image/avif', options: { quality: 50 } },
+  webp: { contentType: 'image/webp', options: { quality: 75 } },
+  jpeg: { contentType: 'image/jpeg', options: { quality: 80, mozjpeg: true } },
+}
+
+// Best format the client accepts
+export function negotiateFormat(accept = '') {
+  if (accept.includes('image/avif')) {
+    return 'avif'
+  }
+  if (accept.includes('image/webp')) {
+    return 'webp'
+  }
+  return 'jpeg'
+}
+
+// Resolve ?src= to a fetchable URL, or null when it is not allowed
+export function resolveSource(src) {
+  if (!src) {
+    return null
+  }
+  try {
+    const url = src.startsWith('/uploads/') ? new URL(src, STRAPI_URL) : new URL(src)
+    return ALLOWED_HOSTS.has(url.host) && (url.protocol === 'https:' || url.protocol === 'http:') ? url : null
+  } catch (error) {
+    return null
+  }
+}
+
+const globalForImages = globalThis
+
+// Disk index: file name -> { size, lastUsed }. Rebuilt from the cache
+// directory on first use so the size bound survives restarts.
+async function getIndex() {
+  if (!globalForImages.__imageIndex) {
+    globalForImages.__imageIndex = (async () => {
+      await fs.mkdir(config.cacheDir, { recursive: true })
+      const index = { files: new Map(), totalBytes: 0, inflight: new Map() }
+      for (const name of await fs.readdir(config.cacheDir)) {
+        const stat = await fs.stat(path.join(config.cacheDir, name)).catch(() => null)
+        if (stat && stat.isFile()) {
+          index.files.set(name, { size: stat.size, lastUsed: stat.mtimeMs })
+          index.totalBytes += stat.size
+        }
+      }
+      return index
+    })()
+  }
+  return globalForImages.__imageIndex
+}
+
+async function evict(index) {
+  if (index.totalBytes <= config.maxBytes) {
+    return
+  }
+  const oldestFirst = [...index.files.entries()].sort((a, b) => a[1].lastUsed - b[1].lastUsed)
+  for (const [name, entry] of oldestFirst) {
+    if (index.totalBytes <= config.maxBytes) {
+      break
+    }
+    index.files.delete(name)
+    index.totalBytes -= entry.size
+    await fs.unlink(path.join(config.cacheDir, name)).catch(() => {})
+  }
+}
+
+async function fetchSource(url) {
+  const response = await fetch(url, { signal: AbortSignal.timeout(config.fetchTimeoutMs) })
+  if (!response.ok) {
+    throw new Error(`Source image responded ${response.status}`)
+  }
+  const length = parseInt(response.headers.get('content-length'), 10)
+  if (length > config.maxSourceBytes) {
+    throw new Error('Source image too large')
+  }
+  const body = Buffer.from(await response.arrayBuffer())
+  if (body.length > config.maxSourceBytes) {
+    throw new Error('Source image too large')
+  }
+  return body
+}
+
+async function render(sourceUrl, { width, height }, format) {
+  const { default: sharp } = await import('sharp')
+  const source = await fetchSource(sourceUrl)
+  return sharp(source)
+    .rotate()
+    .resize(width, height, { fit: 'cover', position: 'attention' })
+    .toFormat(format, FORMATS[format].options)
+    .toBuffer()
+}
+
+// Returns { body, contentType } for a variant, rendering it at most once
+// per process even under concurrent requests
+export async function getImageVariant({ sourceUrl, variant, dpr, format }) {
+  const size = IMAGE_VARIANTS[variant]
+  const scaled = { width: size.width * dpr, height: size.height * dpr }
+  const name = createHash('sha1')
+    .update(`${sourceUrl.href}|${scaled.width}x${scaled.height}|${format}`)
+    .digest('hex') + `.${format}`
+  const file = path.join(config.cacheDir, name)
+  const { contentType } = FORMATS[format]
+  const index = await getIndex()
+
+  const cached = index.files.get(name)
+  if (cached) {
+    const body = await fs.readFile(file).catch(() => null)
+    if (body) {
+      cached.lastUsed = Date.now()
+      return { body, contentType }
+    }
+    index.files.delete(name)
+    index.totalBytes -= cached.size
+  }
+
+  if (!index.inflight.has(name)) {
+    index.inflight.set(name, (async () => {
+      try {
+        const body = await render(sourceUrl, scaled, format)
+        await fs.writeFile(file, body)
+        index.files.set(name, { size: body.length, lastUsed: Date.now() })
+        index.totalBytes += body.length
+        await evict(index)
+        return body
+      } finally {
+        index.inflight.delete(name)
+      }
+    })())
+  }
+  return { body: await index.inflight.get(name), contentType }
+}
+
+export async function getImageCacheStats() {
+  const index = globalForImages.__imageIndex ? await globalForImages.__imageIndex : null
+  return {
+    files: index ? index.files.size : 0,
+    bytes: index ? index.totalBytes : 0,
+    maxBytes: config.maxBytes,
+  }
+}
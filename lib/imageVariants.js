@@ -0,0 +1,13 @@
+// Image sizes the pipeline renders, shared by the server view models and
+// the client-side next/image loader. Each variant is also available at 2x.
+export const IMAGE_VARIANTS = {
+  card: { width: 400, height: 225 },
+  detail: { width: 800, height: 450 },
+  screenshot: { width: 600, height: 338 },
+}
+
+// URL of an optimized variant of a source image (absolute URL, or a
+// Strapi upload path such as /uploads/banner_abc123.jpg)
+export function imageUrl(src, variant) {
+  return `/api/images/${variant}?src=${encodeURIComponent(src)}`
+}
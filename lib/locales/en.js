@@ -0,0 +1,97 @@
+// English UI strings
+export default {
+  // Navigation
+  home: 'Home',
+  catalog: 'Catalog',
+  trending: 'Trending Games',
+  blog: 'Blog',
+  
+  // Home Page
+  discoverGames: 'Discover Amazing Games',
+  ultimateDestination: 'Your ultimate destination for the best mobile and PC games. Explore our curated collection and find your next adventure.',
+  browseCatalog: 'Browse Catalog',
+  featuredGames: 'Featured Games',
+  handpickedGames: 'Handpicked games just for you',
+  latestArticles: 'Latest Articles',
+  stayUpdated: 'Stay updated with gaming news and tips',
+  viewAllGames: 'View All Games',
+  viewAllArticles: 'View All Articles',
+  
+  // Game Cards
+  downloads: 'downloads',
+  viewGame: 'View Game',
+  readMore: 'Read More',
+  
+  // Catalog Page
+  gameCatalog: 'Game Catalog',
+  exploreCollection: 'Explore our complete collection of games. Use the search and filters to find your perfect game.',
+  searchPlaceholder: 'Search games by name...',
+  filterByCategory: 'Filter by category',
+  allCategories: 'All Categories',
+  foundGames: 'Found',
+  games: 'games',
+  forQuery: 'for',
+  inCategory: 'in',
+  noGamesFound: 'No games found',
+  tryAdjusting: 'Try adjusting your search or filter criteria',
+  loading: 'Loading...',
+  loadMore: 'Load More Games',
+  
+  // Trending Page
+  trendingGames: 'Trending Games',
+  hottestGames: 'Discover the hottest games everyone\'s playing! These games are trending on TikTok Live and have the highest downloads.',
+  trending: 'Trending',
+  viewDetails: 'View Details',
+  download: 'Download',
+  
+  // Blog Page
+  gamingBlog: 'Gaming Blog',
+  latestGamingNews: 'Stay updated with the latest gaming news, reviews, guides, and industry insights from our expert team.',
+  readArticle: 'Read Article',
+  minRead: 'min read',
+  
+  // Game Detail Page
+  aboutGame: 'About This Game',
+  downloadGame: 'Download Game',
+  downloadNow: 'Download Now',
+  gameInformation: 'Game Information',
+  developer: 'Developer',
+  version: 'Version',
+  releaseDate: 'Release Date',
+  requirements: 'Requirements',
+  languages: 'Languages',
+  needHelp: 'Need Help?',
+  contactSupport: 'Contact us for support or questions about this game.',
+  contactTelegram: 'Contact on Telegram',
+  contactWhatsApp: 'Contact on WhatsApp',
+  screenshots: 'Screenshots',
+  reviews: 'reviews',
+  fileSize: 'File Size',
+  backToCatalog: 'Back to Catalog',
+  gameNotFound: 'Game Not Found',
+  gameNotExist: 'The game you\'re looking for doesn\'t exist or has been removed.',
+  
+  // Article Detail Page
+  shareArticle: 'Share this article',
+  helpOthers: 'Help others discover great gaming content',
+  backToBlog: 'Back to Blog',
+  articleNotFound: 'Article Not Found',
+  articleNotExist: 'The article you\'re looking for doesn\'t exist or has been removed.',
+  share: 'Share',
+  
+  // Footer
+  allRightsReserved: 'All rights reserved.',
+  navigation: 'Navigation',
+  contact: 'Contact',
+  legal: 'Legal',
+  privacyPolicy: 'Privacy Policy',
+  termsOfService: 'Terms of Service',
+  
+  // Categories
+  Action: 'Action',
+  RPG: 'RPG',
+  Strategy: 'Strategy',
+  Adventure: 'Adventure',
+  Simulation: 'Simulation',
+  Puzzle: 'Puzzle',
+}
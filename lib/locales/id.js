@@ -0,0 +1,97 @@
+// Indonesian UI strings
+export default {
+  // Navigation
+  home: 'Beranda',
+  catalog: 'Katalog',
+  trending: 'Game Trending',
+  blog: 'Blog',
+  
+  // Home Page
+  discoverGames: 'Temukan Game Menakjubkan',
+  ultimateDestination: 'Destinasi utama Anda untuk game mobile dan PC terbaik. Jelajahi koleksi kurasi kami dan temukan petualangan berikutnya.',
+  browseCatalog: 'Jelajahi Katalog',
+  featuredGames: 'Game Unggulan',
+  handpickedGames: 'Game pilihan khusus untuk Anda',
+  latestArticles: 'Artikel Terbaru',
+  stayUpdated: 'Tetap update dengan berita dan tips gaming',
+  viewAllGames: 'Lihat Semua Game',
+  viewAllArticles: 'Lihat Semua Artikel',
+  
+  // Game Cards
+  downloads: 'unduhan',
+  viewGame: 'Lihat Game',
+  readMore: 'Baca Selengkapnya',
+  
+  // Catalog Page
+  gameCatalog: 'Katalog Game',
+  exploreCollection: 'Jelajahi koleksi lengkap game kami. Gunakan pencarian dan filter untuk menemukan game yang sempurna.',
+  searchPlaceholder: 'Cari game berdasarkan nama...',
+  filterByCategory: 'Filter berdasarkan kategori',
+  allCategories: 'Semua Kategori',
+  foundGames: 'Ditemukan',
+  games: 'game',
+  forQuery: 'untuk',
+  inCategory: 'dalam kategori',
+  noGamesFound: 'Tidak ada game ditemukan',
+  tryAdjusting: 'Coba sesuaikan kriteria pencarian atau filter Anda',
+  loading: 'Memuat...',
+  loadMore: 'Muat Lebih Banyak Game',
+  
+  // Trending Page
+  trendingGames: 'Game Trending',
+  hottestGames: 'Temukan game terpanas yang sedang dimainkan semua orang! Game ini trending di TikTok Live dan memiliki unduhan tertinggi.',
+  trending: 'Trending',
+  viewDetails: 'Lihat Detail',
+  download: 'Unduh',
+  
+  // Blog Page
+  gamingBlog: 'Blog Gaming',
+  latestGamingNews: 'Tetap update dengan berita gaming terbaru, review, panduan, dan wawasan industri dari tim ahli kami.',
+  readArticle: 'Baca Artikel',
+  minRead: 'menit baca',
+  
+  // Game Detail Page
+  aboutGame: 'Tentang Game Ini',
+  downloadGame: 'Unduh Game',
+  downloadNow: 'Unduh Sekarang',
+  gameInformation: 'Informasi Game',
+  developer: 'Pengembang',
+  version: 'Versi',
+  releaseDate: 'Tanggal Rilis',
+  requirements: 'Persyaratan',
+  languages: 'Bahasa',
+  needHelp: 'Butuh Bantuan?',
+  contactSupport: 'Hubungi kami untuk dukungan atau pertanyaan tentang game ini.',
+  contactTelegram: 'Hubungi via Telegram',
+  contactWhatsApp: 'Hubungi via WhatsApp',
+  screenshots: 'Screenshot',
+  reviews: 'ulasan',
+  fileSize: 'Ukuran File',
+  backToCatalog: 'Kembali ke Katalog',
+  gameNotFound: 'Game Tidak Ditemukan',
+  gameNotExist: 'Game yang Anda cari tidak ada atau telah dihapus.',
+  
+  // Article Detail Page
+  shareArticle: 'Bagikan artikel ini',
+  helpOthers: 'Bantu orang lain menemukan konten gaming yang bagus',
+  backToBlog: 'Kembali ke Blog',
+  articleNotFound: 'Artikel Tidak Ditemukan',
+  articleNotExist: 'Artikel yang Anda cari tidak ada atau telah dihapus.',
+  share: 'Bagikan',
+  
+  // Footer
+  allRightsReserved: 'Hak cipta dilindungi.',
+  navigation: 'Navigasi',
+  contact: 'Kontak',
+  legal: 'Legal',
+  privacyPolicy: 'Kebijakan Privasi',
+  termsOfService: 'Syarat Layanan',
+  
+  // Categories
+  Action: 'Aksi',
+  RPG: 'RPG',
+  Strategy: 'Strategi',
+  Adventure: 'Petualangan',
+  Simulation: 'Simulasi',
+  Puzzle: 'Puzzle',
+}
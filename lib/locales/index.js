@@ -0,0 +1,11 @@
+// One chunk per locale: only the active dictionary is loaded, on the
+// server for the initial render and in the browser when switching
+const loaders = {
+  en: () => import('./en'),
+  id: () => import('./id'),
+}
+
+export async function loadDictionary(locale) {
+  const { default: dictionary } = await loaders[locale]()
+  return dictionary
+}
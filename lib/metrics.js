@@ -0,0 +1,195 @@
+// In-process request and query metrics, exposed in Prometheus text format
+// on /api/metrics. A request span follows the request through async calls
+// (AsyncLocalStorage), so database helpers can charge their time to the
+// API route that caused it without threading a context argument.
+import { AsyncLocalStorage } from 'async_hooks'
+
+const DURATION_BUCKETS = [0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10]
+const BYTES_BUCKETS = [256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304]
+const COUNT_BUCKETS = [0, 1, 2, 3, 5, 10, 20, 50]
+
+function escapeLabel(value) {
+  return String(value).replace(/\\/g, '\\\\').replace(/"/g, '\\"').replace(/\n/g, '\\n')
+}
+
+function labelKey(labels) {
+  return Object.keys(labels).sort().map(name => `${name}="${escapeLabel(labels[name])}"`).join(',')
+}
+
+class Histogram {
+  constructor(name, help, buckets) {
+    this.name = name
+    this.help = help
+    this.buckets = buckets
+    this.series = new Map()
+  }
+
+  observe(labels, value) {
+    const key = labelKey(labels)
+    let series = this.series.get(key)
+    if (!series) {
+      series = { counts: new Array(this.buckets.length).fill(0), sum: 0, count: 0 }
+      this.series.set(key, series)
+    }
+    for (let i = 0; i < this.buckets.length; i++) {
+      if (value <= this.buckets[i]) {
+        series.counts[i]++
+      }
+    }
+    series.sum += value
+    series.count++
+  }
+
+  render() {
+    const lines = [`# HELP ${this.name} ${this.help}`, `# TYPE ${this.name} histogram`]
+    for (const [key, series] of this.series) {
+      const sep = key ? ',' : ''
+      this.buckets.forEach((bound, i) => {
+        lines.push(`${this.name}_bucket{${key}${sep}le="${bound}"} ${series.counts[i]}`)
+      })
+      lines.push(`${this.name}_bucket{${key}${sep}le="+Inf"} ${series.count}`)
+      lines.push(`${this.name}_sum${key ? `{${key}}` : ''} ${series.sum}`)
+      lines.push(`${this.name}_count${key ? `{${key}}` : ''} ${series.count}`)
+    }
+    return lines.join('\n')
+  }
+}
+
+class Counter {
+  constructor(name, help) {
+    this.name = name
+    this.help = help
+    this.series = new Map()
+  }
+
+  inc(labels, amount = 1) {
+    const key = labelKey(labels)
+    this.series.set(key, (this.series.get(key) || 0) + amount)
+  }
+
+  render() {
+    const lines = [`# HELP ${this.name} ${this.help}`, `# TYPE ${this.name} counter`]
+    for (const [key, value] of this.series) {
+      lines.push(`${this.name}${key ? `{${key}}` : ''} ${value}`)
+    }
+    return lines.join('\n')
+  }
+}
+
+function createRegistry() {
+  return {
+    requestDuration: new Histogram('http_request_duration_seconds', 'API request time by route and status', DURATION_BUCKETS),
+    requestDbConnect: new Histogram('http_request_db_connect_seconds', 'Time per request spent waiting for a pooled connection', DURATION_BUCKETS),
+    requestDbQuery: new Histogram('http_request_db_query_seconds', 'Time per request spent in SQL statements', DURATION_BUCKETS),
+    requestDbQueries: new Histogram('http_request_db_queries', 'SQL statements per request', COUNT_BUCKETS),
+    requestSerialize: new Histogram('http_request_serialize_seconds', 'Time per request spent encoding JSON bodies', DURATION_BUCKETS),
+    responseBytes: new Histogram('http_response_bytes', 'Response body size', BYTES_BUCKETS),
+    dbConnect: new Histogram('db_connect_duration_seconds', 'Wait for a pooled database connection', DURATION_BUCKETS),
+    dbQuery: new Histogram('db_query_duration_seconds', 'SQL statement time by statement', DURATION_BUCKETS),
+    dbSlowQueries: new Counter('db_slow_queries_total', 'Statements slower than DB_SLOW_QUERY_MS'),
+    gauges: new Map(),
+  }
+}
+
+const globalForMetrics = globalThis
+
+function getRegistry() {
+  if (!globalForMetrics.__gameMetrics) {
+    globalForMetrics.__gameMetrics = createRegistry()
+  }
+  return globalForMetrics.__gameMetrics
+}
+
+// Point-in-time values read on every scrape; read() returns
+// [[labels, value], ...]
+export function registerGauge(name, help, read) {
+  getRegistry().gauges.set(name, { help, read })
+}
+
+const spans = globalForMetrics.__gameSpans || (globalForMetrics.__gameSpans = new AsyncLocalStorage())
+
+// Run fn(span) inside a new request span
+export function withSpan(fields, fn) {
+  const span = {
+    ...fields,
+    start: performance.now(),
+    dbConnectMs: 0,
+    dbQueryMs: 0,
+    queries: 0,
+    serializeMs: 0,
+  }
+  return spans.run(span, () => fn(span))
+}
+
+export function recordDbConnect(ms) {
+  getRegistry().dbConnect.observe({}, ms / 1000)
+  const span = spans.getStore()
+  if (span) {
+    span.dbConnectMs += ms
+  }
+}
+
+export function recordDbQuery(statement, ms, slow) {
+  const registry = getRegistry()
+  registry.dbQuery.observe({ statement }, ms / 1000)
+  if (slow) {
+    registry.dbSlowQueries.inc({ statement })
+  }
+  const span = spans.getStore()
+  if (span) {
+    span.dbQueryMs += ms
+    span.queries++
+  }
+}
+
+export function recordSerialize(ms) {
+  const span = spans.getStore()
+  if (span) {
+    span.serializeMs += ms
+  }
+}
+
+// Close a span: feed the histograms and return its total time in ms.
+// bytes is the response body size when known (Content-Length).
+export function finishSpan(span, status, bytes = null) {
+  const registry = getRegistry()
+  const totalMs = performance.now() - span.start
+  const labels = { method: span.method, route: span.route }
+  registry.requestDuration.observe({ ...labels, status }, totalMs / 1000)
+  registry.requestDbConnect.observe(labels, span.dbConnectMs / 1000)
+  registry.requestDbQuery.observe(labels, span.dbQueryMs / 1000)
+  registry.requestDbQueries.observe(labels, span.queries)
+  registry.requestSerialize.observe(labels, span.serializeMs / 1000)
+  if (bytes !== null) {
+    registry.responseBytes.observe(labels, bytes)
+  }
+  return totalMs
+}
+
+// Server-Timing header value for a finished span
+export function serverTiming(span, totalMs) {
+  return [
+    `db-connect;dur=${span.dbConnectMs.toFixed(1)}`,
+    `db;dur=${span.dbQueryMs.toFixed(1)};desc="${span.queries} queries"`,
+    `serialize;dur=${span.serializeMs.toFixed(1)}`,
+    `total;dur=${totalMs.toFixed(1)}`,
+  ].join(', ')
+}
+
+export function renderMetrics() {
+  const registry = getRegistry()
+  const sections = [
+    registry.requestDuration, registry.requestDbConnect, registry.requestDbQuery,
+    registry.requestDbQueries, registry.requestSerialize, registry.responseBytes,
+    registry.dbConnect, registry.dbQuery, registry.dbSlowQueries,
+  ].map(metric => metric.render())
+  for (const [name, { help, read }] of registry.gauges) {
+    const lines = [`# HELP ${name} ${help}`, `# TYPE ${name} gauge`]
+    for (const [labels, value] of read()) {
+      const key = labelKey(labels)
+      lines.push(`${name}${key ? `{${key}}` : ''} ${value}`)
+    }
+    sections.push(lines.join('\n'))
+  }
+  return sections.join('\n') + '\n'
+}
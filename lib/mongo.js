@@ -0,0 +1,155 @@
+// MongoDB connection for the legacy status routes. Nothing connects until
+// a handler asks for the database. Connect attempts are time-limited, and
+// a circuit breaker fails fast after repeated failures, so a slow or down
+// MONGO_URL only affects the routes that actually use it.
+import { MongoClient } from 'mongodb'
+import { onShutdown } from './db'
+import { envInt } from './utils'
+
+const config = {
+  connectTimeoutMs: envInt('MONGO_CONNECT_TIMEOUT_MS', 3000),
+  maxPoolSize: envInt('MONGO_MAX_POOL_SIZE', 10),
+  waitQueueTimeoutMs: envInt('MONGO_WAIT_QUEUE_TIMEOUT_MS', 5000),
+  // Consecutive failures before the breaker opens, and how long it stays open
+  breakerThreshold: envInt('MONGO_BREAKER_THRESHOLD', 3),
+  breakerCooldownMs: envInt('MONGO_BREAKER_COOLDOWN_MS', 30000),
+}
+
+export class MongoUnavailableError extends Error {
+  constructor(message, retryAfterMs) {
+    super(message)
+    this.name = 'MongoUnavailableError'
+    this.retryAfterMs = retryAfterMs
+  }
+}
+
+const globalForMongo = globalThis
+
+function getState() {
+  if (!globalForMongo.__gameMongo) {
+    globalForMongo.__gameMongo = {
+      client: null,
+      db: null,
+      connecting: null,
+      failures: 0,
+      openUntil: 0,
+      lastError: null,
+    }
+    onShutdown('mongo', closeMongo)
+  }
+  return globalForMongo.__gameMongo
+}
+
+async function connect(state) {
+  if (!process.env.MONGO_URL) {
+    throw new Error('MONGO_URL is not set')
+  }
+  const client = new MongoClient(process.env.MONGO_URL, {
+    connectTimeoutMS: config.connectTimeoutMs,
+    serverSelectionTimeoutMS: config.connectTimeoutMs,
+    maxPoolSize: config.maxPoolSize,
+    minPoolSize: 0,
+    waitQueueTimeoutMS: config.waitQueueTimeoutMs,
+  })
+  try {
+    await client.connect()
+  } catch (error) {
+    await client.close().catch(() => {})
+    throw error
+  }
+  state.client = client
+  state.db = client.db(process.env.DB_NAME)
+  return state.db
+}
+
+function recordFailure(state, error) {
+  state.failures++
+  state.lastError = error.message
+  if (state.failures >= config.breakerThreshold) {
+    state.openUntil = Date.now() + config.breakerCooldownMs
+  }
+}
+
+export async function getMongoDb() {
+  const state = getState()
+  const now = Date.now()
+  if (state.openUntil > now) {
+    throw new MongoUnavailableError('MongoDB is unavailable', state.openUntil - now)
+  }
+  if (state.db) {
+    return state.db
+  }
+  // Concurrent callers share one connect attempt (and, after the cooldown,
+  // a single half-open probe)
+  if (!state.connecting) {
+    state.connecting = connect(state)
+      .then((db) => {
+        state.failures = 0
+        state.openUntil = 0
+        state.lastError = null
+        return db
+      })
+      .catch((error) => {
+        recordFailure(state, error)
+        throw new MongoUnavailableError(`MongoDB connect failed: ${error.message}`, config.breakerCooldownMs)
+      })
+      .finally(() => {
+        state.connecting = null
+      })
+  }
+  return state.connecting
+}
+
+// Run an operation against the database. Failures after connecting (e.g.
+// the server went away) count towards the breaker as well.
+export async function withMongo(operation) {
+  const db = await getMongoDb()
+  const state = getState()
+  try {
+    const result = await operation(db)
+    state.failures = 0
+    state.lastError = null
+    return result
+  } catch (error) {
+    if (error.name === 'MongoServerSelectionError' || error.name === 'MongoNetworkError') {
+      recordFailure(state, error)
+      throw new MongoUnavailableError(`MongoDB operation failed: ${error.message}`, config.breakerCooldownMs)
+    }
+    throw error
+  }
+}
+
+export async function closeMongo() {
+  const state = globalForMongo.__gameMongo
+  if (!state || !state.client) {
+    return
+  }
+  const { client } = state
+  state.client = null
+  state.db = null
+  await client.close()
+}
+
+export function getMongoHealth() {
+  const state = globalForMongo.__gameMongo
+  if (!state) {
+    return { state: 'idle', failures: 0, lastError: null }
+  }
+  let status = 'idle'
+  if (state.openUntil > Date.now()) {
+    status = 'open'
+  } else if (state.db) {
+    status = 'connected'
+  } else if (state.connecting) {
+    status = 'connecting'
+  } else if (state.failures > 0) {
+    status = 'degraded'
+  }
+  return {
+    state: status,
+    failures: state.failures,
+    lastError: state.lastError,
+    retryAt: state.openUntil > Date.now() ? new Date(state.openUntil).toISOString() : null,
+    maxPoolSize: config.maxPoolSize,
+  }
+}
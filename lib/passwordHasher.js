@@ -0,0 +1,114 @@
+// bcrypt on a small worker-thread pool so password hashing never blocks
+// the event loop that serves catalog traffic. The queue is bounded: when
+// every worker is busy and the queue is full, callers get an error
+// instead of piling up work.
+import { Worker } from 'worker_threads'
+import { envInt } from './utils'
+
+const config = {
+  size: envInt('AUTH_HASH_WORKERS', 2),
+  maxQueue: envInt('AUTH_HASH_QUEUE_MAX', 100),
+}
+
+// Evaluated as CommonJS inside each worker; bundlers never see it, so
+// bcryptjs is loaded from node_modules at runtime
+const WORKER_SOURCE = `
+const { parentPort } = require('worker_threads')
+const bcrypt = require('bcryptjs')
+parentPort.on('message', async ({ id, op, args }) => {
+  try {
+    const result = op === 'hash' ? await bcrypt.hash(...args) : await bcrypt.compare(...args)
+    parentPort.postMessage({ id, result })
+  } catch (error) {
+    parentPort.postMessage({ id, error: error.message })
+  }
+})
+`
+
+export class HasherBusyError extends Error {
+  constructor() {
+    super('Password hasher queue is full')
+    this.name = 'HasherBusyError'
+  }
+}
+
+const globalForHasher = globalThis
+
+function createPool() {
+  const pool = { workers: [], queue: [], nextId: 1 }
+  for (let i = 0; i < config.size; i++) {
+    pool.workers.push(spawnWorker(pool))
+  }
+  return pool
+}
+
+function spawnWorker(pool) {
+  const worker = new Worker(WORKER_SOURCE, { eval: true })
+  const slot = { worker, task: null }
+  worker.unref()
+  worker.on('message', ({ id, result, error }) => {
+    const task = slot.task
+    slot.task = null
+    if (task && task.id === id) {
+      error ? task.reject(new Error(error)) : task.resolve(result)
+    }
+    dispatch(pool)
+  })
+  // A crashed worker fails its task and is replaced
+  worker.on('error', (error) => {
+    console.error('Password hasher worker error:', error)
+    slot.task?.reject(error)
+    slot.task = null
+    pool.workers[pool.workers.indexOf(slot)] = spawnWorker(pool)
+    dispatch(pool)
+  })
+  return slot
+}
+
+function dispatch(pool) {
+  for (const slot of pool.workers) {
+    if (pool.queue.length === 0) {
+      return
+    }
+    if (!slot.task) {
+      slot.task = pool.queue.shift()
+      slot.worker.postMessage({ id: slot.task.id, op: slot.task.op, args: slot.task.args })
+    }
+  }
+}
+
+function getPool() {
+  if (!globalForHasher.__passwordHasher) {
+    globalForHasher.__passwordHasher = createPool()
+  }
+  return globalForHasher.__passwordHasher
+}
+
+function run(op, args) {
+  const pool = getPool()
+  if (pool.queue.length >= config.maxQueue) {
+    return Promise.reject(new HasherBusyError())
+  }
+  return new Promise((resolve, reject) => {
+    pool.queue.push({ id: pool.nextId++, op, args, resolve, reject })
+    dispatch(pool)
+  })
+}
+
+export function hashPassword(password, rounds = 10) {
+  return run('hash', [password, rounds])
+}
+
+export function comparePassword(password, hash) {
+  return run('compare', [password, hash])
+}
+
+export function getHasherStats() {
+  const pool = globalForHasher.__passwordHasher
+  return {
+    workers: config.size,
+    busy: pool ? pool.workers.filter(slot => slot.task).length : 0,
+    queued: pool ? pool.queue.length : 0,
+    maxQueue: config.maxQueue,
+  }
+}
@@ -0,0 +1,38 @@
+// Fixed-window attempt counters held in process memory. Good enough to
+// stop a burst from one client or against one account; limits are per
+// server process.
+
+export function createRateLimiter({ limit, windowMs, maxKeys = 10000 }) {
+  const windows = new Map()
+
+  function prune(now) {
+    for (const [key, entry] of windows) {
+      if (entry.resetAt <= now) {
+        windows.delete(key)
+      }
+    }
+  }
+
+  // Count an attempt; returns { allowed, retryAfterMs }
+  function hit(key, now = Date.now()) {
+    let entry = windows.get(key)
+    if (!entry || entry.resetAt <= now) {
+      if (windows.size >= maxKeys) {
+        prune(now)
+      }
+      entry = { count: 0, resetAt: now + windowMs }
+      windows.set(key, entry)
+    }
+    entry.count++
+    return {
+      allowed: entry.count <= limit,
+      retryAfterMs: entry.count <= limit ? 0 : entry.resetAt - now,
+    }
+  }
+
+  function reset(key) {
+    windows.delete(key)
+  }
+
+  return { hit, reset, size: () => windows.size }
+}
@@ -0,0 +1,120 @@
+// Compiled route table for the catch-all API handler. Routes are stored in
+// a trie keyed on path segments, so dispatch walks the request path once
+// no matter how many routes are registered.
+//
+// Patterns are static segments and params: `/games/:slug`,
+// `/admin/games/:id(int)`. A typed param only matches values that parse
+// as that type; static segments win over params at the same depth.
+
+const PARAM_TYPES = {
+  string: (value) => value,
+  int: (value) => (/^\d+$/.test(value) ? parseInt(value, 10) : undefined),
+}
+
+function createNode() {
+  return { children: new Map(), params: [], routes: new Map() }
+}
+
+function splitPath(path) {
+  return path.split('/').filter(Boolean)
+}
+
+function parseParamSegment(segment) {
+  const match = segment.match(/^:(\w+)(?:\((\w+)\))?$/)
+  if (!match) {
+    return null
+  }
+  const [, name, type = 'string'] = match
+  if (!PARAM_TYPES[type]) {
+    throw new Error(`Unknown route param type "${type}" in ${segment}`)
+  }
+  return { name, type }
+}
+
+// Compose (ctx, next) middleware around a handler, outermost first
+function compose(middleware, handler) {
+  return middleware.reduceRight((next, fn) => (ctx) => fn(ctx, () => next(ctx)), handler)
+}
+
+export function createRouter({ middleware = [] } = {}) {
+  const root = createNode()
+
+  function add(method, pattern, handler, { use = [] } = {}) {
+    let node = root
+    for (const segment of splitPath(pattern)) {
+      const param = parseParamSegment(segment)
+      if (!param) {
+        if (!node.children.has(segment)) {
+          node.children.set(segment, createNode())
+        }
+        node = node.children.get(segment)
+        continue
+      }
+      let edge = node.params.find(p => p.name === param.name && p.type === param.type)
+      if (!edge) {
+        edge = { ...param, node: createNode() }
+        node.params.push(edge)
+      }
+      node = edge.node
+    }
+    if (node.routes.has(method)) {
+      throw new Error(`Duplicate route ${method} ${pattern}`)
+    }
+    node.routes.set(method, { pattern, handler: compose([...middleware, ...use], handler) })
+    return router
+  }
+
+  // Depth-first so a failed typed param can fall back to a sibling edge
+  function find(node, segments, index, params) {
+    if (index === segments.length) {
+      return node.routes.size > 0 ? { node, params } : null
+    }
+    const segment = segments[index]
+    const child = node.children.get(segment)
+    if (child) {
+      const found = find(child, segments, index + 1, params)
+      if (found) {
+        return found
+      }
+    }
+    for (const edge of node.params) {
+      const value = PARAM_TYPES[edge.type](segment)
+      if (value === undefined) {
+        continue
+      }
+      const found = find(edge.node, segments, index + 1, { ...params, [edge.name]: value })
+      if (found) {
+        return found
+      }
+    }
+    return null
+  }
+
+  // path is a decoded path or, to keep encoded slashes inside a segment,
+  // the list of decoded segments (as Next.js passes a catch-all); params
+  // are not decoded again. Returns { handler, params, pattern }, { allowed }
+  // when only the method is wrong, or null when nothing matches the path.
+  function match(method, path) {
+    const segments = Array.isArray(path) ? path : splitPath(path)
+    const found = find(root, segments, 0, {})
+    if (!found) {
+      return null
+    }
+    const route = found.node.routes.get(method)
+    if (!route) {
+      return { allowed: [...found.node.routes.keys()] }
+    }
+    return { handler: route.handler, params: found.params, pattern: route.pattern }
+  }
+
+  const router = {
+    add,
+    match,
+    get: (pattern, handler, options) => add('GET', pattern, handler, options),
+    post: (pattern, handler, options) => add('POST', pattern, handler, options),
+    put: (pattern, handler, options) => add('PUT', pattern, handler, options),
+    patch: (pattern, handler, options) => add('PATCH', pattern, handler, options),
+    delete: (pattern, handler, options) => add('DELETE', pattern, handler, options),
+  }
+  return router
+}
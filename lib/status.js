@@ -0,0 +1,243 @@
+// Queries over the legacy status_checks collection. Reads are ordered by
+// (timestamp, id) and paginated with the same opaque cursors as the games
+// listings; _id is projected away by MongoDB, not copied out per document.
+import { v4 as uuidv4 } from 'uuid'
+import { withMongo } from './mongo'
+import { encodeCursor, decodeCursor } from './db'
+import { envInt } from './utils'
+
+const COLLECTION = 'status_checks'
+const PROJECTION = { _id: 0 }
+const STREAM_BATCH_SIZE = 500
+const MAX_CLIENT_NAME_LENGTH = 200
+export const MAX_BULK_ITEMS = 1000
+
+const config = {
+  // Checks older than this are removed by a TTL index (0 keeps them forever)
+  ttlDays: envInt('STATUS_TTL_DAYS', 30),
+  // Single POST /api/status writes are coalesced for up to this long
+  batchWindowMs: envInt('STATUS_BATCH_WINDOW_MS', 20),
+  batchMaxSize: envInt('STATUS_BATCH_MAX_SIZE', 500),
+}
+
+const globalForStatus = globalThis
+
+// Index creation is idempotent; run it once per process on first use
+function ensureIndexes(collection) {
+  if (!globalForStatus.__statusIndexes) {
+    const indexes = [
+      { key: { timestamp: -1, id: -1 }, name: 'timestamp_id' },
+      { key: { client_name: 1, timestamp: -1, id: -1 }, name: 'client_name_timestamp_id' },
+    ]
+    // Changing STATUS_TTL_DAYS later needs a collMod on timestamp_ttl
+    if (config.ttlDays > 0) {
+      indexes.push({ key: { timestamp: 1 }, name: 'timestamp_ttl', expireAfterSeconds: config.ttlDays * 24 * 60 * 60 })
+    }
+    globalForStatus.__statusIndexes = collection.createIndexes(indexes).catch((error) => {
+      globalForStatus.__statusIndexes = null
+      throw error
+    })
+  }
+  return globalForStatus.__statusIndexes
+}
+
+export function withStatusChecks(operation) {
+  return withMongo(async (db) => {
+    const collection = db.collection(COLLECTION)
+    await ensureIndexes(collection)
+    return operation(collection)
+  })
+}
+
+function parseDate(value) {
+  if (!value) {
+    return null
+  }
+  const date = new Date(value)
+  return Number.isNaN(date.getTime()) ? undefined : date
+}
+
+// Parse ?since=&until=&client_name=&order=&cursor= into a query, or
+// { error } for input the client should fix
+export function parseStatusQuery(url) {
+  const since = parseDate(url.searchParams.get('since'))
+  const until = parseDate(url.searchParams.get('until'))
+  if (since === undefined || until === undefined) {
+    return { error: "since and until must be ISO 8601 timestamps" }
+  }
+  const order = url.searchParams.get('order') === 'asc' ? 'asc' : 'desc'
+  const cursor = url.searchParams.get('cursor')
+  const after = decodeCursor(cursor)
+  if (cursor && !after) {
+    return { error: "Invalid cursor" }
+  }
+  return {
+    since,
+    until,
+    clientName: url.searchParams.get('client_name') || null,
+    order,
+    after,
+  }
+}
+
+function buildFind({ since, until, clientName, order, after }) {
+  const filter = {}
+  if (clientName) {
+    filter.client_name = clientName
+  }
+  if (since || until) {
+    filter.timestamp = {}
+    if (since) {
+      filter.timestamp.$gte = since
+    }
+    if (until) {
+      filter.timestamp.$lt = until
+    }
+  }
+  const op = order === 'asc' ? '$gt' : '$lt'
+  if (after) {
+    const [timestamp, id] = after
+    const at = new Date(timestamp)
+    filter.$and = [{
+      $or: [
+        { timestamp: { [op]: at } },
+        { timestamp: at, id: { [op]: id } },
+      ],
+    }]
+  }
+  const direction = order === 'asc' ? 1 : -1
+  return { filter, sort: { timestamp: direction, id: direction } }
+}
+
+export function listStatusChecks(statusQuery, limit) {
+  return withStatusChecks(async (collection) => {
+    const { filter, sort } = buildFind(statusQuery)
+    const docs = await collection
+      .find(filter, { projection: PROJECTION })
+      .sort(sort)
+      .limit(limit + 1)
+      .toArray()
+    const rows = docs.slice(0, limit)
+    const last = rows[rows.length - 1]
+    const nextCursor = docs.length > limit ? encodeCursor([last.timestamp.toISOString(), last.id]) : null
+    return { rows, nextCursor }
+  })
+}
+
+// The whole range as NDJSON, pulled from the cursor batch by batch so
+// memory stays flat however many documents match
+export function streamStatusChecks(statusQuery) {
+  return withStatusChecks(async (collection) => {
+    const { filter, sort } = buildFind(statusQuery)
+    const cursor = collection
+      .find(filter, { projection: PROJECTION })
+      .sort(sort)
+      .batchSize(STREAM_BATCH_SIZE)
+    const encoder = new TextEncoder()
+
+    return new ReadableStream({
+      async pull(controller) {
+        try {
+          const doc = await cursor.next()
+          if (!doc) {
+            await cursor.close()
+            controller.close()
+            return
+          }
+          let chunk = JSON.stringify(doc) + '\n'
+          // Drain whatever the driver already has buffered in one chunk
+          for (const buffered of cursor.readBufferedDocuments()) {
+            chunk += JSON.stringify(buffered) + '\n'
+          }
+          controller.enqueue(encoder.encode(chunk))
+        } catch (error) {
+          console.error('Status stream error:', error)
+          await cursor.close().catch(() => {})
+          controller.error(error)
+        }
+      },
+      async cancel() {
+        await cursor.close()
+      },
+    })
+  })
+}
+
+// Build a status check from client input, or return { error }
+export function toStatusCheck(item) {
+  const clientName = item && typeof item.client_name === 'string' ? item.client_name.trim() : ''
+  if (!clientName) {
+    return { error: "client_name is required" }
+  }
+  if (clientName.length > MAX_CLIENT_NAME_LENGTH) {
+    return { error: `client_name must be at most ${MAX_CLIENT_NAME_LENGTH} characters` }
+  }
+  return { check: { id: uuidv4(), client_name: clientName, timestamp: new Date() } }
+}
+
+// Unordered insert: one bad document does not stop the rest. Returns the
+// indexes (into checks) that failed, with the driver's message.
+export function insertStatusChecks(checks) {
+  return withStatusChecks(async (collection) => {
+    try {
+      // Insert copies: the driver adds _id to the documents it is given
+      await collection.insertMany(checks.map(check => ({ ...check })), { ordered: false })
+      return new Map()
+    } catch (error) {
+      if (error.name !== 'MongoBulkWriteError' || !error.writeErrors) {
+        throw error
+      }
+      const writeErrors = Array.isArray(error.writeErrors) ? error.writeErrors : Object.values(error.writeErrors)
+      return new Map(writeErrors.map(writeError => [writeError.index, writeError.errmsg || 'Write failed']))
+    }
+  })
+}
+
+// Micro-batching for single inserts: concurrent POST /api/status requests
+// share one insertMany, and each resolves once its own document is written
+
+function flushStatusBatch() {
+  const batch = globalForStatus.__statusBatch
+  globalForStatus.__statusBatch = null
+  if (!batch) {
+    return
+  }
+  clearTimeout(batch.timer)
+  insertStatusChecks(batch.checks.map(entry => entry.check))
+    .then((failed) => {
+      batch.checks.forEach((entry, index) => {
+        if (failed.has(index)) {
+          entry.reject(new Error(failed.get(index)))
+        } else {
+          entry.resolve(entry.check)
+        }
+      })
+    })
+    .catch((error) => {
+      batch.checks.forEach(entry => entry.reject(error))
+    })
+}
+
+export function enqueueStatusCheck(check) {
+  if (config.batchWindowMs <= 0) {
+    return insertStatusChecks([check]).then((failed) => {
+      if (failed.has(0)) {
+        throw new Error(failed.get(0))
+      }
+      return check
+    })
+  }
+  return new Promise((resolve, reject) => {
+    if (!globalForStatus.__statusBatch) {
+      globalForStatus.__statusBatch = {
+        checks: [],
+        timer: setTimeout(flushStatusBatch, config.batchWindowMs),
+      }
+    }
+    const batch = globalForStatus.__statusBatch
+    batch.checks.push({ check, resolve, reject })
+    if (batch.checks.length >= config.batchMaxSize) {
+      flushStatusBatch()
+    }
+  })
+}
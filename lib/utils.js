@@ -4,3 +4,21 @@ import { twMerge } from "tailwind-merge"
 export function cn(...inputs) {
   return twMerge(clsx(inputs));
 }
+
+export function envInt(name, fallback) {
+  const value = parseInt(process.env[name], 10)
+  return Number.isNaN(value) ? fallback : value
+}
+
+// Downloads go through the API so they are counted; it answers the POST
+// with a 303 redirect to the file. A form submit (not fetch) lets the
+// browser follow that redirect in a new tab.
+export function startDownload(slug) {
+  const form = document.createElement('form')
+  form.method = 'POST'
+  form.action = `/api/games/${encodeURIComponent(slug)}/download`
+  form.target = '_blank'
+  document.body.appendChild(form)
+  form.submit()
+  form.remove()
+}
@@ -0,0 +1,27 @@
+import { NextResponse } from 'next/server'
+import { LOCALE_COOKIE, isLocale, resolveLocale } from '@/lib/i18n'
+
+// Pages live under app/[locale] and are statically regenerated per locale.
+// Public URLs carry no locale: each request is rewritten to the visitor's
+// saved language, or the best match for Accept-Language.
+export function middleware(request) {
+  const { pathname } = request.nextUrl
+  if (isLocale(pathname.split('/')[1])) {
+    return NextResponse.next()
+  }
+
+  const locale = resolveLocale(
+    request.cookies.get(LOCALE_COOKIE)?.value,
+    request.headers.get('accept-language')
+  )
+  const url = request.nextUrl.clone()
+  url.pathname = `/${locale}${pathname === '/' ? '' : pathname}`
+  const response = NextResponse.rewrite(url)
+  response.headers.set('Vary', 'Cookie, Accept-Language')
+  return response
+}
+
+export const config = {
+  // Everything except API routes, Next.js assets and public files
+  matcher: ['/((?!api|_next|.*\\..*).*)'],
+}
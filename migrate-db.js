@@ -0,0 +1,54 @@
+const { Client } = require('pg');
+const fs = require('fs');
+const path = require('path');
+
+// Applies game-catalog-cms/database/migrations without booting Strapi.
+// Every migration is idempotent, so re-running after Strapi has already
+// applied them is safe.
+const MIGRATIONS_DIR = path.join(__dirname, 'game-catalog-cms', 'database', 'migrations');
+
+async function migrate() {
+  const client = new Client({
+    host: process.env.DATABASE_HOST || 'localhost',
+    port: parseInt(process.env.DATABASE_PORT || '5432', 10),
+    database: process.env.DATABASE_NAME || 'game_catalog_db',
+    user: process.env.DATABASE_USERNAME || 'strapi_user',
+    password: process.env.DATABASE_PASSWORD || 'secure_password_123',
+  });
+
+  // Just enough of the knex API for our raw-SQL migrations
+  const knex = { raw: (sql, params) => client.query(sql, params) };
+
+  try {
+    await client.connect();
+    console.log('Connected to PostgreSQL database');
+
+    const files = fs.readdirSync(MIGRATIONS_DIR)
+      .filter(file => file.endsWith('.js'))
+      .sort();
+
+    for (const file of files) {
+      const migration = require(path.join(MIGRATIONS_DIR, file));
+      await client.query('BEGIN');
+      try {
+        await migration.up(knex);
+        await client.query('COMMIT');
+        console.log(`✓ Applied ${file}`);
+      } catch (error) {
+        await client.query('ROLLBACK');
+        console.log(`✗ Failed ${file}:`, error.message);
+        process.exitCode = 1;
+        return;
+      }
+    }
+
+    console.log('\n✅ Migrations complete');
+  } catch (error) {
+    console.error('Database error:', error);
+    process.exitCode = 1;
+  } finally {
+    await client.end();
+  }
+}
+
+migrate();
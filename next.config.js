@@ -1,11 +1,13 @@
 const nextConfig = {
   output: 'standalone',
   images: {
-    unoptimized: true,
+    // Variants are produced by /api/images (see lib/imagePipeline.js)
+    loader: 'custom',
+    loaderFile: './lib/imageLoader.js',
   },
   experimental: {
     // Remove if not using Server Components
-    serverComponentsExternalPackages: ['mongodb'],
+    serverComponentsExternalPackages: ['mongodb', 'pg', 'sharp'],
   },
   webpack(config, { dev }) {
     if (dev) {
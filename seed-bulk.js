@@ -0,0 +1,41 @@
+// Shared by the seed scripts: send games to the storefront's bulk import
+// endpoint (one transaction, upsert by slug) instead of one row per call.
+const NEXT_URL = process.env.NEXT_URL || 'http://localhost:3000'
+const ADMIN_EMAIL = process.env.ADMIN_EMAIL
+const ADMIN_PASSWORD = process.env.ADMIN_PASSWORD
+
+async function login() {
+  if (!ADMIN_EMAIL || !ADMIN_PASSWORD) {
+    throw new Error('Set ADMIN_EMAIL and ADMIN_PASSWORD to seed through the admin API')
+  }
+  const response = await fetch(`${NEXT_URL}/api/admin/login`, {
+    method: 'POST',
+    headers: { 'Content-Type': 'application/json' },
+    body: JSON.stringify({ email: ADMIN_EMAIL, password: ADMIN_PASSWORD })
+  })
+  if (!response.ok) {
+    throw new Error(`Admin login failed: ${response.status} ${await response.text()}`)
+  }
+  const { token } = await response.json()
+  return token
+}
+
+async function seedGamesBulk(games) {
+  const token = await login()
+  const response = await fetch(`${NEXT_URL}/api/admin/games/bulk`, {
+    method: 'POST',
+    headers: {
+      'Content-Type': 'application/json',
+      'Authorization': `Bearer ${token}`
+    },
+    body: JSON.stringify({ upsert: games })
+  })
+  const result = await response.json()
+  if (!response.ok) {
+    throw new Error(`Bulk import failed: ${response.status} ${JSON.stringify(result)}`)
+  }
+  console.log(`✓ Created ${result.created.length}, updated ${result.updated.length}, skipped ${result.skipped.length}`)
+  return result
+}
+
+module.exports = { seedGamesBulk }
@@ -1,3 +1,5 @@
+const { seedGamesBulk } = require('./seed-bulk')
+
 const gamesData = [
   {
     title: 'Wukong',
@@ -105,47 +107,10 @@ const gamesData = [
   }
 ]
 
+// One bulk request instead of a Strapi POST (plus delay) per game
 async function seedGames() {
-  const STRAPI_URL = 'http://localhost:1337'
-  
-  console.log('Starting to seed games data...')
-
-  for (let i = 0; i < gamesData.length; i++) {
-    const game = gamesData[i]
-    
-    try {
-      console.log(`Creating game ${i + 1}/${gamesData.length}: ${game.title}`)
-      
-      const response = await fetch(`${STRAPI_URL}/api/games`, {
-        method: 'POST',
-        headers: {
-          'Content-Type': 'application/json',
-        },
-        body: JSON.stringify({
-          data: {
-            ...game,
-            slug: game.title.toLowerCase().replace(/[^a-z0-9]+/g, '-').replace(/-+/g, '-').replace(/^-|-$/g, ''),
-            publishedAt: new Date().toISOString()
-          }
-        })
-      })
-      
-      if (response.ok) {
-        const result = await response.json()
-        console.log(`✓ Created: ${game.title}`)
-      } else {
-        const error = await response.text()
-        console.log(`✗ Failed to create ${game.title}: ${error}`)
-      }
-      
-      // Small delay to avoid overwhelming the API
-      await new Promise(resolve => setTimeout(resolve, 500))
-      
-    } catch (error) {
-      console.log(`✗ Error creating ${game.title}:`, error.message)
-    }
-  }
-  
+  console.log(`Seeding ${gamesData.length} games...`)
+  await seedGamesBulk(gamesData)
   console.log('Finished seeding games!')
 }
 
@@ -1,4 +1,4 @@
-const { Client } = require('pg');
+const { seedGamesBulk } = require('./seed-bulk');
 
 const gamesData = [
   {
@@ -172,63 +172,23 @@ const gamesData = [
   }
 ]
 
+// Upserts by slug through the admin bulk endpoint, so re-running the seed
+// updates the same games instead of wiping the table first
 async function seedDatabase() {
-  const client = new Client({
-    host: 'localhost',
-    port: 5432,
-    database: 'game_catalog_db',
-    user: 'strapi_user',
-    password: 'secure_password_123',
-  });
-
   try {
-    await client.connect();
-    console.log('Connected to PostgreSQL database');
-
-    // Check if games table exists and what its structure is
-    const tableInfo = await client.query(`
-      SELECT column_name, data_type, is_nullable
-      FROM information_schema.columns 
-      WHERE table_name = 'games' 
-      ORDER BY ordinal_position;
-    `);
-
-    console.log('Games table structure:');
-    console.log(tableInfo.rows);
-
-    // Clear existing games
-    await client.query('DELETE FROM games');
-    console.log('Cleared existing games');
-
-    // Insert games
-    for (let i = 0; i < gamesData.length; i++) {
-      const game = gamesData[i];
-      try {
-        const result = await client.query(`
-          INSERT INTO games (
-            title, description, category, download_url, slug, 
-            featured, downloads, published_at, created_at, updated_at, locale
-          ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11)
-          RETURNING *;
-        `, [
-          game.title, game.description, game.category, game.download_url, 
-          game.slug, game.featured, game.downloads, game.published_at,
-          game.created_at, game.updated_at, game.locale
-        ]);
-        console.log(`✓ Inserted game: ${game.title}`);
-      } catch (error) {
-        console.log(`✗ Failed to insert ${game.title}:`, error.message);
-      }
-    }
-
-    // Check final count
-    const count = await client.query('SELECT COUNT(*) FROM games');
-    console.log(`\n✅ Total games in database: ${count.rows[0].count}`);
-
+    await seedGamesBulk(gamesData.map(game => ({
+      title: game.title,
+      description: game.description,
+      category: game.category,
+      downloadUrl: game.download_url,
+      slug: game.slug,
+      featured: game.featured,
+      downloads: game.downloads
+    })));
+    console.log('\n✅ Games seeded');
   } catch (error) {
-    console.error('Database error:', error);
-  } finally {
-    await client.end();
+    console.error('Seeding error:', error);
+    process.exitCode = 1;
   }
 }
 